@@ -3,55 +3,268 @@
 import binascii
 import datetime
 import hashlib
+import ipaddress
+import json
 import logging
 import os
-import pathlib
 import re
 import sys
+import threading
 import urllib.parse
-import urllib.request
 import uuid
 
-import praw
-import prawcore
-import requests
+import click
 import sqlalchemy
 from flask import (Flask, render_template, make_response, request, redirect, url_for, session, abort, g, Response,
-                   jsonify)
+                   jsonify, stream_with_context)
+import flask_babel
 from flask_babel import Babel
 from flask_caching import Cache
+from markupsafe import Markup
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+import assets
+import crosstab
+import export
+import instrumentation
+import journal
+import migrations
 import model
+import sessions
+import surveys
+import timeline
+import util
 
 __version__ = '0.5'
 
-from mock import mock_app, MockRedditAgent
-from yaml_wrapper import yaml
+from http_client import HttpClient, UpstreamUnavailable
+from instrumentation import phase
+from metrics import registry
+from mock import mock_app, oauth_stand_in, recaptcha_stand_in
+from reddit_oauth import LoginFailed, RedditOAuth
+from questionnaire import SCALE_WORDS, CompiledCache, QuestionnaireStore, QuestionnaireUnavailable
+from vote_matrix import VoteMatrix
 
 USER_AGENT = 'python:gr.terrasoft.reddit:questionnaire:v{0} (by /u/gschizas)'.format(__version__)
 EMOJI_FLAG_OFFSET = ord('🇦') - ord('A')
 
 app = Flask(__name__)
 babel = Babel(app)
-cache = Cache(app, config={'CACHE_TYPE': 'simple'})
+# Use CACHE_TYPE=RedisCache (with CACHE_REDIS_URL) to share the cache between workers and hosts,
+# or CACHE_TYPE=FileSystemCache (with CACHE_DIR) to share it between the workers of one host.
+cache = Cache(app, config={
+    'CACHE_TYPE': os.getenv('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_REDIS_URL': os.getenv('CACHE_REDIS_URL', os.getenv('REDIS_URL')),
+    'CACHE_DIR': os.getenv('CACHE_DIR')})
 
 app.secret_key = os.getenv('FLASK_SECRET_KEY')
+# SESSION_STORE=cache keeps the sessions in the cache above, any other value is the path of a local SQLite file
+if os.getenv('SESSION_STORE') == 'cache':
+    app.session_interface = sessions.ServerSideSessionInterface(sessions.CacheSessionStore(cache))
+elif os.getenv('SESSION_STORE'):
+    app.session_interface = sessions.ServerSideSessionInterface(
+        sessions.SqliteSessionStore(os.getenv('SESSION_STORE')))
+server_side_sessions = isinstance(app.session_interface, sessions.ServerSideSessionInterface)
+
+# settings read once, instead of on every request
+testers = frozenset(name for name in re.split(r'\W', os.getenv('TESTERS', '')) if name)
+recaptcha_secret = os.getenv('RECAPTCHA_SECRET')
+recaptcha_site_key = os.getenv('RECAPTCHA_SITE_KEY')
+metrics_token = os.getenv('METRICS_TOKEN')
+oauth_redirect_base = os.getenv('REDDIT_OAUTH_REDIRECT_URL')
+assets.init_app(app)
 app.wsgi_app = ProxyFix(app.wsgi_app, x_prefix=True, x_host=1)
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if not (os.getenv('DATABASE_URL') or 'sqlite').startswith('sqlite'):
+    # with async workers, hundreds of requests can be in flight in one worker: they queue for these connections
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = dict(
+        pool_size=int(os.getenv('DATABASE_POOL_SIZE', '5')),
+        max_overflow=int(os.getenv('DATABASE_MAX_OVERFLOW', '10')),
+        pool_timeout=float(os.getenv('DATABASE_POOL_TIMEOUT', '30')))
 
 logging.basicConfig(level=logging.DEBUG)
 first_run = False
+rendered_forms = {}
+results_computations = util.SingleFlight()
+RESULTS_CACHE_TIMEOUT = 300
+
+http = HttpClient(USER_AGENT)
+http.register(
+    'recaptcha', os.getenv('RECAPTCHA_VERIFY_URL', 'https://www.google.com/recaptcha/api/siteverify'),
+    timeout=(3.05, float(os.getenv('RECAPTCHA_TIMEOUT', '5'))), idempotent=False,
+    pool_size=int(os.getenv('HTTP_POOL_SIZE', '10')))
+if os.environ.get('MOCK') == '1' and os.environ.get('MOCK_RECAPTCHA') == '1':
+    http.stand_in('recaptcha', recaptcha_stand_in)
+
+reddit_oauth = None
+if os.environ.get('MOCK') != '1' or os.getenv('REDDIT_URL') or os.getenv('MOCK_OAUTH') == '1':
+    # REDDIT_URL and REDDIT_OAUTH_URL point to the OAuth stand-in of mock.py in load tests
+    reddit_oauth = RedditOAuth(
+        http, os.getenv('REDDIT_OAUTH_CLIENT_ID'), os.getenv('REDDIT_OAUTH_CLIENT_SECRET'),
+        reddit_url=os.getenv('REDDIT_URL', 'https://www.reddit.com'),
+        oauth_url=os.getenv('REDDIT_OAUTH_URL', 'https://oauth.reddit.com'),
+        authorize_url='/mock/reddit/api/v1/authorize' if os.getenv('MOCK_OAUTH') == '1' else None,
+        timeout=(3.05, float(os.getenv('REDDIT_TIMEOUT', '10'))),
+        pool_size=int(os.getenv('HTTP_POOL_SIZE', '10')))
+    if os.environ.get('MOCK') == '1' and os.getenv('MOCK_OAUTH') == '1':
+        http.stand_in('reddit-token', oauth_stand_in)
+        http.stand_in('reddit-api', oauth_stand_in)
 
 model.db.init_app(app)
 with app.app_context():
-    model.db.create_all()
+    instrumentation.init_app(app, model.db.engine)
+
+hosted_surveys = surveys.Surveys(reload_after=float(os.getenv('SURVEYS_RELOAD_INTERVAL', '60')))
+# the resources of every survey, by slug, created on first use
+questionnaire_stores = {}
+vote_matrices = {}
+submission_rollups = {}
+survey_resources_lock = threading.Lock()
+
+
+def new_questionnaire_store(survey):
+    # every survey has its own upstream endpoint (and circuit breaker), and its own directory of compiled versions
+    endpoint = 'questionnaire' if survey.survey_id == model.DEFAULT_SURVEY_ID else f'questionnaire/{survey.slug}'
+    if survey.questionnaire_url.startswith(('http://', 'https://')) and endpoint not in http.endpoints:
+        http.register(endpoint, survey.questionnaire_url,
+                      timeout=(3.05, float(os.getenv('QUESTIONNAIRE_FETCH_TIMEOUT', '10'))))
+    compiled_cache = None
+    if os.getenv('COMPILED_CACHE_DIR'):
+        compiled_cache = CompiledCache(
+            os.getenv('COMPILED_CACHE_DIR') if survey.survey_id == model.DEFAULT_SURVEY_ID else
+            os.path.join(os.getenv('COMPILED_CACHE_DIR'), survey.slug))
+    return QuestionnaireStore(
+        cache, survey.questionnaire_url, http, endpoint=endpoint,
+        fresh_for=int(os.getenv('QUESTIONNAIRE_MAX_AGE', '300')),
+        stale_for=int(os.getenv('QUESTIONNAIRE_MAX_STALE', '86400')),
+        compiled_cache=compiled_cache)
+
+
+def survey_questionnaire_store(survey):
+    store = questionnaire_stores.get(survey.slug)
+    if store is None or store.url != survey.questionnaire_url:
+        with survey_resources_lock:
+            store = questionnaire_stores.get(survey.slug)
+            if store is None or store.url != survey.questionnaire_url:
+                store = questionnaire_stores[survey.slug] = new_questionnaire_store(survey)
+    return store
+
+
+def survey_resource(resources, create):
+    """The entry of the current survey in ``resources`` (a dict by slug), made with ``create(survey)`` on first use."""
+    resource = resources.get(g.survey.slug)
+    if resource is None:
+        with survey_resources_lock:
+            resource = resources.get(g.survey.slug)
+            if resource is None:
+                resource = resources[g.survey.slug] = create(g.survey)
+    return resource
+
+
+if os.getenv('QUESTIONNAIRE_PRELOAD') == '1':
+    # with gunicorn --preload this runs once, before the workers are forked, and they all start with it
+    with app.app_context():
+        try:
+            for survey in hosted_surveys.all():
+                try:
+                    survey_questionnaire_store(survey).get()
+                except QuestionnaireUnavailable as e:
+                    app.logger.warning('Could not preload the questionnaire of %s: %s', survey.slug, e)
+        except sqlalchemy.exc.SQLAlchemyError as e:
+            # e.g. a new database, before `flask upgrade-db` (which imports this module too) creates the tables
+            app.logger.warning('Could not preload the questionnaires: %s', e)
+    # the forked workers must not share the kept-alive connections
+    http.session.close()
 
 if os.environ.get('MOCK') == '1':
     app.register_blueprint(mock_app)
 
 
+def store_queued_submissions(receipts, votes):
+    with app.app_context():
+        try:
+            model.store_queued_submissions(receipts, [
+                (survey_id, voter_hash, answers, datetime.datetime.utcfromtimestamp(queued_at))
+                for survey_id, voter_hash, answers, queued_at in votes])
+            model.db.session.commit()
+        except Exception:
+            model.db.session.rollback()
+            raise
+
+
+submission_journal = None
+if os.getenv('SUBMISSION_JOURNAL'):
+    submission_journal = journal.SubmissionJournal(
+        os.getenv('SUBMISSION_JOURNAL'), store_queued_submissions,
+        batch_size=int(os.getenv('SUBMISSION_BATCH_SIZE', '200')))
+    app.before_first_request(submission_journal.start_writer)
+    registry.gauge(
+        'questionnaire_journal_backlog', 'Submissions queued in the journal, not stored in the database yet.',
+        lambda: {(): submission_journal.backlog()[0]})
+    registry.gauge(
+        'questionnaire_journal_oldest_seconds', 'Age of the oldest submission queued in the journal.',
+        lambda: {(): round(submission_journal.backlog()[1], 3)})
+    registry.gauge(
+        'questionnaire_journal_submissions_total', 'Submissions queued and stored by this worker, and its batches.',
+        lambda: {(('outcome', outcome),): count for outcome, count in submission_journal.stats.items()},
+        kind='counter')
+
+use_vote_matrix = os.getenv('VOTE_MATRIX') == '1'
+if use_vote_matrix:
+    registry.gauge('questionnaire_vote_matrix_votes', 'Votes in the in-memory vote matrices of this worker.',
+                   lambda: {(('survey', slug),): len(matrix) for slug, matrix in vote_matrices.items()})
+    registry.gauge('questionnaire_vote_matrix_bytes', 'Approximate memory used by the vote matrices of this worker.',
+                   lambda: {(('survey', slug),): matrix.nbytes() for slug, matrix in vote_matrices.items()})
+
+registry.gauge(
+    'questionnaire_store_lookups_total', 'Questionnaire cache lookups (hit, stale, miss) and compiles.',
+    lambda: {(('survey', slug), ('result', result)): count
+             for slug, store in questionnaire_stores.items() for result, count in store.stats.items()},
+    kind='counter')
+registry.gauge(
+    'questionnaire_upstream_calls_total', 'Calls to upstream services, by outcome.',
+    lambda: {(('upstream', name), ('outcome', outcome)): count
+             for name, endpoint in http.endpoints.items() for outcome, count in endpoint.stats.items()},
+    kind='counter')
+registry.gauge(
+    'questionnaire_upstream_seconds_total', 'Time spent calling upstream services.',
+    lambda: {(('upstream', name),): endpoint.seconds for name, endpoint in http.endpoints.items()}, kind='counter')
+registry.gauge(
+    'questionnaire_upstream_circuit_open', '1 while calls to an upstream service are cut off by its circuit breaker.',
+    lambda: {(('upstream', name),): int(endpoint.breaker.state == 'open') for name, endpoint in http.endpoints.items()})
+
+
+def current_vote_matrix():
+    """The vote matrix of the current survey (see vote_matrix.py), or None without VOTE_MATRIX=1."""
+    if not use_vote_matrix:
+        return None
+    return survey_resource(vote_matrices, lambda survey: VoteMatrix(
+        survey.survey_id, refresh_interval=float(os.getenv('VOTE_MATRIX_REFRESH', '5'))))
+
+
+def current_submissions_rollup():
+    return survey_resource(submission_rollups, lambda survey: timeline.Rollup(
+        survey.survey_id, interval=float(os.getenv('TIMELINE_ROLLUP_INTERVAL', '10'))))
+
+
+@app.url_value_preprocessor
+def pull_survey(endpoint, values):
+    """``/s/<survey>/...`` URLs are for the survey with that slug, the others for the default survey."""
+    slug = values.pop('survey', None) if values else None
+    g.survey = hosted_surveys.by_slug(slug) if slug is not None else hosted_surveys.default()
+    if g.survey is None:
+        abort(404)
+
+
+@app.url_defaults
+def add_survey_slug(endpoint, values):
+    survey = g.get('survey')
+    if survey is not None and survey.survey_id != model.DEFAULT_SURVEY_ID and app.url_map.is_endpoint_expecting(
+            endpoint, 'survey'):
+        values.setdefault('survey', survey.slug)
+
+
 @app.context_processor
 def inject_sysinfo():
     return dict(sysinfo=dict(build=__version__))
@@ -62,6 +275,11 @@ def inject_user():
     return dict(user=session['me']) if 'me' in session else dict(user=None)
 
 
+@app.context_processor
+def inject_survey():
+    return dict(survey=g.get('survey'))
+
+
 @app.template_filter('maxlength')
 def max_length(iterable):
     validators_max_length = [v.max for v in iterable.validators if 'wtforms.validators.Length' in str(type(v))]
@@ -111,62 +329,86 @@ def dropdown(table_name):
 
 @app.errorhandler(500)
 def page_error(e):
-    print(e, file=sys.stderr)
+    # unhandled exceptions have already been logged, with their traceback, by Flask
+    instrumentation.record_error(getattr(e, 'original_exception', None) or e)
     return render_template('error.html'), 500
 
 
-def reddit_agent():
-    if os.environ.get('MOCK') == '1':
-        return MockRedditAgent()
-    redirect_uri = urllib.parse.urljoin(os.getenv('REDDIT_OAUTH_REDIRECT_URL'), url_for('authorize_callback'))
-    r = praw.Reddit(
-        client_id=os.getenv('REDDIT_OAUTH_CLIENT_ID'),
-        client_secret=os.getenv('REDDIT_OAUTH_CLIENT_SECRET'),
-        redirect_uri=redirect_uri,
-        user_agent=USER_AGENT)
-    return r
-
-
-def get_me_serializable(r):
-    me = r.user.me()
-    me_serializable = dict(comment_karma=me.comment_karma, created=me.created, created_utc=me.created_utc,
-                           gold_creddits=me.gold_creddits, gold_expiration=me.gold_expiration,
-                           has_verified_email=me.has_verified_email, hide_from_robots=me.hide_from_robots, id=me.id,
-                           inbox_count=me.inbox_count, is_gold=me.is_gold, is_mod=me.is_mod,
-                           link_karma=me.link_karma, name=me.name, over_18=me.over_18)
-    return me_serializable
+def oauth_redirect_uri():
+    return urllib.parse.urljoin(oauth_redirect_base, url_for('authorize_callback'))
 
 
-def make_authorize_url(r):
-    scope = ['identity']
+def make_authorize_url():
     session['state'] = str(uuid.uuid4())
-    authorize_url = r.auth.url(scope, session['state'], 'temporary')
-    return authorize_url
+    if reddit_oauth is None:
+        return url_for('mock.mock_login')
+    return reddit_oauth.authorize_url(session['state'], oauth_redirect_uri())
 
 
 @app.route('/authorize_callback')
 def authorize_callback():
     state = request.args.get('state')
-    if state != session.get('state'):
+    if state != session.get('state') or reddit_oauth is None:
         return make_response(redirect(url_for('index')))
     code = request.args.get('code')
-    r = reddit_agent()
     try:
-        r.auth.authorize(code)
-    except prawcore.exceptions.OAuthException:
+        with phase('login'):
+            me = reddit_oauth.login(code, oauth_redirect_uri())
+    except LoginFailed as e:
+        app.logger.info('Login failed: %s', e)
         return make_response(redirect(url_for('index')))
-    session['me'] = get_me_serializable(r)
-    return make_response(redirect(url_for('home')))
+    except UpstreamUnavailable as e:
+        app.logger.error('Login failed: %s', e)
+        return make_response(render_template('error.html'), 503)
+    if server_side_sessions:
+        session.regenerate()
+    session['me'] = me
+    # whatever was remembered belonged to whoever was logged in before
+    session.pop('voter', None)
+    # back to the survey the user started from
+    return make_response(redirect(url_for('home', survey=session.pop('survey', None))))
 
 
 @app.route('/')
+@app.route('/s/<survey>/')
 def index():
     global first_run
     if first_run:
         session.clear()
         first_run = False
-    r = reddit_agent()
-    return make_response(redirect(make_authorize_url(r)))
+    if g.survey.survey_id == model.DEFAULT_SURVEY_ID:
+        session.pop('survey', None)
+    else:
+        session['survey'] = g.survey.slug
+    return make_response(redirect(make_authorize_url()))
+
+
+@app.route('/_upstream')
+def upstream_status():
+    if 'me' not in session:
+        return make_response(redirect(url_for('index')))
+    if not current_user_is_tester():
+        abort(503)
+    return jsonify(http.stats())
+
+
+def from_localhost():
+    """Whether the request comes from this host, both directly and (if proxied) originally."""
+    direct = request.environ.get('werkzeug.proxy_fix.orig', {}).get('REMOTE_ADDR', request.remote_addr)
+    try:
+        return all(ipaddress.ip_address(address).is_loopback for address in (direct, request.remote_addr))
+    except ValueError:
+        return False
+
+
+@app.route('/metrics')
+def metrics():
+    if metrics_token:
+        if request.headers.get('Authorization') != f'Bearer {metrics_token}':
+            abort(403)
+    elif not from_localhost():
+        abort(404)
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
 
 
 @app.route('/about')
@@ -175,105 +417,346 @@ def about_page():
 
 
 @app.route('/home')
+@app.route('/s/<survey>/home')
 def home():
     if 'me' not in session:
         return make_response(redirect(url_for('index')))
-    questions = read_questionnaire()
-    question_id = 1
-    config = {}
-    config_questions = [q for q in questions if q['kind'] == 'config']
-    for cq in config_questions:
-        config.update(cq['config'])
-    questions = [q for q in questions if q['kind'] != 'config']
-
-    for question in questions:
-        if question['kind'] in ('header', 'config'):
-            continue
-        question['id'] = question_id
-        question_id += 1
-
-    if 'account_older_than' in config:
-        created_date = datetime.datetime.fromtimestamp(session['me']['created_utc'])
-        if created_date > config['account_older_than']:
-            return Response('Your account is too new', mimetype='text/plain')
-
-    answers = {}
-
-    receipt = model.Receipt.query.filter_by(user_id=session['me']['id']).first()
-    if receipt is not None:
-        if request.cookies.get('receipt_id') is None:
-            return render_template('done.html', nocookie=True)
-
-        receipt_id_text = request.cookies['receipt_id']
-        receipt_id_bytes = binascii.unhexlify(receipt_id_text.replace('-', ''))
-        userhash = hashlib.sha256(session['me']['id'].encode('utf8') + receipt_id_bytes).hexdigest()
+    questionnaire = read_questionnaire()
+    if account_too_new(questionnaire.config):
+        return Response('Your account is too new', mimetype='text/plain')
 
-        vote = model.Vote.query.filter_by(user_hash=userhash).first()
-        if vote is not None:
-            answers = {a.code: a.answer_value for a in vote.answers}
-        else:
+    voter = current_voter()
+    if voter.has_receipt:
+        if request.cookies.get(receipt_cookie_name()) is None:
+            return render_template('done.html', nocookie=True)
+        if not voter.has_vote:
             return render_template('done.html', tamper=True)
 
     return render_template(
         'home.html',
-        questions=questions,
-        answers=answers,
-        config=config,
-        recaptcha_site_key=os.environ.get('RECAPTCHA_SITE_KEY'))
+        questionnaire_form=questionnaire_form(questionnaire),
+        answers=with_draft(voter.answers))
+
+
+@app.route('/autosave', methods=('POST',))
+@app.route('/s/<survey>/autosave', methods=('POST',))
+def autosave():
+    """Store the fields changed since the last autosave (a JSON object of field to value, empty to clear) as a draft.
+
+    Drafts are not counted in the results; the next submission to /done replaces them.
+    """
+    if 'me' not in session:
+        abort(401)
+    changes = request.get_json(silent=True)
+    if not isinstance(changes, dict):
+        abort(400)
+    questionnaire = read_questionnaire()
+    if account_too_new(questionnaire.config):
+        abort(403)
+    changes, rejected = questionnaire.clean_changes(
+        [(str(field), '' if value is None else str(value)) for field, value in changes.items()])
+    for reason, count in rejected.items():
+        instrumentation.REJECTED_FIELDS.inc(count, reason=reason)
+
+    response = make_response('', 204)
+    draft_id = current_draft_id()
+    if draft_id is None:
+        draft_id = str(uuid.uuid4())
+        response.set_cookie(draft_cookie_name(), value=draft_id, httponly=True)
+    with phase('autosave'):
+        model.save_draft(g.survey.survey_id, draft_hash(draft_id), changes, datetime.datetime.utcnow())
+        model.db.session.commit()
+    return response
+
+
+def receipt_cookie_name():
+    """Every survey has its own receipt; the default one keeps the cookie name from before there were several."""
+    if g.survey.survey_id == model.DEFAULT_SURVEY_ID:
+        return 'receipt_id'
+    return f'receipt_id_{g.survey.slug}'
+
+
+def draft_cookie_name():
+    if g.survey.survey_id == model.DEFAULT_SURVEY_ID:
+        return 'draft_id'
+    return f'draft_id_{g.survey.slug}'
+
+
+def current_draft_id():
+    draft_id_text = request.cookies.get(draft_cookie_name())
+    try:
+        return str(uuid.UUID(draft_id_text)) if draft_id_text else None
+    except ValueError:
+        return None
+
+
+def draft_hash(draft_id_text):
+    return hashlib.sha256(session['me']['id'].encode('utf8') + b'/draft/' + draft_id_text.encode('ascii')).hexdigest()
+
+
+def with_draft(answers):
+    """``answers`` with the changes autosaved since they were submitted."""
+    draft_id = current_draft_id()
+    if draft_id is None:
+        return answers
+    changes = model.draft_changes(g.survey.survey_id, draft_hash(draft_id))
+    if not changes:
+        return answers
+    answers = dict(answers)
+    for code, answer_value in changes.items():
+        if answer_value is None:
+            answers.pop(code, None)
+        else:
+            answers[code] = answer_value
+    return answers
+
+
+def user_hash(receipt_id_bytes):
+    return hashlib.sha256(session['me']['id'].encode('utf8') + receipt_id_bytes).hexdigest()
+
+
+def current_voter():
+    """Receipt, vote and answers of the current user (see model.voter_state), with a single query.
+
+    Once the vote is found, its id is remembered in the (cookie) session, along with the user and the receipt it was
+    found with, so later requests of the same user with the same receipt cookie read it directly. Submissions still
+    queued in the journal take precedence.
+    """
+    survey_id = g.survey.survey_id
+    user_id = session['me']['id']
+    receipt_id_text = request.cookies.get(receipt_cookie_name())
+    voter_hash = user_hash(binascii.unhexlify(receipt_id_text.replace('-', ''))) if receipt_id_text else None
+    remembered = None if server_side_sessions else session.get('voter')
+    voter = None
+    if (remembered and voter_hash is not None and remembered['vote_id'] is not None and
+            remembered.get('user_id') == user_id and remembered['user_hash'] == voter_hash and
+            remembered.get('survey_id', model.DEFAULT_SURVEY_ID) == survey_id):
+        voter = model.voter_state(survey_id, user_id, voter_hash, vote_id=remembered['vote_id'])
+        if voter.vote is None:
+            voter = None
+    if voter is None:
+        voter = model.voter_state(survey_id, user_id, voter_hash)
+    if submission_journal is not None:
+        if not voter.has_receipt:
+            voter.has_receipt = submission_journal.has_receipt(survey_id, user_id)
+        if voter_hash is not None:
+            voter.pending = submission_journal.pending_answers(survey_id, voter_hash)
+    if voter.has_vote:
+        remember_voter(receipt_id_text, voter_hash, voter.vote.vote_id if voter.vote is not None else None)
+    return voter
+
+
+def remember_voter(receipt_id_text, voter_hash, vote_id):
+    # a server-side session would keep the link between the reddit identity and the vote in a table of the server
+    if server_side_sessions:
+        return
+    remembered = dict(survey_id=g.survey.survey_id, user_id=session['me']['id'], receipt_id=receipt_id_text,
+                      user_hash=voter_hash, vote_id=vote_id)
+    # assigning marks the session as modified, i.e. sends the cookie again
+    if session.get('voter') != remembered:
+        session['voter'] = remembered
+
+
+def questionnaire_form(questionnaire):
+    """The questionnaire form, without any answers (home.html fills them in client-side).
+
+    It only depends on the survey, its questionnaire version and the locale, so it is rendered once per worker for each
+    of them.
+    """
+    key = g.survey.survey_id, questionnaire.content_hash, str(flask_babel.get_locale())
+    form = rendered_forms.get(key)
+    instrumentation.CACHE_REQUESTS.inc(cache='form', result='miss' if form is None else 'hit')
+    if form is None:
+        form = Markup(render_template(
+            '_questionnaire_form.html',
+            questions=questionnaire.questions,
+            config=questionnaire.config,
+            recaptcha_site_key=recaptcha_site_key))
+        for old_key in [k for k in rendered_forms if k[0] == key[0] and k[1] != questionnaire.content_hash]:
+            rendered_forms.pop(old_key, None)
+        rendered_forms[key] = form
+    return form
 
 
 @app.route('/results')
+@app.route('/s/<survey>/results')
 def results():
     if 'me' not in session:
         return make_response(redirect(url_for('index')))
-    current_testers_text = os.getenv('TESTERS', '')
-    current_testers = re.split(r'\W', current_testers_text)
-    user_is_tester = session['me']['name'] in current_testers
-    if not user_is_tester:
+    if not current_user_is_tester():
         abort(503)
 
-    from sqlalchemy import func
-    with app.app_context():
-        questions = read_questionnaire()
-        raw_results = model.db.session.query(
-            model.Answer.code,
-            model.Answer.answer_value,
-            func.count(model.Answer.answer_id)).group_by(
-            model.Answer.code,
-            model.Answer.answer_value).all()
-
-        pure_questions = [q for q in questions if q['kind'] not in ('config', 'header')]
-        raw_results = sorted(
-            [expand_question(result, pure_questions) for result in raw_results],
-            key=lambda x: x['sort_order'])
-        if request.query_string.lower() == b'json':
-            for r in raw_results:
-                r.pop('sort_order')
-            response = make_response(jsonify(raw_results))
+    questionnaire = read_questionnaire()
+    as_json = request.query_string.lower() == b'json'
+    key = results_cache_key(questionnaire)
+    # the page also shows the user (and is translated), the JSON is the same for everyone
+    variant = ['json'] if as_json else ['html', str(flask_babel.get_locale()), session['me']]
+    etag = hashlib.sha256(json.dumps([key] + variant, sort_keys=True, default=str).encode('utf8')).hexdigest()
+    if etag in request.if_none_match:
+        instrumentation.CACHE_REQUESTS.inc(cache='results', result='not_modified')
+        response = make_response('', 304)
+    else:
+        raw_results = cached_results(questionnaire, key)
+        if as_json:
+            response = make_response(jsonify(
+                [{field: value for field, value in r.items() if field != 'sort_order'} for r in raw_results]))
             response.headers['Content-Disposition'] = 'attachement; filename=results.json'
-            return response
         else:
-            return render_template('results.html', results=raw_results)
+            response = make_response(render_template('results.html', results=raw_results))
+    response.set_etag(etag)
+    # testers only: never kept by shared caches, and always revalidated (which is cheap)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
 
+def results_cache_key(questionnaire):
+    """Changes with the questionnaire and with every vote stored (see model.bump_data_version)."""
+    survey_id = g.survey.survey_id
+    version = [survey_id, questionnaire.content_hash, model.data_version(survey_id)]
+    return 'results/' + hashlib.sha256(json.dumps(version, default=str).encode('utf8')).hexdigest()
 
-def expand_question(result, questions):
-    question_code_raw = result[0]
-    answer_value = result[1]
-    vote_count = result[2]
-    question_code_parts = question_code_raw.split('_')
-    question_code = int(question_code_parts[1]) - 1
-    question_suffix = question_code_parts[2] if len(question_code_parts) == 3 else ''
+
+def cached_results(questionnaire, key=None):
+    """expanded_results, computed once per version of the data (and by only one request at a time per worker)."""
+    key = key or results_cache_key(questionnaire)
+    computed = []
+
+    def compute():
+        computed.append(key)
+        raw_results = expanded_results(questionnaire)
+        cache.set(key, raw_results, timeout=RESULTS_CACHE_TIMEOUT)
+        return raw_results
+
+    raw_results = results_computations.get(key, lambda: cache.get(key), compute)
+    instrumentation.CACHE_REQUESTS.inc(cache='results', result='miss' if computed else 'hit')
+    return raw_results
+
+
+@app.route('/results/crosstab')
+@app.route('/s/<survey>/results/crosstab')
+def results_crosstab():
+    if 'me' not in session:
+        return make_response(redirect(url_for('index')))
+    if not current_user_is_tester():
+        abort(503)
+
+    questionnaire = read_questionnaire()
+    row_question, column_question = request.args.get('rows'), request.args.get('columns')
+    table = error = None
+    if row_question and column_question:
+        try:
+            filters = crosstab.parse_filters(value for value in request.args.getlist('filter') if value)
+            survey_id = g.survey.survey_id
+            key = crosstab.cache_key(
+                survey_id, questionnaire, row_question, column_question, filters, model.data_version(survey_id))
+            table = cache.get(key)
+            instrumentation.CACHE_REQUESTS.inc(cache='crosstab', result='miss' if table is None else 'hit')
+            if table is None:
+                table = crosstab.crosstab(survey_id, questionnaire, expand_question, row_question, column_question,
+                                          filters, current_vote_matrix())
+                cache.set(key, table, timeout=crosstab.CACHE_TIMEOUT)
+        except crosstab.CrosstabError as e:
+            error = str(e)
+    elif request.args:
+        error = 'Choose a question for the rows and one for the columns'
+
+    if request.args.get('format') == 'json':
+        if error or table is None:
+            return make_response(jsonify(error=error or 'rows and columns are required'), 400)
+        return jsonify(table)
+    return render_template('crosstab.html', questions=questionnaire.pure_questions, table=table, error=error)
+
+
+@app.route('/results/timeline')
+@app.route('/s/<survey>/results/timeline')
+def results_timeline():
+    if 'me' not in session:
+        return make_response(redirect(url_for('index')))
+    if not current_user_is_tester():
+        abort(503)
+
+    with phase('rollup'):
+        current_submissions_rollup()()
+    series = error = None
+    try:
+        series = timeline.series(
+            g.survey.survey_id, request.args.get('resolution', 'hour'), request.args.get('buckets') or None)
+    except timeline.TimelineError as e:
+        error = str(e)
+    if request.args.get('format') == 'json':
+        if error:
+            return make_response(jsonify(error=error), 400)
+        return jsonify(series)
+    refresh = request.args.get('refresh', '60')
+    return render_template('timeline.html', series=series, error=error, resolutions=timeline.RESOLUTIONS,
+                           refresh=max(10, int(refresh)) if refresh.isdigit() and refresh != '0' else None)
+
+
+@app.route('/results/export/<any(results, votes):dataset>.<any(csv, ndjson):file_format>')
+@app.route('/s/<survey>/results/export/<any(results, votes):dataset>.<any(csv, ndjson):file_format>')
+def export_results(dataset, file_format):
+    if 'me' not in session:
+        return make_response(redirect(url_for('index')))
+    if not current_user_is_tester():
+        abort(503)
+
+    formatter, mimetype = export.FORMATS[file_format]
+    if dataset == 'results':
+        fields = export.RESULT_FIELDS
+        rows = export.results_rows(cached_results(read_questionnaire()))
+    else:
+        codes = export.answer_codes(g.survey.survey_id)
+        fields = ['vote_id', 'datestamp'] + codes
+        vote_matrix = current_vote_matrix()
+        rows = vote_matrix.vote_rows(codes) if vote_matrix is not None else export.vote_rows(g.survey.survey_id, codes)
+    response = Response(stream_with_context(formatter(fields, rows)), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename={dataset}.{file_format}'
+    return response
+
+
+def current_user_is_tester():
+    return session['me']['name'] in testers
+
+
+def expanded_results(questionnaire=None):
+    questionnaire = questionnaire or read_questionnaire()
+    raw_results = model.db.session.query(
+        model.AnswerTally.code,
+        model.AnswerTally.answer_value,
+        model.AnswerTally.vote_count,
+        model.AnswerTally.question_number,
+        model.AnswerTally.question_suffix).filter(
+        model.AnswerTally.survey_id == g.survey.survey_id, model.AnswerTally.vote_count > 0).all()
+    expanded = (expand_question(result, questionnaire) for result in raw_results)
+    return sorted([result for result in expanded if result is not None], key=lambda x: x['sort_order'])
+
+
+def _nth(items, ordinal):
+    """``items[ordinal - 1]`` of a 1-based ``ordinal`` string; ValueError or IndexError when there's no such item."""
+    index = int(ordinal) - 1
+    if index < 0:
+        raise IndexError(ordinal)
+    return items[index]
+
+
+def expand_question(result, questionnaire):
+    """The result row of a tally, or None when its code isn't a question of ``questionnaire``."""
+    question_code_raw, answer_value, vote_count, question_number, question_suffix = result
+    if question_number is None or not 0 < question_number <= len(questionnaire.pure_questions):
+        return None
+    question_code = question_number - 1
     answer_text = '\0'
-    question = questions[question_code]
+    answer_path = None
+    question = questionnaire.pure_questions[question_code]
     question_kind = question['kind']
     question_text = question['title']
     if 'choices' in question:
         if question_kind == 'checkbox' and question_suffix != 'text':
             answer_value = question_suffix
-        if question_kind == 'tree':
-            answer_text = find_choice(question['choices'], answer_value)
-        elif question_kind == 'checktree':
-            answer_text = find_choice(question['choices'], question_code_parts[2])
+        if question_kind in ('tree', 'checktree'):
+            tree_value = answer_value if question_kind == 'tree' else question_suffix
+            answer_text, answer_path = questionnaire.tree_choices[question_number].get(tree_value, ('', ()))
+            answer_path = ' › '.join(answer_path)
         elif question_kind in ('radio', 'checkbox'):
             if answer_value in question['choices']:
                 answer_text = question['choices'][answer_value]
@@ -281,17 +764,20 @@ def expand_question(result, questions):
                 answer_text = answer_value
                 answer_value = 'Other'
         elif question_kind == 'scale-matrix':
-            subquestion = question['lines'][int(question_suffix) - 1]
+            try:
+                subquestion = _nth(question['lines'], question_suffix)
+                if answer_value not in SCALE_WORDS:
+                    answer_text = _nth(questionnaire.scale_choices[question_number], answer_value)
+                else:
+                    answer_text += f'†{answer_value}'
+            except (ValueError, IndexError):
+                # a line or a scale value the questionnaire doesn't have (any more)
+                return None
             if subquestion:
                 question_text += ': ' + subquestion
-            answer_keys = list(question['choices'].keys())
-            if answer_value not in ('maybe', 'no', 'yes'):
-                answer_text = question['choices'][answer_keys[int(answer_value) - 1]]
-            else:
-                answer_text += f'†{answer_value}'
             # answer_value = question['choices'][f'A{answer_value}']
 
-    sort_order = question_code, question_code_parts[2:]
+    sort_order = question_code, question_suffix
     # question_code_raw += '::' + question['kind']
     return {
         'kind': question_kind,
@@ -300,41 +786,29 @@ def expand_question(result, questions):
         'question_text': question_text,
         'answer_value': answer_value,
         'answer_text': answer_text,
+        'answer_path': answer_path,
         'vote_count': vote_count,
         'sort_order': sort_order}
 
 
-def find_choice(choices, value):
-    if value in choices:
-        return choices[value]['title']
-
-    new_value = ''
-    for choice_name, choice in choices.items():
-        if 'choices' in choice:
-            new_value = find_choice(choice['choices'], value)
-            if new_value:
-                return new_value
-    return new_value
+def account_too_new(config):
+    if 'account_older_than' not in config:
+        return False
+    created_date = datetime.datetime.fromtimestamp(session['me']['created_utc'])
+    return created_date > config['account_older_than']
 
 
-@cache.cached(timeout=300)
 def read_questionnaire():
-    url = os.getenv('QUESTIONNAIRE_URL')
-    if url.startswith('file://'):
-        url_obj = urllib.parse.urlparse(url)
-        file_path = urllib.request.url2pathname(url_obj.path)
-        questions_list = pathlib.Path(file_path).read_text(encoding='utf8')
-    else:
-        questionnaire_data = requests.get(url, params=dict(raw_json=1), headers={'User-Agent': USER_AGENT}).json()
-        if 'data' not in questionnaire_data:
-            print(questionnaire_data)
-            abort(503)
-        questions_list = questionnaire_data['data']['content_md']
-    questions = list(yaml.load_all(questions_list))
-    return questions
+    try:
+        with phase('questionnaire'):
+            return survey_questionnaire_store(g.survey).get()
+    except QuestionnaireUnavailable as e:
+        app.logger.error('Questionnaire unavailable: %s', e)
+        abort(503)
 
 
 @app.route('/restore_cookie', methods=('GET', 'POST'))
+@app.route('/s/<survey>/restore_cookie', methods=('GET', 'POST'))
 def restore_cookie():
     if 'me' not in session:
         return make_response(redirect(url_for('index')))
@@ -343,7 +817,7 @@ def restore_cookie():
     else:
         receipt_id = request.form['receipt_id']
         response = redirect(url_for('home'))
-        response.set_cookie('receipt_id', value=receipt_id, httponly=True)
+        response.set_cookie(receipt_cookie_name(), value=receipt_id, httponly=True)
         return response
 
 
@@ -352,81 +826,94 @@ def questions_sort(x):
 
 
 @app.route('/done', methods=('POST',))
+@app.route('/s/<survey>/done', methods=('POST',))
 def save():
     response = None
-    with app.app_context():
-        if 'RECAPTCHA_SECRET' in os.environ:
-            recaptcha_secret = os.environ['RECAPTCHA_SECRET']
-            recaptcha_response = request.form['g-recaptcha-response']
-            remote_ip = request.remote_addr
-            verification = requests.post(
-                'https://www.google.com/recaptcha/api/siteverify',
-                data=dict(
-                    secret=recaptcha_secret,
-                    response=recaptcha_response,
-                    remoteip=remote_ip
-                )).json()
-            if not verification['success']:
-                return make_response(redirect(url_for('index')))
-
-        receipt = model.Receipt.query.filter_by(user_id=session['me']['id']).first()
-
-        current_testers_text = os.getenv('TESTERS', '')
-        current_testers = re.split(r'\W', current_testers_text)
-        user_is_tester = session['me']['name'] in current_testers
-
-        if receipt is not None:
-            if request.cookies['receipt_id'] is None:
-                return render_template('done.html', nocookie=True)
-
-            receipt_id_text = request.cookies['receipt_id']
-            receipt_id_bytes = binascii.unhexlify(receipt_id_text.replace('-', ''))
-            userhash = hashlib.sha256(session['me']['id'].encode('utf8') + receipt_id_bytes).hexdigest()
-            if model.Vote.query.filter_by(user_hash=userhash).count() == 0:
-                return render_template('done.html', tamper=True)
-            response = make_response(
-                render_template('done.html', voted=True, receipt_id=receipt_id_text, request=request,
-                                user_is_tester=user_is_tester))
-        else:
-            receipt_id = uuid.uuid4()
-            receipt_id_text = str(receipt_id)
-            userhash = hashlib.sha256(session['me']['id'].encode('utf8') + receipt_id.bytes).hexdigest()
-            response = make_response(
-                render_template('done.html', voted=True, receipt_id=receipt_id_text, request=request,
-                                user_is_tester=user_is_tester))
-            response.set_cookie('receipt_id', value=receipt_id_text)
-            rct = model.Receipt()
-            rct.user_id = session['me']['id']
-            model.db.session.add(rct)
-
-        v = model.Vote.query.filter_by(user_hash=userhash).first()
-        if v is None:
-            v = model.Vote()
-            v.user_hash = userhash
-        v.datestamp = datetime.datetime.utcnow()
-        model.db.session.add(v)
-        # response = 'userid=' + session['me']['id'] + '\n'
-        for a in v.answers:
-            model.db.session.delete(a)
-        for field, value in sorted(request.form.items(), key=questions_sort):
-            if value is None or value == '':
-                continue
-            if field in ('cmd_save', 'g-recaptcha-response'):
-                continue
-            if not field.startswith('q_'):
-                continue
-            a = model.Answer.query.filter_by(code=field, vote=v).first()
-            if a is None:
-                a = model.Answer()
-                a.code = field
-                a.vote = v
-            if len(value) >= 512:
-                value = value[:511] + '\u2026'
-            a.answer_value = value
-            a.vote = v
-            model.db.session.add(a)
+    questionnaire = read_questionnaire()
+    if account_too_new(questionnaire.config):
+        return Response('Your account is too new', mimetype='text/plain')
+
+    if recaptcha_secret is not None:
+        recaptcha_response = request.form['g-recaptcha-response']
+        remote_ip = request.remote_addr
         try:
+            with phase('recaptcha'):
+                verification = http.post(
+                    'recaptcha',
+                    data=dict(
+                        secret=recaptcha_secret,
+                        response=recaptcha_response,
+                        remoteip=remote_ip
+                    )).json()
+        except (UpstreamUnavailable, ValueError) as e:
+            app.logger.error('reCAPTCHA verification failed: %s', e)
+            return make_response(render_template('done.html', error=True), 503)
+        if not verification['success']:
+            return make_response(redirect(url_for('index')))
+
+    # before any database work, so that junk never gets further than this
+    answers, rejected = questionnaire.clean_answers(sorted(request.form.items(), key=questions_sort))
+    for reason, count in rejected.items():
+        instrumentation.REJECTED_FIELDS.inc(count, reason=reason)
+
+    voter = current_voter()
+
+    user_is_tester = current_user_is_tester()
+
+    if voter.has_receipt:
+        if request.cookies.get(receipt_cookie_name()) is None:
+            return render_template('done.html', nocookie=True)
+
+        receipt_id_text = request.cookies[receipt_cookie_name()]
+        if not voter.has_vote:
+            return render_template('done.html', tamper=True)
+        voter_hash = user_hash(binascii.unhexlify(receipt_id_text.replace('-', '')))
+        response = make_response(
+            render_template('done.html', voted=True, receipt_id=receipt_id_text, request=request,
+                            user_is_tester=user_is_tester))
+    else:
+        receipt_id = uuid.uuid4()
+        receipt_id_text = str(receipt_id)
+        voter_hash = user_hash(receipt_id.bytes)
+        response = make_response(
+            render_template('done.html', voted=True, receipt_id=receipt_id_text, request=request,
+                            user_is_tester=user_is_tester))
+        response.set_cookie(receipt_cookie_name(), value=receipt_id_text)
+
+    # the submission replaces what was autosaved
+    draft_id = current_draft_id()
+    if draft_id is not None:
+        model.discard_draft(g.survey.survey_id, draft_hash(draft_id))
+        response.delete_cookie(draft_cookie_name())
+
+    if submission_journal is not None:
+        with phase('enqueue'):
+            submission_journal.enqueue(
+                g.survey.survey_id, None if voter.has_receipt else session['me']['id'], voter_hash, answers)
+        remember_voter(receipt_id_text, voter_hash, voter.vote.vote_id if voter.vote is not None else None)
+        if draft_id is not None:
             model.db.session.commit()
+        return response
+
+    v = voter.vote
+    if v is None:
+        rct = model.Receipt()
+        rct.survey_id = g.survey.survey_id
+        rct.user_id = session['me']['id']
+        model.db.session.add(rct)
+        v = model.Vote()
+        v.survey_id = g.survey.survey_id
+        v.user_hash = voter_hash
+    v.datestamp = datetime.datetime.utcnow()
+    model.db.session.add(v)
+    with phase('store'):
+        tally_deltas = model.store_answers(v, answers, voter.answer_rows if voter.vote is not None else None)
+        model.apply_tally_deltas(g.survey.survey_id, tally_deltas)
+        v.stored_shard, v.stored_version = model.bump_data_version(g.survey.survey_id)
+        vote_id = v.vote_id
+        try:
+            model.db.session.commit()
+            remember_voter(receipt_id_text, voter_hash, vote_id)
         except sqlalchemy.exc.OperationalError as e:
             response = make_response(render_template('done.html', error=True))
     if response is None:
@@ -434,10 +921,84 @@ def save():
     return response
 
 
+def upgrade_database():
+    """Create the missing tables, upgrade the schema of older databases, and add (or update) the default survey."""
+    model.db.create_all()
+    migrations.upgrade(model.db.engine)
+    surveys.ensure_default(os.getenv('SURVEY_SLUG', 'main'), os.getenv('QUESTIONNAIRE_URL', ''))
+    model.db.session.commit()
+    if model.AnswerTally.query.first() is None and model.Answer.query.first() is not None:
+        model.rebuild_tallies()
+        model.db.session.commit()
+
+
+@app.cli.command('upgrade-db')
+def upgrade_database_command():
+    """Create or upgrade the database; runs once per release (see the Procfile), before the web site starts."""
+    upgrade_database()
+    click.echo('The database is up to date')
+
+
+@app.cli.command('rebuild-tallies')
+@click.option('--check', is_flag=True, help='Only compare the tallies to the answers, without changing anything.')
+def rebuild_tallies_command(check):
+    """Recompute the results tallies from the answers."""
+    differences = model.check_tallies()
+    for survey_id, code, answer_value, tallied, actual in differences:
+        click.echo(f'survey {survey_id}, {code} = {answer_value!r}: tallied {tallied}, actual {actual}')
+    if check:
+        click.echo(f'{len(differences)} difference(s) found')
+        sys.exit(1 if differences else 0)
+    count = model.rebuild_tallies()
+    model.db.session.commit()
+    click.echo(f'Rebuilt {count} tallies ({len(differences)} were wrong)')
+
+
+@app.cli.command('add-survey')
+@click.argument('slug')
+@click.argument('questionnaire_url')
+@click.option('--title', help='The title of the survey.')
+def add_survey_command(slug, questionnaire_url, title):
+    """Host another survey at /s/SLUG/, or change the questionnaire URL of an existing one."""
+    try:
+        survey = surveys.add_survey(slug, questionnaire_url, title)
+    except surveys.SurveyError as e:
+        raise click.BadParameter(str(e))
+    model.db.session.commit()
+    click.echo(f'Survey {survey.survey_id} is served at /s/{survey.slug}/')
+
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Bundle, fingerprint and precompress the static files into static/dist (same as ``python assets.py``)."""
+    manifest = assets.build(app.static_folder)
+    click.echo(f'Built {len(manifest)} files; restart the web site to use them')
+
+
+@app.cli.command('drain-submissions')
+def drain_submissions_command():
+    """Store all the submissions queued in SUBMISSION_JOURNAL."""
+    if submission_journal is None:
+        raise click.UsageError('SUBMISSION_JOURNAL is not set')
+    batches = submission_journal.drain()
+    click.echo(f'Stored {batches} batch(es), {submission_journal.backlog()[0]} submission(s) left')
+
+
+@app.cli.command('purge-drafts')
+@click.option('--days', type=int, default=30, help='Delete the drafts not changed for this many days.')
+def purge_drafts_command(days):
+    """Delete old autosaved drafts (of voters who never came back to submit them)."""
+    count = model.purge_drafts(datetime.datetime.utcnow() - datetime.timedelta(days=days))
+    model.db.session.commit()
+    click.echo(f'Deleted {count} draft answer(s)')
+
+
 def main():
     global first_run
     # app.session_interface = SqliteSessionInterface()
     first_run = True
+    with app.app_context():
+        upgrade_database()
     app.jinja_env.auto_reload = True
     app.run(port=5000, host='0.0.0.0', debug=True)
 
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Static asset pipeline: bundles, fingerprinted file names and precompressed copies.
+
+    python assets.py        (or ``flask build-assets``)
+
+builds ``static/dist``: one CSS and one JS bundle with what ``_main.html`` loads (using the ``.min`` version of every
+file that has one, minified further with rcssmin/rjsmin when installed), fingerprinted copies of the fonts and images,
+gzip (and brotli, when installed) copies of everything compressible, and ``manifest.json``. When the manifest exists,
+``url_for('static', ...)`` points to the fingerprinted files, which are served with far-future cache headers. Without
+it (e.g. during development) the original files are used, one by one.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import pathlib
+import re
+import shutil
+
+from flask import request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+STATIC_DIR = pathlib.Path(__file__).parent / 'static'
+DIST = 'dist'
+MANIFEST = 'manifest.json'
+
+BUNDLES = {
+    'main.css': (
+        'css/bootstrap.css', 'css/bootstrap-theme.css', 'css/bootstrap-datetimepicker.css', 'css/bootstrap-switch.css',
+        'css/bootstrap-slider.css', 'css/font-awesome.css', 'css/select2.css', 'css/select2-bootstrap.css',
+        'css/toggle-switch.css', 'css/jquery.autocomplete.css', 'css/sticky-footer-navbar.css',
+        'css/questionnaire.css'),
+    'main.js': (
+        'js/jquery.js', 'js/bootstrap.js', 'js/bootstrap-switch.js', 'js/bootstrap-slider.js', 'js/select2.js',
+        'js/bootstrap-notify.js'),
+}
+# copied with a fingerprint, but not bundled
+SINGLE_FILES = ('fonts/*', 'images/*', 'js/html5shiv.js', 'js/respond.src.js')
+COMPRESSIBLE = {'.css', '.js', '.svg', '.eot', '.ttf', '.otf'}
+MAX_AGE = 365 * 24 * 60 * 60
+
+CSS_URL = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+SOURCE_MAP = re.compile(r'^\s*(//[#@] sourceMappingURL=.*|/\*[#@] sourceMappingURL=.*\*/)\s*$', re.MULTILINE)
+
+
+def _minified_source(path):
+    minified = path.with_name(path.stem + '.min' + path.suffix)
+    return minified if minified.exists() else path
+
+
+def _fingerprinted(name, content):
+    stem, suffix = os.path.splitext(name)
+    return f'{DIST}/{stem}.{hashlib.sha256(content).hexdigest()[:12]}{suffix}'
+
+
+def _write(static_dir, name, content):
+    path = static_dir / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    if path.suffix in COMPRESSIBLE:
+        path.with_name(path.name + '.gz').write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli is not None:
+            path.with_name(path.name + '.br').write_bytes(brotli.compress(content))
+
+
+def _rewrite_css_urls(css, source_name, manifest):
+    """Point the url()s of a CSS file (relative to ``source_name``) to the fingerprinted files, relative to dist/."""
+    source_dir = source_name.rpartition('/')[0]
+
+    def replace(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', 'http:', 'https:', '//', '#')):
+            return match.group(0)
+        path, suffix = re.match(r'([^?#]*)(.*)', url).groups()
+        target = os.path.normpath(os.path.join(source_dir, path)).replace(os.sep, '/')
+        if target not in manifest:
+            return match.group(0)
+        return f'url({quote}{manifest[target][len(DIST) + 1:]}{suffix}{quote})'
+
+    return CSS_URL.sub(replace, css)
+
+
+def build(static_dir=STATIC_DIR):
+    """Build static/dist from scratch. Returns the manifest (source name -> fingerprinted name)."""
+    static_dir = pathlib.Path(static_dir)
+    shutil.rmtree(static_dir / DIST, ignore_errors=True)
+    manifest = {}
+    for pattern in SINGLE_FILES:
+        for path in sorted(static_dir.glob(pattern)):
+            if path.is_file():
+                name = path.relative_to(static_dir).as_posix()
+                content = path.read_bytes()
+                manifest[name] = _fingerprinted(name, content)
+                _write(static_dir, manifest[name], content)
+    for bundle_name, sources in BUNDLES.items():
+        parts = []
+        for source_name in sources:
+            text = _minified_source(static_dir / source_name).read_text(encoding='utf8')
+            text = SOURCE_MAP.sub('', text)
+            if bundle_name.endswith('.css'):
+                text = _rewrite_css_urls(text, source_name, manifest)
+                parts.append(rcssmin.cssmin(text) if rcssmin else text)
+            else:
+                parts.append(rjsmin.jsmin(text) if rjsmin else text)
+        # a JS file may leave its last statement without a semicolon
+        content = (';\n' if bundle_name.endswith('.js') else '\n').join(parts).encode('utf8')
+        manifest[bundle_name] = _fingerprinted(bundle_name, content)
+        _write(static_dir, manifest[bundle_name], content)
+    (static_dir / DIST / MANIFEST).write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding='utf8')
+    return manifest
+
+
+def load_manifest(static_dir=STATIC_DIR):
+    path = pathlib.Path(static_dir) / DIST / MANIFEST
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf8'))
+
+
+def init_app(app):
+    manifest = load_manifest(app.static_folder)
+    dist_dir = pathlib.Path(app.static_folder) / DIST
+
+    @app.url_defaults
+    def fingerprinted_static(endpoint, values):
+        if endpoint == 'static' and values.get('filename') in manifest:
+            values['filename'] = manifest[values['filename']]
+
+    @app.template_global()
+    def asset_urls(bundle_name):
+        """The URLs to load for a bundle: the bundle itself once built, its separate source files otherwise."""
+        if bundle_name in manifest:
+            return [url_for('static', filename=bundle_name)]
+        return [url_for('static', filename=source_name) for source_name in BUNDLES[bundle_name]]
+
+    @app.route(f'{app.static_url_path}/{DIST}/<path:filename>')
+    def static_dist(filename):
+        """Fingerprinted files never change: they can be cached for a year, and are served precompressed."""
+        accepted = request.accept_encodings
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            compressed = safe_join(str(dist_dir), filename + suffix)
+            if accepted[encoding] and compressed and os.path.isfile(compressed):
+                response = send_from_directory(dist_dir, filename + suffix, max_age=MAX_AGE)
+                response.headers['Content-Type'] = _content_type(filename)
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            response = send_from_directory(dist_dir, filename, max_age=MAX_AGE)
+        response.headers['Cache-Control'] = f'public, max-age={MAX_AGE}, immutable'
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+def _content_type(filename):
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    return mimetype + '; charset=utf-8' if mimetype.startswith('text/') or mimetype.endswith('javascript') else mimetype
+
+
+if __name__ == '__main__':
+    built = build()
+    print(f'Built {len(built)} files in {STATIC_DIR / DIST}')
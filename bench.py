@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the hot paths of the questionnaire.
+
+    python bench.py save --questionnaire /path/to/questionnaire.yml --voters 200
+    python bench.py yaml --questionnaire /path/to/questionnaire.yml
+    python bench.py matrix --questionnaire /path/to/questionnaire.yml --votes 100000
+    python bench.py login --questionnaire /path/to/questionnaire.yml --voters 500
+
+Everything runs in-process, through the Flask test client and the mock login. DATABASE_URL defaults to a new
+temporary SQLite database; point it to a PostgreSQL database to get numbers closer to production.
+"""
+import argparse
+import collections
+import os
+import pathlib
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class QueryCounter:
+    """Counts the statements sent to the database (an executemany counts once, like the round trip it is).
+
+    ``count`` is per thread, so concurrent requests served in other threads don't get mixed up.
+    """
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self._local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+
+    @property
+    def count(self):
+        return getattr(self._local, 'count', 0)
+
+    def _before_cursor_execute(self, *args, **kwargs):
+        self._local.count = self.count + 1
+
+
+def setup_environment(args):
+    os.environ['MOCK'] = '1'
+    os.environ.setdefault('FLASK_SECRET_KEY', 'bench')
+    os.environ['QUESTIONNAIRE_URL'] = pathlib.Path(args.questionnaire).resolve().as_uri()
+    if 'DATABASE_URL' not in os.environ:
+        database_file = pathlib.Path(tempfile.mkdtemp()) / 'bench.sqlite'
+        os.environ['DATABASE_URL'] = 'sqlite:///' + str(database_file)
+    os.environ.pop('RECAPTCHA_SECRET', None)
+
+
+def import_app():
+    """The app module, with its database set up (like ``flask upgrade-db`` does)."""
+    import app
+    with app.app.app_context():
+        app.upgrade_database()
+    return app
+
+
+def login(client, user_id):
+    with client.session_transaction() as flask_session:
+        flask_session['me'] = {'id': user_id, 'name': user_id, 'created_utc': 0}
+
+
+def report(title, timings, queries, answers):
+    print(f'{title}: {len(timings)} submissions')
+    print(f'  queries/submission: mean {statistics.mean(queries):.1f}, max {max(queries)}')
+    print(f'  answers/submission: mean {statistics.mean(answers):.1f}')
+    print(f'  latency (ms): p50 {percentile(timings, 50):.2f}, p95 {percentile(timings, 95):.2f}, '
+          f'p99 {percentile(timings, 99):.2f}')
+
+
+def bench_save(args):
+    import logging
+    logging.disable(logging.INFO)
+    app = import_app()
+    import mock
+
+    rng = random.Random(args.seed)
+    with app.app.app_context():
+        counter = QueryCounter(app.model.db.engine)
+    with app.app.test_request_context():
+        app.g.survey = app.hosted_surveys.default()
+        questionnaire = app.read_questionnaire()
+
+    voters = []
+    for phase in ('first submission', 'resubmission'):
+        timings, queries, answers = [], [], []
+        for voter_number in range(args.voters):
+            if phase == 'first submission':
+                client = app.app.test_client()
+                login(client, f'bench{voter_number}')
+                form = mock.random_answers(questionnaire, rng)
+                voters.append((client, form))
+            else:
+                client, previous = voters[voter_number]
+                form = mock.random_answers(questionnaire, rng, previous=previous, change_ratio=args.change_ratio)
+            queries_before = counter.count
+            started = time.perf_counter()
+            response = client.post('/done', data=form)
+            timings.append((time.perf_counter() - started) * 1000)
+            queries.append(counter.count - queries_before)
+            answers.append(sum(1 for field in form if field.startswith('q_')))
+            if response.status_code != 200:
+                raise SystemExit(f'/done returned {response.status_code}')
+        report(phase, timings, queries, answers)
+
+
+def timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def bench_yaml(args):
+    import pickle
+    import ruamel.yaml.main
+    import questionnaire
+    import yaml_wrapper
+
+    text = pathlib.Path(args.questionnaire).read_text(encoding='utf8')
+    c_loader = 'C' if ruamel.yaml.main.CParser is not None else 'pure Python, ruamel.yaml.clib is not installed'
+    print(f'{args.questionnaire}: {len(text) / 1024:.0f} KB, {len(yaml_wrapper.load_all(text))} documents '
+          f'(safe loader: {c_loader})')
+    compiled = pickle.dumps(questionnaire.compile_questionnaire(text), protocol=pickle.HIGHEST_PROTOCOL)
+    paths = (
+        ('round-trip loader', lambda: questionnaire.Questionnaire(yaml_wrapper.yaml.load_all(text))),
+        ('safe loader', lambda: questionnaire.Questionnaire(yaml_wrapper.load_all(text))),
+        ('compiled cache', lambda: pickle.loads(compiled)),
+    )
+    for title, function in paths:
+        timings = timed(function, args.repeat)
+        print(f'  {title}: p50 {percentile(timings, 50):.2f} ms, min {min(timings):.2f} ms')
+
+
+def insert_random_votes(app, questionnaire, count, rng, batch_size=1000, survey_id=None):
+    """Store ``count`` random votes directly (bypassing /done, which would take far too long for 100k votes)."""
+    import datetime
+    import mock
+    from sqlalchemy import func, insert
+    from questionnaire import parse_code
+
+    model = app.model
+    if survey_id is None:
+        survey_id = model.DEFAULT_SURVEY_ID
+    started = datetime.datetime.utcnow() - datetime.timedelta(seconds=count)
+    next_vote_id = (model.db.session.query(func.max(model.Vote.vote_id)).scalar() or 0) + 1
+    stored_shard, stored_version = model.bump_data_version(survey_id)
+    for batch_start in range(0, count, batch_size):
+        votes, answers = [], []
+        for number in range(batch_start, min(count, batch_start + batch_size)):
+            vote_id = next_vote_id + number
+            votes.append(dict(vote_id=vote_id, survey_id=survey_id, user_hash=f'bench{vote_id}',
+                              datestamp=started + datetime.timedelta(seconds=number), stored_shard=stored_shard,
+                              stored_version=stored_version))
+            form = mock.random_answers(questionnaire, rng)
+            answers.extend(dict(vote_id=vote_id, survey_id=survey_id, code=code, answer_value=value,
+                                question_number=question_number, question_suffix=question_suffix)
+                           for code, value in form.items() if code.startswith('q_') and value
+                           for question_number, question_suffix in [parse_code(code)])
+        model.db.session.execute(insert(model.Vote), votes)
+        model.db.session.execute(insert(model.Answer), answers)
+    model.rebuild_tallies()
+    model.db.session.commit()
+
+
+def bench_matrix(args):
+    import datetime
+    import logging
+    import tracemalloc
+    logging.disable(logging.INFO)
+    app = import_app()
+    import crosstab
+    import export
+    from vote_matrix import VoteMatrix
+
+    rng = random.Random(args.seed)
+    with app.app.test_request_context():
+        app.g.survey = app.hosted_surveys.default()
+        questionnaire = app.read_questionnaire()
+        started = time.perf_counter()
+        insert_random_votes(app, questionnaire, args.votes, rng)
+        print(f'{args.votes} random votes stored in {time.perf_counter() - started:.1f} s')
+
+        survey_id = app.g.survey.survey_id
+        matrix = VoteMatrix(survey_id)
+        started = time.perf_counter()
+        matrix.refresh(force=True)
+        elapsed = time.perf_counter() - started
+        kinds = collections.Counter(type(column).__name__.strip('_').lower() for column in matrix.columns.values())
+        print(f'matrix: {len(matrix)} votes, {len(matrix.columns)} codes '
+              f'({", ".join(f"{count} {kind}" for kind, count in sorted(kinds.items()))}), built in {elapsed:.1f} s')
+        tracemalloc.start()
+        copy = VoteMatrix(survey_id)
+        copy.refresh(force=True)
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del copy
+        print(f'  memory: {allocated / 1024 ** 2:.1f} MB allocated ({allocated / len(matrix):.0f} bytes/vote), '
+              f'{matrix.nbytes() / 1024 ** 2:.1f} MB reported by nbytes()')
+        kind_bytes = collections.Counter()
+        for column in matrix.columns.values():
+            kind_bytes[type(column).__name__.strip('_').lower()] += column.nbytes()
+        print('  by kind: ' + ', '.join(f'{kind} {size / len(matrix):.1f} bytes/vote'
+                                        for kind, size in sorted(kind_bytes.items())))
+
+        # incremental refresh: a few resubmissions
+        changed = rng.sample(range(1, len(matrix) + 1), min(100, len(matrix)))
+        stored_shard, stored_version = app.model.bump_data_version(survey_id)
+        for vote in app.model.Vote.query.filter(app.model.Vote.vote_id.in_(changed)):
+            vote.datestamp = datetime.datetime.utcnow()
+            vote.stored_shard, vote.stored_version = stored_shard, stored_version
+        app.model.db.session.commit()
+        timings = timed(lambda: matrix.refresh(force=True), 1)
+        print(f'  refresh after {len(changed)} resubmissions: {timings[0]:.1f} ms')
+
+        database_counts = {(code, value): count for _, code, value, count, _, _ in app.model.counted_answers(survey_id)}
+        assert matrix.counts() == database_counts, 'matrix counts differ from the database'
+        paths = [('all answer counts', lambda: app.model.counted_answers(survey_id).all(), matrix.counts)]
+        # cross-tabulating free text is pointless, and very slow in the database
+        questions = [question['id'] for question in questionnaire.pure_questions
+                     if question['kind'] not in ('text', 'textarea')]
+        row_question, column_question = rng.sample(questions, 2)
+        filter_code, filter_value = next(iter(database_counts))
+        for filters in ({}, {filter_code: (filter_value,)}):
+            assert matrix.count_matrix(row_question, column_question, filters) == crosstab.count_matrix(
+                survey_id, row_question, column_question, filters), 'matrix cross-tabulation differs from the database'
+            paths.append((f'crosstab {row_question} x {column_question}' + (' (filtered)' if filters else ''),
+                          lambda filters=filters: crosstab.count_matrix(
+                              survey_id, row_question, column_question, filters),
+                          lambda filters=filters: matrix.count_matrix(row_question, column_question, filters)))
+        codes = export.answer_codes(survey_id)
+        paths.append(('votes export', lambda: sum(1 for _ in export.vote_rows(survey_id, codes)),
+                      lambda: sum(1 for _ in matrix.vote_rows(codes))))
+        for title, database_function, matrix_function in paths:
+            database_timings = timed(database_function, args.repeat)
+            matrix_timings = timed(matrix_function, args.repeat)
+            print(f'  {title}: database p50 {percentile(database_timings, 50):.1f} ms, '
+                  f'matrix p50 {percentile(matrix_timings, 50):.1f} ms')
+
+
+def bench_login(args):
+    os.environ['MOCK_OAUTH'] = '1'
+    os.environ.setdefault('REDDIT_OAUTH_REDIRECT_URL', 'http://localhost/authorize_callback')
+    os.environ.setdefault('MOCK_OAUTH_LATENCY_MS', str(args.latency))
+    import logging
+    logging.disable(logging.INFO)
+    app = import_app()
+
+    timings = []
+    for voter_number in range(args.voters):
+        client = app.app.test_client()
+        started = time.perf_counter()
+        # / -> the authorize URL of the stand-in -> /authorize_callback -> /home
+        response = client.get('/')
+        response = client.get(response.headers['Location'] + f'&id=bench{voter_number}&name=bench{voter_number}')
+        response = client.get(response.headers['Location'])
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 302 or '/home' not in response.headers['Location']:
+            raise SystemExit(f'/authorize_callback returned {response.status_code}')
+    print(f'login: {len(timings)} voters, stand-in latency {os.environ["MOCK_OAUTH_LATENCY_MS"]} ms per call')
+    print(f'  latency (ms): p50 {percentile(timings, 50):.2f}, p95 {percentile(timings, 95):.2f}, '
+          f'p99 {percentile(timings, 99):.2f}')
+    print(f'  upstream calls: {app.http.stats()}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    save_parser = subparsers.add_parser('save', help='POST /done: queries and latency per submission')
+    save_parser.add_argument('--questionnaire', required=True, help='questionnaire YAML file')
+    save_parser.add_argument('--voters', type=int, default=200)
+    save_parser.add_argument('--change-ratio', type=float, default=0.3,
+                             help='fraction of the questions that change on resubmission')
+    save_parser.add_argument('--seed', type=int, default=1)
+    save_parser.set_defaults(run=bench_save)
+
+    yaml_parser = subparsers.add_parser('yaml', help='loading the questionnaire: YAML loaders and compiled cache')
+    yaml_parser.add_argument('--questionnaire', required=True, help='questionnaire YAML file')
+    yaml_parser.add_argument('--repeat', type=int, default=5)
+    yaml_parser.set_defaults(run=bench_yaml)
+
+    matrix_parser = subparsers.add_parser('matrix', help='in-memory vote matrix: memory use and query times')
+    matrix_parser.add_argument('--questionnaire', required=True, help='questionnaire YAML file')
+    matrix_parser.add_argument('--votes', type=int, default=100000)
+    matrix_parser.add_argument('--repeat', type=int, default=5)
+    matrix_parser.add_argument('--seed', type=int, default=1)
+    matrix_parser.set_defaults(run=bench_matrix)
+
+    login_parser = subparsers.add_parser('login', help='reddit login through the OAuth stand-in: latency per login')
+    login_parser.add_argument('--questionnaire', required=True, help='questionnaire YAML file')
+    login_parser.add_argument('--voters', type=int, default=500)
+    login_parser.add_argument('--latency', type=int, default=0, help='milliseconds added to every OAuth call')
+    login_parser.set_defaults(run=bench_login)
+
+    args = parser.parse_args()
+    setup_environment(args)
+    args.run(args)
+
+
+if __name__ == '__main__':
+    main()
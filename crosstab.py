@@ -0,0 +1,143 @@
+"""Cross-tabulation of the answers to two questions, among the votes that match some filters.
+
+Every vote counts once in each (row, column) cell it has answers for, so for questions with several answers per vote
+(checkboxes, trees, scale matrices) the totals can be higher than the number of votes.
+"""
+import hashlib
+import json
+
+import sqlalchemy
+from sqlalchemy import and_, func
+
+import model
+from questionnaire import parse_code
+
+CACHE_TIMEOUT = 300
+
+
+class CrosstabError(ValueError):
+    pass
+
+
+def parse_filters(values):
+    """``['q_3:yes', 'q_3:maybe', 'q_5_1:2']`` to ``{'q_3': ('maybe', 'yes'), 'q_5_1': ('2',)}``.
+
+    Values of the same code are alternatives, different codes must all match.
+    """
+    filters = {}
+    for value in values:
+        code, separator, answer_value = value.partition(':')
+        if parse_code(code)[0] is None:
+            raise CrosstabError(f'Not an answer code: {code!r}')
+        if not separator:
+            raise CrosstabError(f'Filter {value!r} should look like code:value')
+        filters.setdefault(code, set()).add(answer_value)
+    return {code: tuple(sorted(answer_values)) for code, answer_values in sorted(filters.items())}
+
+
+def _question(questionnaire, question_number):
+    try:
+        return questionnaire.by_id[int(question_number)]
+    except (KeyError, ValueError, TypeError):
+        raise CrosstabError(f'No such question: {question_number!r}')
+
+
+def _codes(survey_id, question_number):
+    return [code for code, in model.db.session.query(model.AnswerTally.code).filter(
+        model.AnswerTally.survey_id == survey_id, model.AnswerTally.question_number == question_number,
+        model.AnswerTally.vote_count > 0).distinct()]
+
+
+def count_matrix(survey_id, row_question, column_question, filters):
+    """``{(row code, row value, column code, column value): votes}``, with one grouped self-join of the answers.
+
+    Only the row answers are filtered by survey: the other answers of a vote belong to the same survey, and they have to
+    be looked up through the vote_id index (filtering them by survey_id too makes SQLite pick the code index instead).
+    """
+    row_answer = sqlalchemy.orm.aliased(model.Answer)
+    column_answer = sqlalchemy.orm.aliased(model.Answer)
+    query = model.db.session.query(
+        row_answer.code, row_answer.answer_value, column_answer.code, column_answer.answer_value,
+        func.count()).join(
+        column_answer, column_answer.vote_id == row_answer.vote_id).filter(
+        row_answer.survey_id == survey_id, row_answer.code.in_(_codes(survey_id, row_question)),
+        column_answer.code.in_(_codes(survey_id, column_question)))
+    for code, answer_values in filters.items():
+        filter_answer = sqlalchemy.orm.aliased(model.Answer)
+        query = query.filter(sqlalchemy.exists().where(and_(
+            filter_answer.vote_id == row_answer.vote_id, filter_answer.code == code,
+            filter_answer.answer_value.in_(answer_values))))
+    query = query.group_by(row_answer.code, row_answer.answer_value, column_answer.code, column_answer.answer_value)
+    return {tuple(row[:4]): row[4] for row in query}
+
+
+def _category(code, answer_value, question, questionnaire, expand_question):
+    """``(key, sort key, label)`` of an answer, with the labels of the results page (None to skip it)."""
+    question_number, question_suffix = parse_code(code)
+    expanded = expand_question((code, answer_value, None, question_number, question_suffix), questionnaire)
+    if expanded is None:
+        return None
+    value = expanded['answer_value']
+    label = expanded['answer_path'] or expanded['answer_text']
+    if value == 'Other':
+        label = 'Other'
+    elif not label or label.startswith('\0'):
+        label = str(value)
+    if expanded['question_text'] != question['title']:
+        # a line of a scale matrix
+        label = expanded['question_text'][len(question['title']) + 2:] + ': ' + label
+    choices = list(question.get('choices') or ())
+    if question['kind'] in ('tree', 'checktree'):
+        choices = list(questionnaire.tree_choices[question['id']])
+    choice_order = choices.index(value) if value in choices else len(choices)
+    return (code, value), (expanded['sort_order'], choice_order, label), label
+
+
+def crosstab(survey_id, questionnaire, expand_question, row_question_number, column_question_number, filters,
+             vote_matrix=None):
+    """The count matrix of two questions of a survey, as a JSON-serializable dict.
+
+    The votes are counted in ``vote_matrix`` (see vote_matrix.py, the one of the survey) when given, in the database
+    otherwise.
+    """
+    row_question = _question(questionnaire, row_question_number)
+    column_question = _question(questionnaire, column_question_number)
+    if vote_matrix is not None:
+        counts = vote_matrix.count_matrix(row_question['id'], column_question['id'], filters)
+    else:
+        counts = count_matrix(survey_id, row_question['id'], column_question['id'], filters)
+
+    axes = []
+    for question, position in ((row_question, 0), (column_question, 2)):
+        categories = {}
+        for key in counts:
+            code, answer_value = key[position:position + 2]
+            category = _category(code, answer_value, question, questionnaire, expand_question)
+            if category is not None:
+                categories.setdefault(category[0], category[1:])
+        ordered = sorted(categories.items(), key=lambda item: item[1][0])
+        axes.append(([category_key for category_key, _ in ordered], dict(
+            question=question['id'], title=question['title'], kind=question['kind'],
+            categories=[dict(code=code, value=value, label=label) for (code, value), (_, label) in ordered])))
+
+    (row_keys, rows), (column_keys, columns) = axes
+    row_index = {key: index for index, key in enumerate(row_keys)}
+    column_index = {key: index for index, key in enumerate(column_keys)}
+    matrix = [[0] * len(column_keys) for _ in row_keys]
+    for (row_code, row_value, column_code, column_value), votes in counts.items():
+        row = _category(row_code, row_value, row_question, questionnaire, expand_question)
+        column = _category(column_code, column_value, column_question, questionnaire, expand_question)
+        if row is not None and column is not None:
+            matrix[row_index[row[0]]][column_index[column[0]]] += votes
+    return dict(
+        rows=rows, columns=columns,
+        filters=[dict(code=code, values=list(answer_values)) for code, answer_values in filters.items()],
+        counts=matrix,
+        row_totals=[sum(row) for row in matrix],
+        column_totals=[sum(column) for column in zip(*matrix)] if matrix else [0] * len(column_keys))
+
+
+def cache_key(survey_id, questionnaire, row_question_number, column_question_number, filters, data_version):
+    query = json.dumps([survey_id, questionnaire.content_hash, row_question_number, column_question_number, filters,
+                        data_version], default=str)
+    return 'crosstab/' + hashlib.sha256(query.encode('utf8')).hexdigest()
@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+
+import model
+from questionnaire import parse_code
+
+RESULT_FIELDS = ('question_number', 'question_code', 'kind', 'question_text', 'answer_value', 'answer_text',
+                 'answer_path', 'vote_count')
+EXPORT_BATCH_SIZE = 1000
+CHUNK_SIZE = 64 * 1024
+# spreadsheets take the cells starting with these for formulas, and a voter's text must not run as one
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def results_rows(expanded_results):
+    for result in expanded_results:
+        row = {field: result[field] for field in RESULT_FIELDS}
+        if row['answer_text'] == '\0':
+            row['answer_text'] = None
+        yield row
+
+
+def answer_codes(survey_id):
+    """All the codes of a survey that have been answered at least once, in questionnaire order."""
+    codes = {code for code, in model.db.session.query(model.AnswerTally.code).filter(
+        model.AnswerTally.survey_id == survey_id, model.AnswerTally.vote_count > 0).distinct()}
+
+    def sort_key(code):
+        question_number, question_suffix = parse_code(code)
+        # malformed codes go last
+        return question_number is None, question_number or 0, question_suffix or '', code
+
+    return sorted(codes, key=sort_key)
+
+
+def vote_rows(survey_id, codes):
+    """One dict per vote (vote_id, datestamp and one key per answer code), read through a server-side cursor."""
+    query = model.db.session.query(
+        model.Vote.vote_id, model.Vote.datestamp, model.Answer.code, model.Answer.answer_value).outerjoin(
+        model.Answer, model.Answer.vote_id == model.Vote.vote_id).filter(model.Vote.survey_id == survey_id).order_by(
+        model.Vote.vote_id).execution_options(stream_results=True).yield_per(EXPORT_BATCH_SIZE)
+    empty_row = dict.fromkeys(codes)
+    row = None
+    for vote_id, datestamp, code, answer_value in query:
+        if row is None or row['vote_id'] != vote_id:
+            if row is not None:
+                yield row
+            row = dict(vote_id=vote_id, datestamp=datestamp.isoformat() if datestamp else None, **empty_row)
+        if code in row:
+            row[code] = answer_value
+    if row is not None:
+        yield row
+
+
+def csv_cell(value):
+    """``value``, with a ``'`` in front if a spreadsheet would read it as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def as_csv(fields, rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({field: csv_cell(value) for field, value in row.items()})
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def as_ndjson(fields, rows):
+    chunk = []
+    chunk_size = 0
+    for row in rows:
+        line = json.dumps(row, ensure_ascii=False) + '\n'
+        chunk.append(line)
+        chunk_size += len(line)
+        if chunk_size >= CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+            chunk_size = 0
+    yield ''.join(chunk)
+
+
+FORMATS = {
+    'csv': (as_csv, 'text/csv'),
+    'ndjson': (as_ndjson, 'application/x-ndjson'),
+}
@@ -0,0 +1,24 @@
+# gunicorn reads this file on start, before loading the app (even with --preload).
+#
+# With ASYNC_WORKERS=1 every worker serves many requests at once with gevent: the calls to reddit (login), reCAPTCHA
+# and the wiki wait without holding a worker, so a burst of logins is no longer capped by the number of workers.
+# Database work still goes through the bounded connection pool (DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW).
+# sqlite3 is not patched: the writes (and fsyncs) of SUBMISSION_JOURNAL and of a SESSION_STORE file block every
+# request of the worker while they last, so prefer SESSION_STORE=cache here, and a fast local disk for the journal.
+import os
+
+if os.getenv('ASYNC_WORKERS') == '1':
+    # everything (sockets, threads, locks, sleeps) must be patched before the app and its libraries are imported
+    from gevent import monkey
+
+    monkey.patch_all()
+    try:
+        # psycopg2 is a C extension: without this, every query would block the whole worker
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        pass
+    else:
+        patch_psycopg()
+
+    worker_class = 'gevent'
+    worker_connections = int(os.getenv('WORKER_CONNECTIONS', '500'))
@@ -0,0 +1,152 @@
+"""Shared outbound HTTP client.
+
+Every upstream service (reCAPTCHA, the reddit wiki, ...) is registered once as a named endpoint, with its own
+connection pool, timeouts, retry policy and circuit breaker. All calls go through one ``requests.Session``, so
+connections are kept alive between requests instead of paying a new TCP+TLS handshake each time.
+"""
+import collections
+import io
+import json
+import threading
+import time
+
+import requests
+import requests.adapters
+from urllib3.util.retry import Retry
+
+
+class UpstreamUnavailable(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """Stops calling an upstream after ``failure_threshold`` consecutive failures.
+
+    After ``reset_after`` seconds one trial call is let through; if it succeeds the breaker closes again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_after=30):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        return 'half-open' if time.monotonic() - self.opened_at >= self.reset_after else 'open'
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_after:
+                # let one trial call through, and keep the rest out until it reports back
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class Endpoint:
+    def __init__(self, name, url, timeout, breaker):
+        self.name = name
+        self.url = url
+        self.timeout = timeout
+        self.breaker = breaker
+        self.stats = collections.Counter()
+        self.seconds = 0.0
+
+
+class StandInAdapter(requests.adapters.BaseAdapter):
+    """Answers requests in-process with ``handler(request) -> (status_code, json_body)``, instead of the network.
+
+    Used to replace an upstream with a local stand-in, e.g. for load tests.
+    """
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+
+    def send(self, request, **kwargs):
+        status_code, body = self.handler(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers['Content-Type'] = 'application/json'
+        response.raw = io.BytesIO(json.dumps(body).encode('utf8'))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class HttpClient:
+    def __init__(self, user_agent):
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = user_agent
+        self.endpoints = {}
+
+    def register(self, name, url, timeout=(3.05, 10), retries=2, idempotent=True, pool_size=10,
+                 failure_threshold=5, reset_after=30):
+        """Register an upstream. ``timeout`` is ``(connect, read)`` seconds, as in requests.
+
+        Non-idempotent endpoints are only retried when the connection could not be made at all.
+        """
+        retry = Retry(
+            total=retries, connect=retries, read=retries if idempotent else 0, status=retries if idempotent else 0,
+            backoff_factor=0.2, status_forcelist=(502, 503, 504) if idempotent else (), raise_on_status=False)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount(url, adapter)
+        self.endpoints[name] = Endpoint(name, url, timeout, CircuitBreaker(failure_threshold, reset_after))
+
+    def stand_in(self, name, handler):
+        """Serve endpoint ``name`` with a local stand-in (see StandInAdapter)."""
+        self.session.mount(self.endpoints[name].url, StandInAdapter(handler))
+
+    def request(self, name, method, url=None, **kwargs):
+        endpoint = self.endpoints[name]
+        if not endpoint.breaker.allow():
+            endpoint.stats['rejected'] += 1
+            raise UpstreamUnavailable(f'{name}: circuit open')
+        kwargs.setdefault('timeout', endpoint.timeout)
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url or endpoint.url, **kwargs)
+        except requests.RequestException as e:
+            endpoint.stats['failures'] += 1
+            endpoint.breaker.record_failure()
+            raise UpstreamUnavailable(f'{name}: {e}') from e
+        finally:
+            endpoint.stats['requests'] += 1
+            endpoint.seconds += time.perf_counter() - started
+        if response.status_code >= 500:
+            endpoint.stats['failures'] += 1
+            endpoint.breaker.record_failure()
+        else:
+            endpoint.breaker.record_success()
+        return response
+
+    def get(self, name, url=None, **kwargs):
+        return self.request(name, 'GET', url, **kwargs)
+
+    def post(self, name, url=None, **kwargs):
+        return self.request(name, 'POST', url, **kwargs)
+
+    def stats(self):
+        return {
+            name: dict(endpoint.stats, seconds=round(endpoint.seconds, 3), circuit=endpoint.breaker.state)
+            for name, endpoint in self.endpoints.items()}
@@ -0,0 +1,154 @@
+"""Request timings, query counts and template render times for ``/metrics``, and sampled profiles of slow requests.
+
+Profiling is off by default. With ``PROFILE_SAMPLE_RATE`` set (a fraction of the requests, e.g. ``0.01``), sampled
+requests run under pyinstrument (when installed) or cProfile, and the profile is written to ``PROFILE_DIR`` if the
+request took longer than ``PROFILE_SLOW_MS``.
+"""
+import cProfile
+import logging
+import os
+import pathlib
+import random
+import threading
+import time
+
+import jinja2
+from flask import request
+from sqlalchemy import event
+
+from metrics import registry
+
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+REQUEST_SECONDS = registry.histogram('questionnaire_request_seconds', 'Time spent serving requests, by endpoint.')
+REQUESTS = registry.counter('questionnaire_requests_total', 'Requests served, by endpoint and status.')
+ERRORS = registry.counter('questionnaire_errors_total', 'Unhandled exceptions, by endpoint and exception type.')
+PHASE_SECONDS = registry.histogram('questionnaire_phase_seconds', 'Time spent in each phase of a request.')
+QUERY_SECONDS = registry.histogram('questionnaire_db_query_seconds', 'Time spent in database statements.')
+QUERIES_PER_REQUEST = registry.histogram(
+    'questionnaire_db_queries_per_request', 'Database statements per request, by endpoint.', QUERY_COUNT_BUCKETS)
+TEMPLATE_SECONDS = registry.histogram('questionnaire_template_render_seconds', 'Time spent rendering templates.')
+CACHE_REQUESTS = registry.counter('questionnaire_cache_requests_total', 'Cache lookups, by cache and result.')
+REJECTED_FIELDS = registry.counter(
+    'questionnaire_rejected_fields_total', 'Submitted answer fields dropped or cut by the validator, by reason.')
+PROFILES = registry.counter('questionnaire_profiles_total', 'Sampled request profiles, by outcome.')
+
+_local = threading.local()
+_profiling = threading.Lock()
+
+
+def phase(name):
+    """``with phase('recaptcha'): ...`` times one step of a request."""
+    return PHASE_SECONDS.time(phase=name)
+
+
+class TimedTemplate(jinja2.Template):
+    def render(self, *args, **kwargs):
+        with TEMPLATE_SECONDS.time(template=self.name or '<string>'):
+            return super().render(*args, **kwargs)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _local.query_started = time.perf_counter()
+    _local.queries = getattr(_local, 'queries', 0) + 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(_local, 'query_started', None)
+    if started is not None:
+        QUERY_SECONDS.observe(time.perf_counter() - started)
+        _local.query_started = None
+
+
+class Profiler:
+    def __init__(self, directory, slow_after):
+        self.directory = pathlib.Path(directory)
+        self.slow_after = slow_after
+        self.profiler = pyinstrument.Profiler() if pyinstrument else cProfile.Profile()
+        self.profiler.start() if pyinstrument else self.profiler.enable()
+
+    def stop(self):
+        self.profiler.stop() if pyinstrument else self.profiler.disable()
+
+    def finish(self, elapsed):
+        self.stop()
+        if elapsed < self.slow_after:
+            PROFILES.inc(outcome='fast')
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = f'{time.strftime("%Y%m%d-%H%M%S")}-{request.endpoint}-{int(elapsed * 1000)}ms-{os.getpid()}'
+        if pyinstrument:
+            path = self.directory / (stem + '.html')
+            path.write_text(self.profiler.output_html(), encoding='utf8')
+        else:
+            path = self.directory / (stem + '.prof')
+            self.profiler.dump_stats(path)
+        PROFILES.inc(outcome='saved')
+        logger.info('Slow request to %s (%.0f ms), profile saved to %s', request.path, elapsed * 1000, path)
+
+
+def init_app(app, engine):
+    sample_rate = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+    slow_after = float(os.getenv('PROFILE_SLOW_MS', '500')) / 1000
+    profile_dir = os.getenv('PROFILE_DIR', 'profiles')
+
+    app.jinja_env.template_class = TimedTemplate
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+    pool = engine.pool
+    if hasattr(pool, 'checkedout'):
+        registry.gauge('questionnaire_db_pool_connections', 'Database connections of this worker, in use or idle.',
+                       lambda: {(('state', 'in_use'),): pool.checkedout(), (('state', 'idle'),): pool.checkedin()})
+
+    @app.before_request
+    def start_request():
+        _local.request_started = time.perf_counter()
+        _local.queries = 0
+        _local.profiler = None
+        # only one request is profiled at a time: profilers don't nest, and it keeps the overhead bounded
+        if sample_rate and random.random() < sample_rate and _profiling.acquire(blocking=False):
+            try:
+                _local.profiler = Profiler(profile_dir, slow_after)
+            except Exception:
+                _profiling.release()
+                logger.exception('Could not start the profiler')
+
+    @app.after_request
+    def finish_request(response):
+        started = getattr(_local, 'request_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        endpoint = request.endpoint or 'none'
+        REQUEST_SECONDS.observe(elapsed, endpoint=endpoint)
+        REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+        QUERIES_PER_REQUEST.observe(_local.queries, endpoint=endpoint)
+        _local.request_started = None
+        if _local.profiler is not None:
+            try:
+                _local.profiler.finish(elapsed)
+            except Exception:
+                logger.exception('Could not save the profile')
+            finally:
+                _local.profiler = None
+                _profiling.release()
+        return response
+
+    @app.teardown_request
+    def release_profiler(exception):
+        # after_request is skipped when the request fails without a response
+        if getattr(_local, 'profiler', None) is not None:
+            _local.profiler.stop()
+            _local.profiler = None
+            _profiling.release()
+
+
+def record_error(error):
+    ERRORS.inc(endpoint=request.endpoint or 'none', type=type(error).__name__)
@@ -0,0 +1,239 @@
+"""Durable write-behind queue for submissions.
+
+With ``SUBMISSION_JOURNAL`` set, ``/done`` only appends the submission to a local SQLite database (in WAL mode, synced
+on every commit) and answers right away. A writer thread in every worker drains the journal into the main database,
+in batches, with one transaction per batch. Entries are only removed from the journal once their batch is committed,
+so submissions survive both a database outage and a crashed worker: claims older than ``claim_timeout`` seconds are
+taken over by the next writer.
+
+Receipts (user ids) and votes (user hashes) are queued in separate tables, like they are stored in the main database,
+both keyed by survey. Receipts have no timestamp and are kept in user id order, so that nothing in the journal links a
+user to a vote.
+"""
+import collections
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# entries queued before there were several surveys belong to the default one (model.DEFAULT_SURVEY_ID)
+DEFAULT_SURVEY_ID = 1
+
+RECEIPTS = '''
+CREATE TABLE {if_not_exists} receipts (
+    survey_id INTEGER NOT NULL,
+    user_id TEXT NOT NULL,
+    claimed_at REAL,
+    PRIMARY KEY (survey_id, user_id)
+) WITHOUT ROWID;
+'''
+
+SCHEMA = RECEIPTS.format(if_not_exists='IF NOT EXISTS') + '''
+CREATE TABLE IF NOT EXISTS votes (
+    entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    survey_id INTEGER NOT NULL,
+    user_hash TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    queued_at REAL NOT NULL,
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_votes_survey_id_user_hash ON votes (survey_id, user_hash, entry_id);
+'''
+
+# journals written before surveys: receipts get a new primary key (so the table is copied), votes a new column
+UPGRADE = f'''
+ALTER TABLE receipts RENAME TO receipts_old;
+{RECEIPTS.format(if_not_exists='')}
+INSERT INTO receipts SELECT {DEFAULT_SURVEY_ID}, user_id, claimed_at FROM receipts_old;
+DROP TABLE receipts_old;
+ALTER TABLE votes ADD COLUMN survey_id INTEGER NOT NULL DEFAULT {DEFAULT_SURVEY_ID};
+DROP INDEX IF EXISTS ix_votes_user_hash;
+'''
+
+# journals whose receipts had a queued_at (the same as that of the vote queued with them)
+UPGRADE_RECEIPTS = f'''
+ALTER TABLE receipts RENAME TO receipts_old;
+{RECEIPTS.format(if_not_exists='')}
+INSERT INTO receipts SELECT survey_id, user_id, claimed_at FROM receipts_old;
+DROP TABLE receipts_old;
+'''
+
+
+class SubmissionJournal:
+    def __init__(self, path, store, batch_size=200, claim_timeout=300, retry_after=1, max_retry_after=30):
+        """``store(receipts, votes)`` writes (and commits) a batch to the main database; ``receipts`` is a list of
+        ``(survey_id, user_id)`` and ``votes`` of ``(survey_id, user_hash, answers, queued_at)``.
+        """
+        self.path = path
+        self.store = store
+        self.batch_size = batch_size
+        self.claim_timeout = claim_timeout
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self.stats = collections.Counter()
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._wakeup = threading.Event()
+        self._writer_pid = None
+        self._writer_lock = threading.Lock()
+        connection = self._connect()
+        connection.execute('PRAGMA journal_mode=WAL')
+        receipt_columns = {row[1] for row in connection.execute('PRAGMA table_info(receipts)')}
+        if receipt_columns and 'survey_id' not in receipt_columns:
+            logger.info('Adding survey ids to the journal %s', path)
+            connection.executescript(f'BEGIN IMMEDIATE; {UPGRADE} COMMIT;')
+        elif 'queued_at' in receipt_columns:
+            logger.info('Removing the receipt timestamps of the journal %s', path)
+            connection.executescript(f'BEGIN IMMEDIATE; {UPGRADE_RECEIPTS} COMMIT;')
+        connection.executescript(SCHEMA)
+
+    def _connect(self):
+        """The connection of the current thread (in autocommit mode: reads see the latest committed data)."""
+        if self._pid != os.getpid():
+            # connections must not be shared with a forked child
+            self._local = threading.local()
+            self._pid = os.getpid()
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA synchronous=FULL')
+            self._local.connection = connection
+        return connection
+
+    def connection(self):
+        return _Transaction(self._connect())
+
+    def enqueue(self, survey_id, user_id, user_hash, answers):
+        """Queue a submission. ``user_id`` is only given for new voters, whose receipt has to be stored too."""
+        with self.connection() as connection:
+            if user_id is not None:
+                connection.execute('INSERT OR IGNORE INTO receipts (survey_id, user_id) VALUES (?, ?)',
+                                   (survey_id, user_id))
+            # an unclaimed older submission of the same voter would be overwritten anyway
+            connection.execute('DELETE FROM votes WHERE survey_id = ? AND user_hash = ? AND claimed_at IS NULL',
+                               (survey_id, user_hash))
+            connection.execute('INSERT INTO votes (survey_id, user_hash, answers, queued_at) VALUES (?, ?, ?, ?)',
+                               (survey_id, user_hash, json.dumps(answers), time.time()))
+        self.stats['queued'] += 1
+        self.start_writer()
+        self._wakeup.set()
+
+    def has_receipt(self, survey_id, user_id):
+        return self._connect().execute('SELECT 1 FROM receipts WHERE survey_id = ? AND user_id = ?',
+                                       (survey_id, user_id)).fetchone() is not None
+
+    def pending_answers(self, survey_id, user_hash):
+        """The answers of the latest queued submission of a voter, or None."""
+        row = self._connect().execute(
+            'SELECT answers FROM votes WHERE survey_id = ? AND user_hash = ? ORDER BY entry_id DESC LIMIT 1',
+            (survey_id, user_hash)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def backlog(self):
+        """Number of queued submissions, and the age in seconds of the oldest one."""
+        count, oldest = self._connect().execute('SELECT count(*), min(queued_at) FROM votes').fetchone()
+        return count, (time.time() - oldest if oldest else 0.0)
+
+    def claim(self):
+        """Claim the next batch: new receipts, and the latest submission of voters not claimed by another writer."""
+        now = time.time()
+        stale = now - self.claim_timeout
+        with self.connection() as connection:
+            receipts = connection.execute(
+                'SELECT survey_id, user_id FROM receipts WHERE claimed_at IS NULL OR claimed_at < ? '
+                'ORDER BY survey_id, user_id LIMIT ?', (stale, self.batch_size)).fetchall()
+            connection.executemany('UPDATE receipts SET claimed_at = ? WHERE survey_id = ? AND user_id = ?',
+                                   [(now, survey_id, user_id) for survey_id, user_id in receipts])
+            votes = connection.execute('''
+                SELECT entry_id, survey_id, user_hash, answers, queued_at FROM votes v
+                WHERE (claimed_at IS NULL OR claimed_at < :stale)
+                  AND entry_id = (
+                    SELECT max(entry_id) FROM votes WHERE survey_id = v.survey_id AND user_hash = v.user_hash)
+                  AND NOT EXISTS (
+                    SELECT 1 FROM votes
+                    WHERE survey_id = v.survey_id AND user_hash = v.user_hash AND claimed_at >= :stale)
+                ORDER BY entry_id LIMIT :limit''', dict(stale=stale, limit=self.batch_size)).fetchall()
+            connection.executemany('UPDATE votes SET claimed_at = ? WHERE entry_id = ?',
+                                   [(now, entry_id) for entry_id, _, _, _, _ in votes])
+        return receipts, votes
+
+    def release(self, receipts, votes):
+        with self.connection() as connection:
+            connection.executemany('UPDATE receipts SET claimed_at = NULL WHERE survey_id = ? AND user_id = ?',
+                                   receipts)
+            connection.executemany('UPDATE votes SET claimed_at = NULL WHERE entry_id = ?',
+                                   [(entry_id,) for entry_id, _, _, _, _ in votes])
+
+    def complete(self, receipts, votes):
+        with self.connection() as connection:
+            connection.executemany('DELETE FROM receipts WHERE survey_id = ? AND user_id = ?', receipts)
+            # older submissions of the same voters are superseded by the ones just stored
+            connection.executemany('DELETE FROM votes WHERE survey_id = ? AND user_hash = ? AND entry_id <= ?',
+                                   [(survey_id, user_hash, entry_id) for entry_id, survey_id, user_hash, _, _ in votes])
+
+    def drain_once(self):
+        """Store one batch. Returns the number of submissions stored."""
+        receipts, votes = self.claim()
+        if not receipts and not votes:
+            return 0
+        try:
+            self.store(receipts, [(survey_id, user_hash, json.loads(answers), queued_at)
+                                  for _, survey_id, user_hash, answers, queued_at in votes])
+        except Exception:
+            self.release(receipts, votes)
+            raise
+        self.complete(receipts, votes)
+        self.stats['stored'] += len(votes)
+        self.stats['batches'] += 1
+        return len(receipts) + len(votes)
+
+    def drain(self):
+        """Store everything that is queued (e.g. before shutting down). Returns the number of batches."""
+        batches = 0
+        while self.drain_once():
+            batches += 1
+        return batches
+
+    def start_writer(self):
+        """Start the writer thread of this process, if it is not running yet (e.g. after a fork)."""
+        if self._writer_pid == os.getpid():
+            return
+        with self._writer_lock:
+            if self._writer_pid == os.getpid():
+                return
+            threading.Thread(target=self.run_writer, name='submission-writer', daemon=True).start()
+            self._writer_pid = os.getpid()
+
+    def run_writer(self):
+        retry_after = self.retry_after
+        while True:
+            try:
+                if self.drain_once():
+                    retry_after = self.retry_after
+                    continue
+            except Exception:
+                self.stats['failed_batches'] += 1
+                logger.exception('Could not store queued submissions, retrying in %s seconds', retry_after)
+                time.sleep(retry_after)
+                retry_after = min(retry_after * 2, self.max_retry_after)
+                continue
+            self._wakeup.wait(self.retry_after)
+            self._wakeup.clear()
+
+
+class _Transaction:
+    """``with journal.connection() as connection:`` runs the block in an immediate (write-locked) transaction."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute('BEGIN IMMEDIATE')
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute('COMMIT' if exc_type is None else 'ROLLBACK')
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Synthetic voter load generator.
+
+Simulates voters going through the whole flow: log in with the mock login, open /home, submit random (but valid)
+answers to /done, come back to change some of them, and (some of them, as testers) look at /results.
+
+    python loadtest.py --questionnaire questionnaire.yml --voters 500 --concurrency 20
+    python loadtest.py --questionnaire questionnaire.yml --url http://localhost:5000 --voters 500
+
+Without ``--url`` everything runs in-process (through the Flask test client, one thread per concurrent voter), which
+also measures the queries per request; DATABASE_URL defaults to a temporary SQLite database. With ``--url`` it drives a
+running server, which must have MOCK=1 (and the same questionnaire, and TESTERS=loadtest_tester to measure /results).
+With ``--oauth-login`` the remote voters log in through the whole reddit OAuth flow instead of the mock login, against
+the OAuth stand-in of mock.py (see "Async workers" in the README).
+
+``--save-baseline file.json`` stores the numbers, and ``--baseline file.json`` compares against stored numbers and
+exits with an error on a regression.
+"""
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import pathlib
+import random
+import sys
+import threading
+import time
+import urllib.parse
+
+import bench
+import mock
+from questionnaire import compile_questionnaire
+
+TESTER_NAME = 'loadtest_tester'
+
+
+class InProcessVoter:
+    def __init__(self, app):
+        self.client = app.app.test_client()
+
+    def login(self, user_id, name):
+        return self.client.get(f'/mock?id={user_id}&name={name}').status_code
+
+    def get(self, path):
+        return self.client.get(path).status_code
+
+    def post(self, path, data):
+        return self.client.post(path, data=data).status_code
+
+
+class RemoteVoter:
+    def __init__(self, base_url, oauth_login=False):
+        import requests
+        self.base_url = base_url.rstrip('/')
+        self.oauth_login = oauth_login
+        self.session = requests.Session()
+
+    def login(self, user_id, name):
+        if not self.oauth_login:
+            return self.session.get(
+                f'{self.base_url}/mock', params=dict(id=user_id, name=name), allow_redirects=False).status_code
+        # / redirects to the authorize URL of the stand-in, which redirects back to /authorize_callback with a code
+        response = self.session.get(self.base_url + '/', allow_redirects=False)
+        if response.status_code != 302:
+            return response.status_code
+        authorize_url = response.headers['Location'] + '&' + urllib.parse.urlencode(dict(id=user_id, name=name))
+        response = self.session.get(authorize_url, allow_redirects=False)
+        if response.status_code != 302:
+            return response.status_code
+        return self.session.get(response.headers['Location'], allow_redirects=False).status_code
+
+    def get(self, path):
+        return self.session.get(self.base_url + path, allow_redirects=False).status_code
+
+    def post(self, path, data):
+        return self.session.post(self.base_url + path, data=data, allow_redirects=False).status_code
+
+
+class Recorder:
+    def __init__(self, query_counter=None):
+        self.query_counter = query_counter
+        self.timings = collections.defaultdict(list)
+        self.queries = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self._lock = threading.Lock()
+
+    def call(self, endpoint, function, *args):
+        queries_before = self.query_counter.count if self.query_counter else 0
+        started = time.perf_counter()
+        status_code = function(*args)
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.timings[endpoint].append(elapsed)
+            if self.query_counter:
+                self.queries[endpoint].append(self.query_counter.count - queries_before)
+            if status_code >= 400:
+                self.errors[endpoint] += 1
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for endpoint, timings in sorted(self.timings.items()):
+            endpoints[endpoint] = dict(
+                requests=len(timings), errors=self.errors[endpoint],
+                p50=round(bench.percentile(timings, 50), 2), p95=round(bench.percentile(timings, 95), 2),
+                p99=round(bench.percentile(timings, 99), 2))
+            if self.queries[endpoint]:
+                endpoints[endpoint]['queries'] = round(sum(self.queries[endpoint]) / len(self.queries[endpoint]), 2)
+        total = sum(len(timings) for timings in self.timings.values())
+        return dict(elapsed=round(elapsed, 2), throughput=round(total / elapsed, 2), endpoints=endpoints)
+
+
+def run_voter(make_voter, recorder, questionnaire, voter_number, args):
+    rng = random.Random(args.seed * 1_000_003 + voter_number)
+    is_tester = rng.random() < args.results_ratio
+    voter = make_voter()
+    recorder.call('login', voter.login, f'loadtest{voter_number}',
+                  TESTER_NAME if is_tester else f'loadtest{voter_number}')
+    form = mock.random_answers(questionnaire, rng)
+    recorder.call('GET /home', voter.get, '/home')
+    recorder.call('POST /done', voter.post, '/done', form)
+    if rng.random() < args.resubmit_ratio:
+        form = mock.random_answers(questionnaire, rng, previous=form, change_ratio=args.change_ratio)
+        recorder.call('GET /home (returning)', voter.get, '/home')
+        recorder.call('POST /done (resubmission)', voter.post, '/done', form)
+    if is_tester:
+        recorder.call('GET /results', voter.get, '/results')
+
+
+def print_summary(summary):
+    print(f"{summary['elapsed']}s, {summary['throughput']} requests/s")
+    print(f"{'endpoint':<28}{'requests':>9}{'errors':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}")
+    for endpoint, numbers in summary['endpoints'].items():
+        print(f"{endpoint:<28}{numbers['requests']:>9}{numbers['errors']:>7}{numbers['p50']:>9}{numbers['p95']:>9}"
+              f"{numbers['p99']:>9}{numbers.get('queries', ''):>9}")
+
+
+def regressions(summary, baseline, tolerance):
+    found = []
+    if summary['throughput'] < baseline['throughput'] * (1 - tolerance):
+        found.append(f"throughput {summary['throughput']} < {baseline['throughput']}")
+    for endpoint, numbers in summary['endpoints'].items():
+        previous = baseline['endpoints'].get(endpoint)
+        if previous is None:
+            continue
+        if numbers['p95'] > previous['p95'] * (1 + tolerance):
+            found.append(f"{endpoint}: p95 {numbers['p95']}ms > {previous['p95']}ms")
+        if 'queries' in numbers and 'queries' in previous and numbers['queries'] > previous['queries'] + 0.5:
+            found.append(f"{endpoint}: {numbers['queries']} queries > {previous['queries']}")
+        if numbers['errors'] > previous['errors']:
+            found.append(f"{endpoint}: {numbers['errors']} errors > {previous['errors']}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--questionnaire', required=True, help='questionnaire YAML file')
+    parser.add_argument('--url', help='base URL of a running server (default: run in-process)')
+    parser.add_argument('--oauth-login', action='store_true',
+                        help='with --url, log in through the OAuth stand-in instead of the mock login')
+    parser.add_argument('--voters', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--resubmit-ratio', type=float, default=0.3, help='fraction of voters that come back')
+    parser.add_argument('--change-ratio', type=float, default=0.3,
+                        help='fraction of the questions that change on resubmission')
+    parser.add_argument('--results-ratio', type=float, default=0.02, help='fraction of voters that open /results')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--save-baseline', metavar='FILE', help='store the numbers in FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare the numbers with FILE')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against the baseline')
+    args = parser.parse_args()
+
+    questionnaire = compile_questionnaire(pathlib.Path(args.questionnaire).read_text(encoding='utf8'))
+    if args.url:
+        recorder = Recorder()
+
+        def make_voter():
+            return RemoteVoter(args.url, args.oauth_login)
+    else:
+        bench.setup_environment(args)
+        os.environ['TESTERS'] = TESTER_NAME
+        import logging
+        logging.disable(logging.INFO)
+        app = bench.import_app()
+        with app.app.app_context():
+            recorder = Recorder(bench.QueryCounter(app.model.db.engine))
+
+        def make_voter():
+            return InProcessVoter(app)
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [executor.submit(run_voter, make_voter, recorder, questionnaire, voter_number, args)
+                   for voter_number in range(args.voters)]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+    summary = recorder.summary(time.perf_counter() - started)
+    summary['parameters'] = dict(voters=args.voters, concurrency=args.concurrency, url=args.url,
+                                 oauth_login=args.oauth_login)
+    print_summary(summary)
+
+    if args.save_baseline:
+        pathlib.Path(args.save_baseline).write_text(json.dumps(summary, indent=2), encoding='utf8')
+    if args.baseline:
+        baseline = json.loads(pathlib.Path(args.baseline).read_text(encoding='utf8'))
+        found = regressions(summary, baseline, args.tolerance)
+        for regression in found:
+            print('REGRESSION:', regression)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
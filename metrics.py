@@ -0,0 +1,131 @@
+"""Minimal in-process metrics, exposed in the Prometheus text format.
+
+Metrics are kept per process: with several gunicorn workers, every scrape of ``/metrics`` sees the numbers of the
+worker that happened to answer it (the first line of the output has its pid).
+"""
+import contextlib
+import os
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _label_text(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n') for _, value in labels)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + '}'
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def header(self):
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def __init__(self, name, documentation):
+        super().__init__(name, documentation)
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def samples(self):
+        with self._lock:
+            return [f'{self.name}{_label_text(key)} {value}' for key, value in sorted(self._values.items())]
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(buckets)
+        self._values = {}
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            state = self._values.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        lines = []
+        with self._lock:
+            for key, (counts, total, observations) in sorted(self._values.items()):
+                for upper_bound, count in zip(self.buckets, counts):
+                    lines.append(f'{self.name}_bucket{_label_text(key + (("le", upper_bound),))} {count}')
+                lines.append(f'{self.name}_bucket{_label_text(key + (("le", "+Inf"),))} {observations}')
+                lines.append(f'{self.name}_sum{_label_text(key)} {total}')
+                lines.append(f'{self.name}_count{_label_text(key)} {observations}')
+        return lines
+
+
+class Gauge(Metric):
+    """Values read when the metrics are collected: ``function()`` returns ``{labels tuple: value}``.
+
+    With ``kind='counter'`` it exposes counts kept elsewhere (e.g. in a ``collections.Counter``).
+    """
+
+    def __init__(self, name, documentation, function, kind='gauge'):
+        super().__init__(name, documentation)
+        self.function = function
+        self.kind = kind
+
+    def samples(self):
+        return [f'{self.name}{_label_text(tuple(sorted(key)))} {value}' for key, value in self.function().items()]
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation):
+        return self.register(Counter(name, documentation))
+
+    def histogram(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, buckets))
+
+    def gauge(self, name, documentation, function, kind='gauge'):
+        return self.register(Gauge(name, documentation, function, kind))
+
+    def render(self):
+        lines = [f'# worker {os.getpid()}']
+        for metric in self.metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
@@ -0,0 +1,142 @@
+"""Schema upgrades for databases created by older versions.
+
+``db.create_all()`` creates missing tables, but it never changes existing ones. Every step here checks the current
+schema first, so ``upgrade()`` can run on every start.
+"""
+import logging
+
+import sqlalchemy
+from sqlalchemy import bindparam, func, text
+
+import model
+from questionnaire import parse_code
+
+logger = logging.getLogger(__name__)
+
+
+def _columns(inspector, table_name):
+    return {column['name'] for column in inspector.get_columns(table_name)}
+
+
+def _indexes(inspector, table_name):
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def add_code_columns(connection, inspector):
+    """Answers and AnswerTallies get typed question_number/question_suffix columns, backfilled from the code."""
+    for table in (model.Answer.__table__, model.AnswerTally.__table__):
+        columns = _columns(inspector, table.name)
+        for column_name, column_type in (('question_number', 'INTEGER'), ('question_suffix', 'VARCHAR')):
+            if column_name not in columns:
+                logger.info('Adding %s.%s', table.name, column_name)
+                connection.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN {column_name} {column_type}'))
+
+        codes = [code for code, in connection.execute(
+            sqlalchemy.select(table.c.code).where(table.c.question_number.is_(None)).distinct())]
+        if codes:
+            logger.info('Backfilling question_number/question_suffix for %d codes in %s', len(codes), table.name)
+            statement = table.update().where(table.c.code == bindparam('b_code')).values(
+                question_number=bindparam('b_number'), question_suffix=bindparam('b_suffix'))
+            # malformed codes are left NULL (and are skipped by the results)
+            parsed = [(code, parse_code(code)) for code in codes]
+            connection.execute(statement, [
+                dict(b_code=code, b_number=number, b_suffix=suffix) for code, (number, suffix) in parsed])
+
+
+# (table, column, definition) of the columns added to existing tables
+ADDED_COLUMNS = (
+    ('Votes', 'stored_shard', 'INTEGER'),
+    ('Votes', 'stored_version', 'INTEGER'),
+)
+
+
+def add_columns(connection, inspector):
+    for table_name, column_name, definition in ADDED_COLUMNS:
+        if column_name not in _columns(inspector, table_name):
+            logger.info('Adding %s.%s', table_name, column_name)
+            connection.execute(text(f'ALTER TABLE "{table_name}" ADD COLUMN {column_name} {definition}'))
+
+
+def simplify_answers_primary_key(connection, inspector):
+    """Answers used to have (answer_id, code) as the primary key; answer_id is enough."""
+    primary_key = inspector.get_pk_constraint('Answers')
+    if primary_key['constrained_columns'] == ['answer_id']:
+        return
+    if connection.dialect.name != 'postgresql':
+        logger.warning('Cannot change the primary key of Answers on %s', connection.dialect.name)
+        return
+    logger.info('Changing the primary key of Answers to answer_id')
+    connection.execute(text(f'ALTER TABLE "Answers" DROP CONSTRAINT "{primary_key["name"]}"'))
+    connection.execute(text('ALTER TABLE "Answers" ADD PRIMARY KEY (answer_id)'))
+
+
+def add_survey_columns(connection, inspector):
+    """Votes, Answers and Receipts get a survey_id column; the existing rows belong to the default survey.
+
+    Receipts get (survey_id, user_id) as the primary key. AnswerTallies and SubmissionRollups only hold counts computed
+    from the votes, so they are dropped and created again: the tallies are rebuilt on start, the rollup on first use.
+    """
+    for table_name in ('Votes', 'Answers', 'Receipts'):
+        if 'survey_id' not in _columns(inspector, table_name):
+            logger.info('Adding %s.survey_id', table_name)
+            connection.execute(text(
+                f'ALTER TABLE "{table_name}" ADD COLUMN survey_id INTEGER NOT NULL DEFAULT {model.DEFAULT_SURVEY_ID}'))
+
+    primary_key = inspector.get_pk_constraint('Receipts')
+    if primary_key['constrained_columns'] != ['survey_id', 'user_id']:
+        logger.info('Changing the primary key of Receipts to (survey_id, user_id)')
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text(f'ALTER TABLE "Receipts" DROP CONSTRAINT "{primary_key["name"]}"'))
+            connection.execute(text('ALTER TABLE "Receipts" ADD PRIMARY KEY (survey_id, user_id)'))
+        else:
+            # SQLite cannot change a primary key: copy the table
+            connection.execute(text('ALTER TABLE "Receipts" RENAME TO "Receipts_old"'))
+            model.Receipt.__table__.create(connection)
+            connection.execute(text(
+                'INSERT INTO "Receipts" (survey_id, user_id) SELECT survey_id, user_id FROM "Receipts_old"'))
+            connection.execute(text('DROP TABLE "Receipts_old"'))
+
+    for table in (model.AnswerTally.__table__, model.SubmissionRollup.__table__):
+        if 'survey_id' not in _columns(inspector, table.name):
+            logger.info('Creating %s again, with survey_id', table.name)
+            table.drop(connection)
+            table.create(connection)
+
+
+# replaced by indexes with more columns
+OBSOLETE_INDEXES = {
+    'Votes': ('ix_Votes_user_hash', 'ix_Votes_datestamp'),
+    'Answers': ('ix_Answers_code_answer_value', 'ix_Answers_code_answer_value_vote_id'),
+}
+
+
+def add_indexes(connection, inspector):
+    votes = model.Vote.__table__
+    duplicates = connection.execute(
+        sqlalchemy.select(func.count()).select_from(
+            sqlalchemy.select(votes.c.survey_id, votes.c.user_hash).group_by(
+                votes.c.survey_id, votes.c.user_hash).having(func.count() > 1).subquery())
+    ).scalar()
+    for table in (votes, model.Answer.__table__):
+        existing = _indexes(inspector, table.name)
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique and table is votes and duplicates:
+                logger.error('Not creating %s: %d user hashes have more than one vote', index.name, duplicates)
+                continue
+            logger.info('Creating index %s', index.name)
+            index.create(connection)
+        for index_name in OBSOLETE_INDEXES.get(table.name, ()):
+            if index_name in existing:
+                logger.info('Dropping index %s', index_name)
+                connection.execute(text(f'DROP INDEX "{index_name}"'))
+
+
+STEPS = (add_code_columns, simplify_answers_primary_key, add_survey_columns, add_columns, add_indexes)
+
+
+def upgrade(engine):
+    for step in STEPS:
+        with engine.begin() as connection:
+            step(connection, sqlalchemy.inspect(connection))
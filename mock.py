@@ -1,8 +1,12 @@
+import base64
+import json
 import os
+import time
+import urllib.parse
 
 from faker import Faker
 from faker.providers import internet, date_time
-from flask import Blueprint, session, make_response, redirect, url_for
+from flask import Blueprint, session, make_response, redirect, request, url_for, jsonify
 from werkzeug.exceptions import abort
 
 from util import base36encode
@@ -28,19 +32,158 @@ def mock_login():
     session['me'] = {
         'comment_karma': fake.random.randrange(100, 1000),
         'created_utc': fake.date_time_between(start_date='-10y', end_date='-1y').timestamp() // 1000,
-        'id': base36encode(fake.random.randrange(100000)), 'link_karma': fake.random.randrange(100, 1000),
-        'name': fake.user_name()}
-    return make_response(redirect(url_for('home')))
+        'id': request.args.get('id') or base36encode(fake.random.randrange(100000)),
+        'link_karma': fake.random.randrange(100, 1000),
+        'name': request.args.get('name') or fake.user_name()}
+    return make_response(redirect(url_for('home', survey=session.pop('survey', None))))
 
 
-class MockRedditAgent:
-    class auth:
-        def url(self, scope, state, duration='temporary'):
-            return '/mock'
+def _oauth_latency():
+    time.sleep(int(os.environ.get('MOCK_OAUTH_LATENCY_MS', '0')) / 1000)
 
-    # noinspection PyMethodFirstArgAssignment
 
-    class user:
-        @staticmethod
-        def me():
-            pass
+def _encode_user(user):
+    return base64.urlsafe_b64encode(json.dumps(user).encode('utf8')).decode('ascii')
+
+
+def _decode_user(text):
+    try:
+        return json.loads(base64.urlsafe_b64decode(text.encode('ascii')))
+    except ValueError:
+        return None
+
+
+def _token_response(form):
+    _oauth_latency()
+    if form.get('grant_type') != 'authorization_code' or not form.get('code'):
+        return 400, {'error': 'invalid_grant'}
+    return 200, {'access_token': form['code'], 'token_type': 'bearer', 'expires_in': 3600, 'scope': 'identity'}
+
+
+def _me_response(authorization):
+    _oauth_latency()
+    scheme, _, token = (authorization or '').partition(' ')
+    user = _decode_user(token) if scheme.lower() == 'bearer' and token else None
+    if user is None:
+        return 401, {'message': 'Unauthorized', 'error': 401}
+    created = time.time() - 5 * 365 * 86400
+    return 200, {
+        'comment_karma': 100, 'created': created, 'created_utc': created, 'gold_creddits': 0, 'gold_expiration': None,
+        'has_verified_email': True, 'hide_from_robots': False, 'id': user['id'], 'inbox_count': 0, 'is_gold': False,
+        'is_mod': False, 'link_karma': 100, 'name': user['name'], 'over_18': False}
+
+
+# Stand-in for reddit's OAuth endpoints, to benchmark logins offline: point REDDIT_URL and REDDIT_OAUTH_URL of the
+# site under test to <this server>/mock/reddit. The user is carried in the code and the token, so any worker (or
+# server) with MOCK=1 can answer any step. ``id`` and ``name`` can be added to the authorize URL to choose the user.
+
+@mock_app.route('/mock/reddit/api/v1/authorize')
+def oauth_authorize():
+    if os.environ.get('MOCK') != '1':
+        abort(404)
+    if not fake:
+        _init()
+    user = dict(id=request.args.get('id') or base36encode(fake.random.randrange(100000)),
+                name=request.args.get('name') or fake.user_name())
+    query = urllib.parse.urlencode(dict(state=request.args.get('state', ''), code=_encode_user(user)))
+    return redirect(request.args['redirect_uri'] + '?' + query)
+
+
+@mock_app.route('/mock/reddit/api/v1/access_token', methods=('POST',))
+def oauth_access_token():
+    if os.environ.get('MOCK') != '1':
+        abort(404)
+    status_code, body = _token_response(request.form)
+    return jsonify(body), status_code
+
+
+@mock_app.route('/mock/reddit/api/v1/me')
+def oauth_me():
+    if os.environ.get('MOCK') != '1':
+        abort(404)
+    status_code, body = _me_response(request.headers.get('Authorization'))
+    return jsonify(body), status_code
+
+
+def oauth_stand_in(request):
+    """The token and identity endpoints above, in-process (see http_client.StandInAdapter).
+
+    With MOCK_OAUTH=1 the site answers its own token and identity requests with this, without a round trip through
+    the network; only the authorize step (a browser redirect) still goes through /mock/reddit.
+    """
+    if request.url.endswith('/access_token'):
+        form = {key: values[0] for key, values in urllib.parse.parse_qs(request.body or '').items()}
+        return _token_response(form)
+    return _me_response(request.headers.get('Authorization'))
+
+
+def recaptcha_stand_in(request):
+    """Local stand-in for the reCAPTCHA siteverify endpoint (see http_client.StandInAdapter).
+
+    Accepts every non-empty response token, after MOCK_RECAPTCHA_LATENCY_MS milliseconds, to mimic the real thing.
+    """
+    time.sleep(int(os.environ.get('MOCK_RECAPTCHA_LATENCY_MS', '0')) / 1000)
+    form = urllib.parse.parse_qs(request.body or '')
+    success = bool(form.get('response', [''])[0])
+    return 200, {'success': success} if success else {'success': False, 'error-codes': ['invalid-input-response']}
+
+
+def _tree_items(choices):
+    for key, choice in choices.items():
+        yield key, choice
+        if choice.get('choices'):
+            yield from _tree_items(choice['choices'])
+
+
+def random_question_answers(question, rng):
+    """Random (but valid) form fields for one question, as the browser would post them."""
+    prefix = 'q_{}'.format(question['id'])
+    kind = question['kind']
+    fields = {}
+    if kind == 'radio':
+        fields[prefix] = rng.choice(list(question['choices']))
+        if question.get('other') and rng.random() < 0.1:
+            fields[prefix + '_text'] = fake.word()
+    elif kind == 'checkbox':
+        for key in question['choices']:
+            if rng.random() < 0.3:
+                fields[f'{prefix}_{key}'] = 'YES'
+        if question.get('other') and rng.random() < 0.1:
+            fields[prefix + '_text'] = fake.word()
+    elif kind == 'tree':
+        key, choice = rng.choice(list(_tree_items(question['choices'])))
+        fields[prefix] = key
+        if choice.get('is_text'):
+            fields[prefix + '_text'] = fake.word()
+    elif kind == 'checktree':
+        leaves = [(key, choice) for key, choice in _tree_items(question['choices']) if not choice.get('choices')]
+        for key, choice in rng.sample(leaves, rng.randint(1, min(3, len(leaves)))):
+            fields[f'{prefix}_{key}'] = 'YES'
+            if choice.get('is_text'):
+                fields[prefix + '_text'] = fake.word()
+    elif kind == 'text':
+        fields[prefix] = fake.word()
+    elif kind == 'textarea':
+        fields[prefix] = fake.sentence()
+    elif kind == 'scale-matrix':
+        for line_number in range(1, len(question['lines']) + 1):
+            fields[f'{prefix}_{line_number}'] = str(rng.randint(1, len(question['choices'])))
+    return fields
+
+
+def random_answers(questionnaire, rng, previous=None, change_ratio=1.0, skip_ratio=0.05):
+    """A random submission for ``questionnaire``.
+
+    When ``previous`` (an earlier submission) is given, only about ``change_ratio`` of the questions get new answers;
+    the rest keep their previous ones, like a voter coming back to change their mind.
+    """
+    if not fake:
+        _init()
+    form = {'cmd_save': 'Submit'}
+    for question in questionnaire.pure_questions:
+        prefix = 'q_{}'.format(question['id'])
+        if previous is not None and rng.random() >= change_ratio:
+            form.update((k, v) for k, v in previous.items() if k == prefix or k.startswith(prefix + '_'))
+        elif rng.random() >= skip_ratio:
+            form.update(random_question_answers(question, rng))
+    return form
@@ -1,37 +1,482 @@
+import collections
+import datetime
+import random
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import and_, bindparam, delete, func, insert, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from questionnaire import parse_code
 
 db = SQLAlchemy()
 
 
-# class Survey(Base):
-#     __tablename__ = 'Surveys'
-#
-#     survey_id = Column(Integer, primary_key=True, autoincrement=True)
-#     title = Column(String)
-#     data = Column(Text)
+# existing data (from before there were several surveys) belongs to this one
+DEFAULT_SURVEY_ID = 1
+# the changes to the votes of a survey are counted in this many rows (see bump_data_version)
+DATA_VERSION_SHARDS = 16
+
+
+class Survey(db.Model):
+    __tablename__ = 'Surveys'
+
+    survey_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    slug = db.Column(db.String, nullable=False, unique=True)
+    title = db.Column(db.String)
+    questionnaire_url = db.Column(db.String, nullable=False)
+
 
+def _survey_id_column(**kwargs):
+    return db.Column(
+        db.Integer, db.ForeignKey('Surveys.survey_id'), nullable=False, default=DEFAULT_SURVEY_ID, **kwargs)
+
+
+# Every table has a survey_id, leading its primary key or indexes, so the queries of one survey never read the rows of
+# the others.
 
 class Vote(db.Model):
     __tablename__ = 'Votes'
 
     vote_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    survey_id = _survey_id_column()
     user_hash = db.Column(db.String)
     datestamp = db.Column(db.DateTime)
-    # survey_id = Column(Integer, ForeignKey('Survey.id'))
-    # survey = relationship('Survey', backref='votes')
+    # the data version shard and version (see bump_data_version) of the transaction that last stored the vote: unlike
+    # the datestamp (the time of the submission), the versions of a shard grow in commit order
+    stored_shard = db.Column(db.Integer)
+    stored_version = db.Column(db.Integer)
+
+    __table_args__ = (
+        db.Index('ix_Votes_survey_id_user_hash', 'survey_id', 'user_hash', unique=True),
+        db.Index('ix_Votes_survey_id_datestamp', 'survey_id', 'datestamp'),
+        db.Index('ix_Votes_survey_id_stored_shard_stored_version', 'survey_id', 'stored_shard', 'stored_version'),
+    )
 
 
 class Answer(db.Model):
     __tablename__ = 'Answers'
 
     answer_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    code = db.Column(db.String, primary_key=True)
+    survey_id = _survey_id_column()
+    code = db.Column(db.String, nullable=False)
+    question_number = db.Column(db.Integer)
+    question_suffix = db.Column(db.String)
     answer_value = db.Column(db.String)
     vote_id = db.Column(db.Integer, db.ForeignKey('Votes.vote_id'))
     vote = db.relationship('Vote', backref='answers')
 
+    __table_args__ = (
+        db.Index('ix_Answers_vote_id', 'vote_id'),
+        # covers the lookups of the votes with a given answer (crosstab filters and joins)
+        db.Index('ix_Answers_survey_id_code_answer_value_vote_id', 'survey_id', 'code', 'answer_value', 'vote_id'),
+    )
+
 
 class Receipt(db.Model):
     __tablename__ = 'Receipts'
 
+    survey_id = _survey_id_column(primary_key=True)
     user_id = db.Column(db.String, primary_key=True)
+
+
+class AnswerTally(db.Model):
+    """Number of answers for every (code, answer_value) pair of a survey, kept up to date by every save."""
+    __tablename__ = 'AnswerTallies'
+
+    survey_id = _survey_id_column(primary_key=True)
+    code = db.Column(db.String, primary_key=True)
+    answer_value = db.Column(db.String, primary_key=True)
+    question_number = db.Column(db.Integer)
+    question_suffix = db.Column(db.String)
+    vote_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class SubmissionRollup(db.Model):
+    """Number of votes of a survey last submitted in every minute (UTC), kept up to date by rollup_submissions."""
+    __tablename__ = 'SubmissionRollups'
+
+    survey_id = _survey_id_column(primary_key=True)
+    minute = db.Column(db.DateTime, primary_key=True)
+    submissions = db.Column(db.Integer, nullable=False)
+
+
+class DataVersion(db.Model):
+    """One of the DATA_VERSION_SHARDS counters of the changes to the votes of a survey (see bump_data_version)."""
+    __tablename__ = 'DataVersions'
+
+    survey_id = _survey_id_column(primary_key=True)
+    shard = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    # the version of the shard up to which rollup_submissions has counted the votes
+    rolled_up_version = db.Column(db.Integer)
+
+
+class Draft(db.Model):
+    """An answer changed by autosave since the voter last submitted; a NULL answer_value clears the answer.
+
+    Drafts are kept apart from the Answers, so the results only ever count submitted votes. ``draft_hash`` is derived
+    from the user id and a random cookie, like the user_hash of a vote is from the receipt.
+    """
+    __tablename__ = 'Drafts'
+
+    survey_id = _survey_id_column(primary_key=True)
+    draft_hash = db.Column(db.String, primary_key=True)
+    code = db.Column(db.String, primary_key=True)
+    answer_value = db.Column(db.String)
+    updated = db.Column(db.DateTime, nullable=False)
+
+
+class VoterState:
+    """What is stored about a voter: whether they have a receipt, their vote (if found) and its answer rows.
+
+    ``pending`` holds the answers of a submission that is queued but not stored yet (see journal.py).
+    """
+
+    def __init__(self, has_receipt, vote=None, answer_rows=()):
+        self.has_receipt = has_receipt
+        self.vote = vote
+        self.answer_rows = answer_rows
+        self.pending = None
+
+    @property
+    def has_vote(self):
+        return self.vote is not None or self.pending is not None
+
+    @property
+    def answers(self):
+        if self.pending is not None:
+            return self.pending
+        return {code: answer_value for _, code, answer_value in self.answer_rows}
+
+
+def voter_state(survey_id, user_id, user_hash=None, vote_id=None):
+    """Receipt, vote and answers (as ``(answer_id, code, answer_value)`` rows) of a survey's voter, in a single query.
+
+    With ``vote_id`` (already resolved by an earlier request) the receipt is implied and only the vote is read; it
+    must still have ``user_hash``. Otherwise the vote is looked up by ``user_hash``, if there is one.
+    """
+    answer_columns = Answer.answer_id, Answer.code, Answer.answer_value
+    if vote_id is not None:
+        rows = db.session.query(Vote, *answer_columns).outerjoin(Answer, Answer.vote_id == Vote.vote_id).filter(
+            Vote.vote_id == vote_id, Vote.survey_id == survey_id, Vote.user_hash == user_hash).all()
+        if not rows:
+            return VoterState(True)
+        return VoterState(True, rows[0][0], [tuple(row[1:]) for row in rows if row[1] is not None])
+    if user_hash is None:
+        return VoterState(db.session.query(Receipt.user_id).filter(
+            Receipt.survey_id == survey_id, Receipt.user_id == user_id).first() is not None)
+    rows = db.session.query(Receipt.user_id, Vote, *answer_columns).select_from(Receipt).outerjoin(
+        Vote, (Vote.survey_id == survey_id) & (Vote.user_hash == user_hash)).outerjoin(
+        Answer, Answer.vote_id == Vote.vote_id).filter(Receipt.survey_id == survey_id, Receipt.user_id == user_id).all()
+    if not rows:
+        return VoterState(False)
+    return VoterState(True, rows[0][1], [tuple(row[2:]) for row in rows if row[2] is not None])
+
+
+def store_answers(vote, answers, existing_rows=None):
+    """Make the stored answers of ``vote`` (with its survey_id set) equal to ``answers`` (a mapping of code to value).
+
+    The existing answers are read with a single query (unless the caller already has them as ``existing_rows``, see
+    voter_state), and then only the differences are written, with one (executemany) statement each for inserts,
+    updates and deletes. Returns the tally deltas of the change.
+    """
+    existing = {}
+    obsolete_ids = []
+    deltas = collections.Counter()
+    if vote.vote_id is not None:
+        if existing_rows is None:
+            existing_rows = db.session.query(
+                Answer.answer_id, Answer.code, Answer.answer_value).filter(Answer.vote_id == vote.vote_id)
+        for answer_id, code, answer_value in existing_rows:
+            if code in existing:
+                # a duplicate, left over from older versions
+                obsolete_ids.append(answer_id)
+                deltas[code, answer_value] -= 1
+            else:
+                existing[code] = answer_id, answer_value
+    else:
+        db.session.flush()
+
+    inserts, updates = [], []
+    for code, answer_value in answers.items():
+        if code not in existing:
+            question_number, question_suffix = parse_code(code)
+            inserts.append(dict(vote_id=vote.vote_id, survey_id=vote.survey_id, code=code, answer_value=answer_value,
+                                question_number=question_number, question_suffix=question_suffix))
+            deltas[code, answer_value] += 1
+        elif existing[code][1] != answer_value:
+            updates.append(dict(b_answer_id=existing[code][0], b_answer_value=answer_value))
+            deltas[code, existing[code][1]] -= 1
+            deltas[code, answer_value] += 1
+    for code, (answer_id, answer_value) in existing.items():
+        if code not in answers:
+            obsolete_ids.append(answer_id)
+            deltas[code, answer_value] -= 1
+
+    if obsolete_ids:
+        db.session.execute(delete(Answer).where(Answer.answer_id.in_(obsolete_ids)))
+    if updates:
+        db.session.execute(update(Answer).where(Answer.answer_id == bindparam('b_answer_id')).values(
+            answer_value=bindparam('b_answer_value')), updates)
+    if inserts:
+        db.session.execute(insert(Answer), inserts)
+    return deltas
+
+
+def apply_tally_deltas(survey_id, deltas):
+    """Add ``deltas`` (a mapping of (code, answer_value) to a count difference) to the tallies of a survey.
+
+    This runs in the current transaction, so the tallies are committed (or rolled back) together with the answers.
+    """
+    changes = [dict(survey_id=survey_id, code=code, answer_value=answer_value, vote_count=delta,
+                    question_number=question_number, question_suffix=question_suffix)
+               for (code, answer_value), delta in sorted(deltas.items()) if delta != 0
+               for question_number, question_suffix in [parse_code(code)]]
+    if not changes:
+        return
+    dialects = {'postgresql': postgresql, 'sqlite': sqlite}
+    dialect = dialects.get(db.engine.dialect.name)
+    if dialect is not None:
+        statement = dialect.insert(AnswerTally)
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=[AnswerTally.survey_id, AnswerTally.code, AnswerTally.answer_value],
+            set_=dict(vote_count=AnswerTally.vote_count + statement.excluded.vote_count)), changes)
+        return
+    for change in changes:
+        updated = AnswerTally.query.filter_by(
+            survey_id=survey_id, code=change['code'], answer_value=change['answer_value']).update(
+            {AnswerTally.vote_count: AnswerTally.vote_count + change['vote_count']}, synchronize_session=False)
+        if updated == 0:
+            db.session.add(AnswerTally(**change))
+
+
+def store_queued_submissions(receipts, votes):
+    """Store a batch of submissions from the journal.
+
+    ``receipts`` are ``(survey_id, user_id)`` pairs, and ``votes`` ``(survey_id, user_hash, answers, datestamp)``.
+
+    Storing a submission twice is harmless: receipts are only added once, the answers of a vote are replaced, and a
+    submission older than the stored vote is skipped.
+    """
+    for survey_id, user_ids in _by_survey(receipts).items():
+        existing = {user_id for user_id, in db.session.query(Receipt.user_id).filter(
+            Receipt.survey_id == survey_id, Receipt.user_id.in_(user_ids))}
+        new_receipts = [dict(survey_id=survey_id, user_id=user_id) for user_id in user_ids if user_id not in existing]
+        if new_receipts:
+            db.session.execute(insert(Receipt), new_receipts)
+    for survey_id, survey_votes in _by_survey(votes).items():
+        _store_survey_votes(survey_id, survey_votes)
+
+
+def _by_survey(rows):
+    """Group ``(survey_id, ...)`` tuples by survey: ``{survey_id: [the rest, or the single other item]}``."""
+    grouped = collections.defaultdict(list)
+    for survey_id, *rest in rows:
+        grouped[survey_id].append(rest[0] if len(rest) == 1 else tuple(rest))
+    return grouped
+
+
+def _store_survey_votes(survey_id, votes):
+    # the row locks keep a concurrent writer from storing an older submission over a newer one
+    stored = {vote.user_hash: vote for vote in Vote.query.filter(
+        Vote.survey_id == survey_id, Vote.user_hash.in_([user_hash for user_hash, _, _ in votes])).with_for_update()}
+    answer_rows = collections.defaultdict(list)
+    if stored:
+        for answer_id, vote_id, code, answer_value in db.session.query(
+                Answer.answer_id, Answer.vote_id, Answer.code, Answer.answer_value).filter(
+                Answer.vote_id.in_([vote.vote_id for vote in stored.values()])):
+            answer_rows[vote_id].append((answer_id, code, answer_value))
+    deltas = collections.Counter()
+    changed = []
+    for user_hash, answers, datestamp in votes:
+        vote = stored.get(user_hash)
+        if vote is None:
+            vote = Vote(survey_id=survey_id, user_hash=user_hash)
+            db.session.add(vote)
+        elif vote.datestamp is not None and vote.datestamp > datestamp:
+            continue
+        vote.datestamp = datestamp
+        deltas.update(store_answers(vote, answers, answer_rows[vote.vote_id] if vote.vote_id is not None else None))
+        changed.append(vote)
+    apply_tally_deltas(survey_id, deltas)
+    if changed:
+        shard, version = bump_data_version(survey_id)
+        for vote in changed:
+            vote.stored_shard, vote.stored_version = shard, version
+
+
+def save_draft(survey_id, draft_hash, changes, now):
+    """Record the changed answers of a draft: ``changes`` maps a code to its new value, or to None to clear it.
+
+    Only the changed fields are written (one upsert statement), whatever the size of the questionnaire.
+    """
+    rows = [dict(survey_id=survey_id, draft_hash=draft_hash, code=code, answer_value=answer_value, updated=now)
+            for code, answer_value in sorted(changes.items())]
+    if not rows:
+        return
+    dialects = {'postgresql': postgresql, 'sqlite': sqlite}
+    dialect = dialects.get(db.engine.dialect.name)
+    if dialect is not None:
+        statement = dialect.insert(Draft)
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=[Draft.survey_id, Draft.draft_hash, Draft.code],
+            set_=dict(answer_value=statement.excluded.answer_value, updated=statement.excluded.updated)), rows)
+    else:
+        for row in rows:
+            db.session.merge(Draft(**row))
+
+
+def draft_changes(survey_id, draft_hash):
+    """``{code: value, or None when cleared}`` of a draft."""
+    return dict(db.session.query(Draft.code, Draft.answer_value).filter(
+        Draft.survey_id == survey_id, Draft.draft_hash == draft_hash))
+
+
+def discard_draft(survey_id, draft_hash):
+    db.session.execute(delete(Draft).where(Draft.survey_id == survey_id, Draft.draft_hash == draft_hash))
+
+
+def purge_drafts(before):
+    """Delete the drafts not changed since ``before``. Returns the number of answers deleted."""
+    return db.session.execute(delete(Draft).where(Draft.updated < before)).rowcount
+
+
+def bump_data_version(survey_id=None):
+    """Count a change to the votes of a survey (of all of them by default), in the current transaction.
+
+    The change is counted in one of the DATA_VERSION_SHARDS rows of the survey, picked at random. The update locks
+    that row until the commit, so the versions of a shard are committed in order, while concurrent writers only wait
+    for each other when they pick the same shard. Returns the ``(shard, version)`` of the change.
+    """
+    if survey_id is None:
+        for survey_id, in db.session.query(Survey.survey_id).all():
+            bump_data_version(survey_id)
+        return None
+    shard = random.randrange(DATA_VERSION_SHARDS)
+    dialects = {'postgresql': postgresql, 'sqlite': sqlite}
+    dialect = dialects.get(db.engine.dialect.name)
+    if dialect is not None:
+        statement = dialect.insert(DataVersion).values(survey_id=survey_id, shard=shard, version=1)
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=[DataVersion.survey_id, DataVersion.shard], set_=dict(version=DataVersion.version + 1)))
+    else:
+        updated = DataVersion.query.filter_by(survey_id=survey_id, shard=shard).update(
+            {DataVersion.version: DataVersion.version + 1}, synchronize_session=False)
+        if updated == 0:
+            db.session.add(DataVersion(survey_id=survey_id, shard=shard, version=1))
+            db.session.flush()
+    return shard, db.session.query(DataVersion.version).filter(
+        DataVersion.survey_id == survey_id, DataVersion.shard == shard).scalar()
+
+
+def data_versions(survey_id):
+    """``{shard: version}`` of a survey; all the votes stored up to these versions are committed."""
+    return dict(db.session.query(DataVersion.shard, DataVersion.version).filter(DataVersion.survey_id == survey_id))
+
+
+def data_version(survey_id):
+    """Changes (grows by one) with every change to the votes of the survey; used to key caches of computed results."""
+    return db.session.query(func.coalesce(func.sum(DataVersion.version), 0)).filter(
+        DataVersion.survey_id == survey_id).scalar()
+
+
+def stored_between(before, after):
+    """Condition on the votes stored after the ``before`` versions (``{shard: version}``), up to the ``after`` ones.
+
+    None when no shard moved.
+    """
+    conditions = [and_(Vote.stored_shard == shard, Vote.stored_version > before.get(shard, 0),
+                       Vote.stored_version <= version)
+                  for shard, version in sorted(after.items()) if version > before.get(shard, 0)]
+    return or_(*conditions) if conditions else None
+
+
+def _minute(datestamp):
+    return datestamp.replace(second=0, microsecond=0)
+
+
+def rollup_submissions(survey_id):
+    """Recount the submissions to a survey of the minutes that got votes stored since the last rollup.
+
+    Those votes are found by their stored_shard and stored_version, so the ones stored late with an earlier datestamp
+    (e.g. from the submission journal) are counted too; the minutes are then recounted through the datestamp index.
+    Other minutes are not recounted, so a vote that is submitted again later counts in both minutes: the rollup counts
+    submissions, not voters. The first rollup of a survey counts every minute. Returns the number of minutes recounted.
+    """
+    shards = db.session.query(DataVersion.shard, DataVersion.version, DataVersion.rolled_up_version).filter(
+        DataVersion.survey_id == survey_id).all()
+    rolled_up = {shard: rolled_up_version or 0 for shard, _, rolled_up_version in shards}
+    # read first: the votes stored up to these versions are all committed already
+    versions = {shard: version for shard, version, _ in shards}
+    query = db.session.query(Vote.datestamp).filter(Vote.survey_id == survey_id, Vote.datestamp.isnot(None))
+    minutes = None
+    if db.session.query(SubmissionRollup.minute).filter(SubmissionRollup.survey_id == survey_id).first() is not None:
+        stored = stored_between(rolled_up, versions)
+        if stored is None:
+            return 0
+        minutes = {_minute(datestamp) for datestamp, in query.filter(stored)}
+    counts = {}
+    if minutes is None or minutes:
+        if minutes:
+            query = query.filter(Vote.datestamp >= min(minutes),
+                                 Vote.datestamp < max(minutes) + datetime.timedelta(minutes=1))
+        counts = collections.Counter(_minute(datestamp) for datestamp, in query.yield_per(5000))
+
+    rows = [dict(survey_id=survey_id, minute=minute, submissions=count)
+            for minute, count in sorted(counts.items()) if minutes is None or minute in minutes]
+    dialects = {'postgresql': postgresql, 'sqlite': sqlite}
+    dialect = dialects.get(db.engine.dialect.name)
+    if dialect is not None and rows:
+        statement = dialect.insert(SubmissionRollup)
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=[SubmissionRollup.survey_id, SubmissionRollup.minute],
+            set_=dict(submissions=statement.excluded.submissions)), rows)
+    else:
+        for row in rows:
+            db.session.merge(SubmissionRollup(**row))
+    moved = [dict(b_shard=shard, b_version=version) for shard, version in versions.items()
+             if version != rolled_up[shard]]
+    if moved:
+        # last, so the shard rows are only locked (away from the writers) for the end of the transaction
+        db.session.execute(update(DataVersion).where(
+            DataVersion.survey_id == survey_id, DataVersion.shard == bindparam('b_shard')).values(
+            rolled_up_version=bindparam('b_version')), moved)
+    return len(rows)
+
+
+def submissions_per_minute(survey_id, since, until):
+    """``{minute: submissions}`` for the rolled up minutes of a survey in ``[since, until)``."""
+    return dict(db.session.query(SubmissionRollup.minute, SubmissionRollup.submissions).filter(
+        SubmissionRollup.survey_id == survey_id, SubmissionRollup.minute >= since, SubmissionRollup.minute < until))
+
+
+def counted_answers(survey_id=None):
+    """``(survey_id, code, answer_value, votes, question_number, question_suffix)`` rows, for one or all surveys."""
+    query = db.session.query(
+        Answer.survey_id, Answer.code, Answer.answer_value, func.count(Answer.answer_id), Answer.question_number,
+        Answer.question_suffix).group_by(
+        Answer.survey_id, Answer.code, Answer.answer_value, Answer.question_number, Answer.question_suffix)
+    return query.filter(Answer.survey_id == survey_id) if survey_id is not None else query
+
+
+def rebuild_tallies():
+    """Recompute all tallies from the answers. Returns the number of (survey_id, code, answer_value) triples."""
+    AnswerTally.query.delete(synchronize_session=False)
+    result = db.session.execute(insert(AnswerTally).from_select(
+        [AnswerTally.survey_id, AnswerTally.code, AnswerTally.answer_value, AnswerTally.vote_count,
+         AnswerTally.question_number, AnswerTally.question_suffix], counted_answers().statement))
+    # the results computed from the old tallies are out of date
+    bump_data_version()
+    return result.rowcount
+
+
+def check_tallies():
+    """Compare the tallies to the answers.
+
+    Returns a list of ``(survey_id, code, answer_value, tallied, actual)`` differences.
+    """
+    actual = {(survey_id, code, value): count for survey_id, code, value, count, _, _ in counted_answers()}
+    tallied = {(t.survey_id, t.code, t.answer_value): t.vote_count for t in AnswerTally.query if t.vote_count != 0}
+    return [(*key, tallied.get(key, 0), actual.get(key, 0))
+            for key in sorted(actual.keys() | tallied.keys())
+            if tallied.get(key, 0) != actual.get(key, 0)]
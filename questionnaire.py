@@ -0,0 +1,375 @@
+import collections
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+from http_client import UpstreamUnavailable
+import yaml_wrapper
+
+logger = logging.getLogger(__name__)
+
+
+class FrozenDict(dict):
+    """A dict that refuses modification after construction.
+
+    Compiled questionnaires are shared between requests (and threads), so nobody is allowed to change them in place.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('compiled questionnaire data is read-only')
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def parse_code(code):
+    """Split an answer code such as ``q_12_3`` into ``(12, '3')``; the suffix is ``''`` when missing.
+
+    Codes that don't look like that (old bots posted some) give ``(None, None)``.
+    """
+    parts = code.split('_', 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        return None, None
+    return int(parts[1]), parts[2] if len(parts) == 3 else ''
+
+
+def index_tree(choices, path=(), index=None):
+    """Flatten a choice tree to ``{value: (title, path)}``.
+
+    When a value appears more than once, the first one wins: siblings before children, like a breadth-first lookup of
+    each level would find it.
+    """
+    if index is None:
+        index = {}
+    for value, choice in choices.items():
+        index.setdefault(value, (choice['title'], path + (choice['title'],)))
+    for value, choice in choices.items():
+        if choice.get('choices'):
+            index_tree(choice['choices'], path + (choice['title'],), index)
+    return index
+
+
+# longer free-text answers are cut, and marked with an ellipsis
+MAX_TEXT_LENGTH = 512
+# answers of scale-matrix lines besides the ordinals, from older versions of the form (still in the results)
+SCALE_WORDS = frozenset(('maybe', 'no', 'yes'))
+
+
+def tree_nodes(choices):
+    """Every ``(value, choice)`` of a choice tree, parents before their children."""
+    for value, choice in choices.items():
+        yield value, choice
+        if choice.get('choices'):
+            yield from tree_nodes(choice['choices'])
+
+
+def answer_fields(questions):
+    """``{field: allowed values}`` for every field the form of ``questions`` can post; None allows any (free) text."""
+    fields = {}
+    for question in questions:
+        prefix = 'q_{}'.format(question['id'])
+        kind = question['kind']
+        has_text = bool(question.get('other'))
+        if kind in ('text', 'textarea'):
+            fields[prefix] = None
+        elif kind == 'radio':
+            fields[prefix] = frozenset(str(value) for value in question['choices'])
+        elif kind == 'checkbox':
+            fields.update((f'{prefix}_{value}', frozenset(('YES',))) for value in question['choices'])
+        elif kind in ('tree', 'checktree'):
+            nodes = list(tree_nodes(question['choices']))
+            has_text = any(choice.get('is_text') for _, choice in nodes)
+            if kind == 'tree':
+                fields[prefix] = frozenset(str(value) for value, _ in nodes)
+            else:
+                # only the leaves have checkboxes
+                fields.update((f'{prefix}_{value}', frozenset(('YES',)))
+                              for value, choice in nodes if not choice.get('choices'))
+        elif kind == 'scale-matrix':
+            ordinals = frozenset(str(n) for n in range(1, len(question['choices']) + 1)) | SCALE_WORDS
+            fields.update((f'{prefix}_{line}', ordinals) for line in range(1, len(question['lines']) + 1))
+        if has_text:
+            fields[prefix + '_text'] = None
+    return fields
+
+
+class Questionnaire:
+    """Compiled form of the questionnaire documents.
+
+    Built once per questionnaire version (identified by ``content_hash``) and never modified afterwards.
+
+    * ``config``: all the ``config`` documents merged together
+    * ``questions``: everything that is rendered in the form (headers included), in order, with ids assigned
+    * ``pure_questions``: only the actual questions; ``pure_questions[id - 1]`` is the question with that id
+    * ``by_id``: question id to question
+    * ``tree_choices``: for tree/checktree questions, question id to a ``{value: (title, path)}`` index of every node,
+      where ``path`` is the tuple of titles from the top of the tree down to that node
+    * ``scale_choices``: for scale-matrix questions, question id to the tuple of choice titles (ordinal ``n`` is at
+      ``n - 1``)
+    * ``answer_fields``: every field the form can post, with its allowed values (see ``answer_fields``)
+    """
+
+    def __init__(self, documents, content_hash=''):
+        self.content_hash = content_hash
+        config = {}
+        questions = []
+        question_id = 1
+        for document in documents:
+            if document['kind'] == 'config':
+                config.update(document['config'])
+                continue
+            question = dict(document)
+            if question['kind'] != 'header':
+                question['id'] = question_id
+                question_id += 1
+            questions.append(question)
+
+        self.config = freeze(config)
+        self.questions = freeze(questions)
+        self.pure_questions = tuple(q for q in self.questions if q['kind'] != 'header')
+        self.by_id = FrozenDict((q['id'], q) for q in self.pure_questions)
+        self.tree_choices = FrozenDict(
+            (q['id'], FrozenDict(index_tree(q['choices']))) for q in self.pure_questions
+            if q['kind'] in ('tree', 'checktree'))
+        self.scale_choices = FrozenDict(
+            (q['id'], tuple(q['choices'].values())) for q in self.pure_questions if q['kind'] == 'scale-matrix')
+        self.answer_fields = FrozenDict(answer_fields(self.pure_questions))
+
+    def clean_answers(self, form):
+        """The answers of a submitted ``form`` (field to value) that this questionnaire can actually have.
+
+        Fields the form cannot post and values outside the choices are dropped, free text is cut to MAX_TEXT_LENGTH;
+        returns ``(answers, rejected)``, where ``rejected`` counts the dropped or cut fields by reason.
+        """
+        answers = {}
+        rejected = collections.Counter()
+        for field, value in form:
+            if not value or not field.startswith('q_'):
+                continue
+            allowed = self.answer_fields.get(field, ())
+            if allowed is None:
+                if len(value) >= MAX_TEXT_LENGTH:
+                    value = value[:MAX_TEXT_LENGTH - 1] + '\u2026'
+                    rejected['too_long'] += 1
+            elif value not in allowed:
+                rejected['unknown_field' if field not in self.answer_fields else 'invalid_value'] += 1
+                continue
+            answers[field] = value
+        return answers, rejected
+
+    def clean_changes(self, changes):
+        """clean_answers for the changed fields of an autosave (a list of field and value): an empty value clears the
+        answer, and comes back as None.
+        """
+        answers, rejected = self.clean_answers(changes)
+        for field, value in changes:
+            if not value and field in self.answer_fields:
+                answers[field] = None
+        return answers, rejected
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf8')).hexdigest()
+
+
+def compile_questionnaire(text, text_hash=None):
+    return Questionnaire(yaml_wrapper.load_all(text), text_hash or content_hash(text))
+
+
+class CompiledCache:
+    """Compiled questionnaires pickled on disk, one file per version, shared by all the workers of a host.
+
+    New workers (and restarted ones) load the current version from here instead of parsing the YAML again. Only the
+    application should be able to write to ``directory``: loading a pickle runs code.
+    """
+    # bump whenever the attributes of Questionnaire change
+    FORMAT = 2
+
+    def __init__(self, directory):
+        self.directory = pathlib.Path(directory)
+
+    def path(self, text_hash):
+        return self.directory / f'{text_hash}.v{self.FORMAT}.pickle'
+
+    def get(self, text_hash):
+        try:
+            with self.path(text_hash).open('rb') as f:
+                questionnaire = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.exception('Could not load the compiled questionnaire %s', text_hash)
+            return None
+        if not isinstance(questionnaire, Questionnaire) or questionnaire.content_hash != text_hash:
+            return None
+        return questionnaire
+
+    def put(self, questionnaire):
+        path = self.path(questionnaire.content_hash)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            temporary.write_bytes(pickle.dumps(questionnaire, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(temporary, path)
+            for old in self.directory.glob('*.pickle'):
+                if old != path:
+                    old.unlink(missing_ok=True)
+        except OSError:
+            logger.exception('Could not save the compiled questionnaire to %s', path)
+
+
+class QuestionnaireUnavailable(Exception):
+    pass
+
+
+def fetch_questionnaire(url, http, etag=None, last_modified=None, endpoint='questionnaire'):
+    """Fetch the questionnaire text from a file:// URL or a reddit wiki page (through the ``endpoint`` of ``http``).
+
+    Returns ``(text, etag, last_modified)``. ``text`` is ``None`` when the server says the page has not changed since
+    the ``etag``/``last_modified`` we already have.
+    """
+    if url.startswith('file://'):
+        url_obj = urllib.parse.urlparse(url)
+        file_path = pathlib.Path(urllib.request.url2pathname(url_obj.path))
+        modified = str(file_path.stat().st_mtime_ns)
+        if modified == last_modified:
+            return None, None, modified
+        return file_path.read_text(encoding='utf8'), None, modified
+
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    try:
+        response = http.get(endpoint, url, params=dict(raw_json=1), headers=headers)
+    except UpstreamUnavailable as e:
+        raise QuestionnaireUnavailable(str(e)) from e
+    if response.status_code == 304:
+        return None, etag, last_modified
+    try:
+        text = response.json()['data']['content_md'] if response.ok else None
+    except (ValueError, KeyError, TypeError):
+        # not the JSON of a wiki page (e.g. an HTML error page)
+        text = None
+    if text is None:
+        raise QuestionnaireUnavailable(f'{url} returned {response.status_code}: {response.text[:200]}')
+    return text, response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+
+class QuestionnaireStore:
+    """Questionnaire cache shared between workers, with stale-while-revalidate refreshes.
+
+    The (shared) flask-caching backend holds a small entry, with the content hash of the questionnaire and the
+    validators needed for a conditional fetch, and the text itself under a key of its own: every request only reads the
+    entry, and the text is only read by a worker that hasn't compiled that version yet. Once the entry is older than
+    ``fresh_for`` seconds it is still served, but one worker (whichever grabs the refresh lock first) revalidates it in
+    a background thread. Only the very first load blocks a request. Every worker compiles each version once, when its
+    content hash changes, or loads it from ``compiled_cache`` (a CompiledCache) when another worker already did.
+    """
+
+    def __init__(self, cache, url, http, fresh_for=300, stale_for=86400, compiled_cache=None, endpoint='questionnaire'):
+        self.cache = cache
+        self.url = url
+        self.http = http
+        self.endpoint = endpoint
+        self.fresh_for = fresh_for
+        self.stale_for = stale_for
+        self.cache_key = 'questionnaire/' + url
+        self.compiled_cache = compiled_cache
+        self._compiled = {}
+        self._compiling = threading.Lock()
+        self.stats = collections.Counter()
+        self._refreshing = threading.Lock()
+
+    def text_key(self, text_hash):
+        return f'{self.cache_key}/text/{text_hash}'
+
+    def get(self):
+        entry = self.cache.get(self.cache_key)
+        text = None
+        if entry is None:
+            self.stats['miss'] += 1
+            entry, text = self.refresh(None)
+        elif time.time() - entry['fetched_at'] > self.fresh_for:
+            self.stats['stale'] += 1
+            self.refresh_in_background(entry)
+        else:
+            self.stats['hit'] += 1
+        return self.compiled(entry, text)
+
+    def compiled(self, entry, text=None):
+        """The compiled questionnaire of ``entry``; its ``text``, when not given, is read from the cache if needed."""
+        questionnaire = self._compiled.get(entry['hash'])
+        if questionnaire is None:
+            # the YAML loader is not thread-safe, and there is no point in compiling the same version twice anyway
+            with self._compiling:
+                questionnaire = self._compiled.get(entry['hash'])
+                if questionnaire is None and self.compiled_cache is not None:
+                    questionnaire = self.compiled_cache.get(entry['hash'])
+                    if questionnaire is not None:
+                        self.stats['load_compiled'] += 1
+                if questionnaire is None:
+                    if text is None:
+                        text = self.cache.get(self.text_key(entry['hash']))
+                    if text is None:
+                        # evicted (or stored by an older version): fetch it again, unconditionally
+                        self.stats['text_miss'] += 1
+                        entry, text = self.refresh(None)
+                    questionnaire = compile_questionnaire(text, entry['hash'])
+                    self.stats['compile'] += 1
+                    if self.compiled_cache is not None:
+                        self.compiled_cache.put(questionnaire)
+                    # only the current version is ever needed
+                    self._compiled = {entry['hash']: questionnaire}
+        return questionnaire
+
+    def refresh(self, entry):
+        """Fetch the questionnaire, conditionally when there's an ``entry``. Returns the new entry, and the text if any.
+
+        The text goes in the cache before the entry, so the text of the hash of an entry is always there (or evicted).
+        """
+        etag, last_modified = (entry['etag'], entry['last_modified']) if entry else (None, None)
+        text, etag, last_modified = fetch_questionnaire(self.url, self.http, etag, last_modified, self.endpoint)
+        new_entry = dict(entry or {}, etag=etag, last_modified=last_modified, fetched_at=time.time())
+        if text is not None:
+            new_entry['hash'] = content_hash(text)
+            self.cache.set(self.text_key(new_entry['hash']), text, timeout=self.stale_for)
+        self.cache.set(self.cache_key, new_entry, timeout=self.stale_for)
+        return new_entry, text
+
+    def refresh_in_background(self, entry):
+        if not self._refreshing.acquire(blocking=False):
+            return
+        lock_key = self.cache_key + '/refreshing'
+        if not self.cache.add(lock_key, True, timeout=max(60, self.fresh_for)):
+            self._refreshing.release()
+            return
+
+        def run():
+            try:
+                self.refresh(entry)
+            except Exception:
+                logger.exception('Could not refresh questionnaire from %s, serving the stale copy', self.url)
+            finally:
+                self.cache.delete(lock_key)
+                self._refreshing.release()
+
+        threading.Thread(target=run, name='questionnaire-refresh', daemon=True).start()
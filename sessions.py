@@ -0,0 +1,145 @@
+"""Server-side sessions.
+
+Flask keeps the whole session in a signed cookie, which the browser sends (and the app verifies and deserializes) on
+every request. With ``SESSION_STORE`` set, the cookie only holds a random session id, and the session itself is kept
+either in a local SQLite file (shared by the workers of one host) or in the flask-caching backend (shared by all hosts
+with ``CACHE_TYPE=RedisCache``). Sessions are only written back when they change, and get a new id at login.
+
+A server-side session holds the reddit identity of the user, so the app never stores anything about their vote in it.
+"""
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_sessions_expires_at ON sessions (expires_at);
+'''
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, session_id=None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.session_id = session_id
+        self.new = session_id is None
+        self.modified = False
+        self.previous_id = None
+
+    def regenerate(self):
+        """Move the session to a new id (on login), so that an id handed out before can't be used afterwards."""
+        if self.previous_id is None:
+            self.previous_id = self.session_id
+        self.session_id = None
+        self.modified = True
+
+
+class SqliteSessionStore:
+    def __init__(self, path, purge_every=1000):
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._local = threading.local()
+        self._pid = os.getpid()
+        connection = self._connect()
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.executescript(SCHEMA)
+
+    def _connect(self):
+        """The connection of the current thread (sessions can be lost in a crash, so commits are not synced)."""
+        if self._pid != os.getpid():
+            # connections must not be shared with a forked child
+            self._local = threading.local()
+            self._pid = os.getpid()
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def get(self, session_id):
+        row = self._connect().execute('SELECT data FROM sessions WHERE session_id = ? AND expires_at > ?',
+                                      (session_id, time.time())).fetchone()
+        return row[0] if row else None
+
+    def set(self, session_id, data, timeout):
+        connection = self._connect()
+        connection.execute('INSERT OR REPLACE INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?)',
+                           (session_id, data, time.time() + timeout))
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            connection.execute('DELETE FROM sessions WHERE expires_at <= ?', (time.time(),))
+
+    def delete(self, session_id):
+        self._connect().execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+
+class CacheSessionStore:
+    """Sessions in a flask-caching ``Cache``, which expires them by itself."""
+
+    def __init__(self, cache, prefix='session/'):
+        self.cache = cache
+        self.prefix = prefix
+
+    def get(self, session_id):
+        return self.cache.get(self.prefix + session_id)
+
+    def set(self, session_id, data, timeout):
+        self.cache.set(self.prefix + session_id, data, timeout=timeout)
+
+    def delete(self, session_id):
+        self.cache.delete(self.prefix + session_id)
+
+
+class ServerSideSessionInterface(SessionInterface):
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store):
+        self.store = store
+
+    def open_session(self, app, request):
+        session_id = request.cookies.get(self.get_cookie_name(app))
+        if session_id:
+            data = self.store.get(session_id)
+            if data is not None:
+                try:
+                    return ServerSideSession(self.serializer.loads(data), session_id)
+                except ValueError:
+                    pass
+        return ServerSideSession()
+
+    def save_session(self, app, session, response):
+        response.vary.add('Cookie')
+        cookie_name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if session.previous_id is not None:
+            self.store.delete(session.previous_id)
+        if not session:
+            if session.modified and not session.new:
+                if session.session_id is not None:
+                    self.store.delete(session.session_id)
+                response.delete_cookie(cookie_name, domain=domain, path=path)
+            return
+        if not session.modified:
+            return
+        if session.session_id is None:
+            session.session_id = secrets.token_urlsafe(32)
+        lifetime = app.permanent_session_lifetime
+        self.store.set(session.session_id, self.serializer.dumps(dict(session)), int(lifetime.total_seconds()))
+        response.set_cookie(
+            cookie_name, session.session_id, expires=self.get_expiration_time(app, session), httponly=True,
+            domain=domain, path=path, secure=self.get_cookie_secure(app), samesite=self.get_cookie_samesite(app))
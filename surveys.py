@@ -0,0 +1,107 @@
+"""Several surveys hosted side by side, each with its own questionnaire, votes, receipts and results.
+
+The default survey (``model.DEFAULT_SURVEY_ID``, which all the data from before there were several surveys belongs to)
+takes its questionnaire from ``QUESTIONNAIRE_URL`` and is served at ``/``. The others are added with
+``flask add-survey`` and served under ``/s/<slug>/``.
+"""
+import collections
+import re
+import threading
+import time
+
+from sqlalchemy import func, text
+
+import model
+
+SLUG_PATTERN = re.compile(r'^[a-z0-9][a-z0-9-]{0,62}$')
+
+Survey = collections.namedtuple('Survey', 'survey_id slug title questionnaire_url')
+
+
+class SurveyError(ValueError):
+    pass
+
+
+def _check_slug(slug):
+    if not SLUG_PATTERN.match(slug or ''):
+        raise SurveyError(f'{slug!r} is not a valid slug: use lowercase letters, digits and dashes')
+
+
+def _save(survey_id, slug, questionnaire_url, title):
+    row = model.Survey.query.filter_by(slug=slug).first()
+    if row is not None and survey_id is not None and row.survey_id != survey_id:
+        raise SurveyError(f'Survey {slug!r} already exists')
+    if row is None and survey_id is not None:
+        row = model.db.session.get(model.Survey, survey_id)
+    if row is None:
+        row = model.Survey(survey_id=survey_id)
+        model.db.session.add(row)
+    row.slug = slug
+    row.questionnaire_url = questionnaire_url
+    if title is not None:
+        row.title = title
+    model.db.session.flush()
+    return Survey(row.survey_id, row.slug, row.title, row.questionnaire_url)
+
+
+def ensure_default(slug, questionnaire_url):
+    """Create or update the default survey, configured from the environment."""
+    _check_slug(slug)
+    survey = _save(model.DEFAULT_SURVEY_ID, slug, questionnaire_url, None)
+    if model.db.engine.dialect.name == 'postgresql':
+        # the default survey was inserted with an explicit id: the next ones must not get it from the sequence
+        model.db.session.execute(text(
+            "SELECT setval(pg_get_serial_sequence('\"Surveys\"', 'survey_id'), :last)"),
+            dict(last=model.db.session.query(func.max(model.Survey.survey_id)).scalar()))
+    return survey
+
+
+def add_survey(slug, questionnaire_url, title=None):
+    """Add a survey, or change the questionnaire URL (and title) of the one with this slug."""
+    _check_slug(slug)
+    row = model.Survey.query.filter_by(slug=slug).first()
+    if row is not None and row.survey_id == model.DEFAULT_SURVEY_ID:
+        raise SurveyError(f'{slug!r} is the default survey: change SURVEY_SLUG and QUESTIONNAIRE_URL instead')
+    return _save(None, slug, questionnaire_url, title)
+
+
+class Surveys:
+    """The surveys, as last read by this worker.
+
+    They are read again every ``reload_after`` seconds, and when an unknown slug is asked for (at most every
+    ``retry_unknown_after`` seconds, so that bad URLs do not each cost a query).
+    """
+
+    def __init__(self, reload_after=60, retry_unknown_after=5):
+        self.reload_after = reload_after
+        self.retry_unknown_after = retry_unknown_after
+        self._by_slug = {}
+        self._by_id = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def _load(self, max_age):
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded_at is not None and now - self._loaded_at < max_age:
+                return
+            rows = [Survey(row.survey_id, row.slug, row.title, row.questionnaire_url)
+                    for row in model.Survey.query.order_by(model.Survey.survey_id)]
+            self._by_slug = {survey.slug: survey for survey in rows}
+            self._by_id = {survey.survey_id: survey for survey in rows}
+            self._loaded_at = now
+
+    def all(self):
+        self._load(self.reload_after)
+        return list(self._by_id.values())
+
+    def default(self):
+        self._load(self.reload_after)
+        return self._by_id[model.DEFAULT_SURVEY_ID]
+
+    def by_slug(self, slug):
+        """The survey, or None."""
+        self._load(self.reload_after)
+        if slug not in self._by_slug:
+            self._load(self.retry_unknown_after)
+        return self._by_slug.get(slug)
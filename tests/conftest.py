@@ -0,0 +1,113 @@
+import os
+import sys
+
+import flask
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model  # noqa: E402
+from questionnaire import compile_questionnaire  # noqa: E402
+
+QUESTIONNAIRE = '''
+kind: config
+config:
+  title: Test survey
+---
+kind: header
+title: About you
+---
+kind: radio
+title: Favourite colour
+other: true
+choices:
+  red: Red
+  blue: Blue
+---
+kind: checkbox
+title: Pets
+choices:
+  cat: Cat
+  dog: Dog
+---
+kind: scale-matrix
+title: How much do you like
+choices:
+  A1: Not at all
+  A2: A bit
+  A3: A lot
+lines:
+  - Mondays
+  - Fridays
+---
+kind: tree
+title: Where do you live
+choices:
+  eu:
+    title: Europe
+    choices:
+      gr:
+        title: Greece
+      other:
+        title: Elsewhere in Europe
+        is_text: true
+  us:
+    title: United States
+---
+kind: textarea
+title: Anything else
+'''
+
+
+@pytest.fixture
+def questionnaire():
+    return compile_questionnaire(QUESTIONNAIRE)
+
+
+def make_app(database_url):
+    app = flask.Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    model.db.init_app(app)
+    return app
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f'sqlite:///{tmp_path / "questionnaire.sqlite"}'
+
+
+@pytest.fixture(scope='session')
+def web_app(tmp_path_factory):
+    """The app module, imported once with mocked reddit logins and a database of its own (set up by upgrade-db).
+
+    The default survey has the QUESTIONNAIRE above. The tests share the database, so they use voters of their own.
+    """
+    directory = tmp_path_factory.mktemp('app')
+    questionnaire_path = directory / 'questionnaire.yml'
+    questionnaire_path.write_text(QUESTIONNAIRE, encoding='utf8')
+    os.environ.update(
+        MOCK='1', MOCK_OAUTH='1', FLASK_SECRET_KEY='test', QUESTIONNAIRE_URL=questionnaire_path.as_uri(),
+        DATABASE_URL=f'sqlite:///{directory / "questionnaire.sqlite"}',
+        REDDIT_OAUTH_REDIRECT_URL='http://localhost/authorize_callback')
+    import app
+    result = app.app.test_cli_runner().invoke(args=['upgrade-db'])
+    assert result.exit_code == 0, result.output
+    return app
+
+
+def log_in(client, user_id):
+    with client.session_transaction() as flask_session:
+        flask_session['me'] = {'id': user_id, 'name': user_id, 'created_utc': 0}
+
+
+@pytest.fixture
+def db(database_url):
+    """The (empty) database of a new app, with the default survey, in an app context."""
+    app = make_app(database_url)
+    with app.app_context():
+        model.db.create_all()
+        model.db.session.add(model.Survey(survey_id=model.DEFAULT_SURVEY_ID, slug='main', questionnaire_url=''))
+        model.db.session.commit()
+        yield model.db
+        model.db.session.remove()
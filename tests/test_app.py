@@ -0,0 +1,157 @@
+import json
+import os
+import re
+
+import crosstab
+import model
+from conftest import log_in
+from test_model import SURVEY_ID, submit
+
+
+def test_expand_question(web_app, questionnaire):
+    expanded = web_app.expand_question(('q_3_2', '2', 4, 3, '2'), questionnaire)
+    assert expanded['question_text'] == 'How much do you like: Fridays'
+    assert expanded['answer_text'] == 'A bit'
+    assert expanded['vote_count'] == 4
+    assert web_app.expand_question(('q_3_1', 'maybe', 1, 3, '1'), questionnaire)['answer_text'] == '\0†maybe'
+    assert web_app.expand_question(('q_9', 'x', 1, 9, ''), questionnaire) is None
+
+
+def test_expand_question_skips_malformed_scale_rows(web_app, questionnaire):
+    for code, answer_value, question_suffix in (
+            ('q_3_3', '1', '3'), ('q_3_0', '1', '0'), ('q_3_x', '1', 'x'), ('q_3_1', '4', '1'), ('q_3_1', '0', '1'),
+            ('q_3_1', 'abc', '1')):
+        assert web_app.expand_question((code, answer_value, 1, 3, question_suffix), questionnaire) is None
+
+
+def test_crosstab_skips_malformed_rows(web_app, db, questionnaire):
+    # stored by an older questionnaire with more lines and a longer scale
+    submit('a', {'q_1': 'red', 'q_3_1': '2', 'q_3_3': '1'})
+    submit('b', {'q_1': 'blue', 'q_3_1': '5'})
+    table = crosstab.crosstab(SURVEY_ID, questionnaire, web_app.expand_question, 1, 3, {})
+    assert [category['code'] for category in table['columns']['categories']] == ['q_3_1']
+    assert table['counts'] == [[1], [0]]
+    assert model.Answer.query.filter_by(code='q_3_3').count() == 1
+
+
+def test_metrics_only_from_localhost(web_app):
+    client = web_app.app.test_client()
+    assert client.get('/metrics').status_code == 200
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '203.0.113.5'}).status_code == 404
+    # the proxy headers can't make a remote request look local
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '203.0.113.5'},
+                      headers={'X-Forwarded-For': '127.0.0.1'}).status_code == 404
+    assert client.get('/metrics', headers={'X-Forwarded-For': '203.0.113.5'}).status_code == 404
+
+
+def test_metrics_token(web_app, monkeypatch):
+    monkeypatch.setattr(web_app, 'metrics_token', 'secret')
+    client = web_app.app.test_client()
+    assert client.get('/metrics').status_code == 403
+    response = client.get('/metrics', environ_base={'REMOTE_ADDR': '203.0.113.5'},
+                          headers={'Authorization': 'Bearer secret'})
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+
+
+def test_remembered_vote_belongs_to_the_user(web_app):
+    client = web_app.app.test_client()
+    log_in(client, 'remember-alice')
+    assert client.post('/done', data={'q_1': 'red'}).status_code == 200
+    with client.session_transaction() as flask_session:
+        remembered = flask_session['voter']
+    assert remembered['user_id'] == 'remember-alice'
+    assert remembered['receipt_id'] == {cookie.name: cookie.value for cookie in client.cookie_jar}['receipt_id']
+    # found through the remembered vote id
+    assert client.post('/done', data={'q_1': 'blue'}).status_code == 200
+
+    # someone else logs in on the same browser, with alice's receipt cookie and remembered vote
+    log_in(client, 'remember-mallory')
+    assert client.post('/done', data={'q_1': 'red'}).status_code == 200
+    with web_app.app.app_context():
+        alice = model.db.session.get(model.Vote, remembered['vote_id'])
+        assert {answer.code: answer.answer_value for answer in alice.answers} == {'q_1': 'blue'}
+        assert model.Receipt.query.filter_by(user_id='remember-mallory').count() == 1
+
+
+def test_survey_routing(web_app, monkeypatch):
+    monkeypatch.setattr(web_app, 'hosted_surveys', web_app.surveys.Surveys(reload_after=0, retry_unknown_after=0))
+    questionnaire_url = os.environ['QUESTIONNAIRE_URL']
+    result = web_app.app.test_cli_runner().invoke(args=['add-survey', 'routing', questionnaire_url])
+    assert result.exit_code == 0, result.output
+
+    with web_app.app.test_request_context('/s/routing/home'):
+        web_app.app.preprocess_request()
+        assert web_app.g.survey.slug == 'routing'
+        assert web_app.url_for('save') == '/s/routing/done'
+        assert web_app.url_for('static', filename='app.css') == '/static/app.css'
+    with web_app.app.test_request_context('/home'):
+        web_app.app.preprocess_request()
+        assert web_app.g.survey.survey_id == model.DEFAULT_SURVEY_ID
+        assert web_app.url_for('save') == '/done'
+
+    client = web_app.app.test_client()
+    log_in(client, 'routing-alice')
+    assert client.get('/s/nonexistent/home').status_code == 404
+    assert client.get('/s/routing/home').status_code == 200
+    assert client.post('/s/routing/done', data={'q_1': 'red'}).status_code == 200
+    assert 'receipt_id_routing' in {cookie.name for cookie in client.cookie_jar}
+    with web_app.app.app_context():
+        survey_ids = [survey_id for survey_id, in model.db.session.query(model.Receipt.survey_id).filter(
+            model.Receipt.user_id == 'routing-alice')]
+        assert survey_ids == [web_app.hosted_surveys.by_slug('routing').survey_id]
+        assert survey_ids != [model.DEFAULT_SURVEY_ID]
+
+
+def home_answers(client):
+    page = client.get('/home').get_data(as_text=True)
+    match = re.search(r"getElementById\('questionnaire'\), (\{.*\})\);", page)
+    return json.loads(match.group(1)) if match else {}
+
+
+def test_autosave(web_app):
+    client = web_app.app.test_client()
+    assert client.post('/autosave', json={'q_1': 'blue'}).status_code == 401
+    log_in(client, 'autosave-alice')
+    assert client.post('/autosave', json=['q_1', 'blue']).status_code == 400
+    client.post('/done', data={'q_1': 'red', 'q_5': 'Hello'})
+
+    response = client.post('/autosave', json={'q_1': 'blue', 'q_5': '', 'q_9': 'x'})
+    assert response.status_code == 204
+    cookies = {cookie.name: cookie.value for cookie in client.cookie_jar}
+    assert 'draft_id' in cookies
+    assert client.post('/autosave', json={'q_2_cat': 'YES'}).status_code == 204
+    assert {cookie.name: cookie.value for cookie in client.cookie_jar}['draft_id'] == cookies['draft_id']
+    # the form shows the submitted answers with the draft over them, and the results only the submitted ones
+    assert home_answers(client) == {'q_1': 'blue', 'q_2_cat': 'YES'}
+    with web_app.app.app_context():
+        vote = model.Vote.query.join(model.Answer).filter(model.Answer.answer_value == 'Hello').one()
+        assert {answer.code: answer.answer_value for answer in vote.answers} == {'q_1': 'red', 'q_5': 'Hello'}
+
+    # the next submission replaces the draft
+    client.post('/done', data={'q_1': 'blue'})
+    assert 'draft_id' not in {cookie.name for cookie in client.cookie_jar}
+    assert home_answers(client) == {'q_1': 'blue'}
+    with web_app.app.app_context():
+        assert model.Draft.query.count() == 0
+
+
+def test_results_etag(web_app, monkeypatch):
+    monkeypatch.setattr(web_app, 'testers', frozenset(['results-tester']))
+    client = web_app.app.test_client()
+    log_in(client, 'results-tester')
+    response = client.get('/results?json')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+    etag = response.headers['ETag']
+    assert client.get('/results?json', headers={'If-None-Match': etag}).status_code == 304
+    # the page has an ETag of its own
+    assert client.get('/results', headers={'If-None-Match': etag}).status_code == 200
+
+    voter = web_app.app.test_client()
+    log_in(voter, 'results-voter')
+    voter.post('/done', data={'q_1': 'blue'})
+    response = client.get('/results?json', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert client.get('/results?json', headers={'If-None-Match': response.headers['ETag']}).status_code == 304
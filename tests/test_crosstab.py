@@ -0,0 +1,26 @@
+import pytest
+
+import crosstab
+from test_model import SURVEY_ID, submit
+
+
+def test_parse_filters():
+    assert crosstab.parse_filters(['q_3:yes', 'q_3:maybe', 'q_5_1:2']) == {'q_3': ('maybe', 'yes'), 'q_5_1': ('2',)}
+    assert crosstab.parse_filters([]) == {}
+
+
+@pytest.mark.parametrize('value', ['q_abc:1', 'x:1', 'q_3'])
+def test_parse_filters_rejects(value):
+    with pytest.raises(crosstab.CrosstabError):
+        crosstab.parse_filters([value])
+
+
+def test_count_matrix(db):
+    submit('a', {'q_1': 'red', 'q_2_cat': 'YES', 'q_2_dog': 'YES'})
+    submit('b', {'q_1': 'blue', 'q_2_cat': 'YES'})
+    submit('c', {'q_1': 'red'})
+    assert crosstab.count_matrix(SURVEY_ID, 1, 2, {}) == {
+        ('q_1', 'red', 'q_2_cat', 'YES'): 1, ('q_1', 'red', 'q_2_dog', 'YES'): 1, ('q_1', 'blue', 'q_2_cat', 'YES'): 1}
+    assert crosstab.count_matrix(SURVEY_ID, 1, 2, {'q_2_dog': ('YES',)}) == {
+        ('q_1', 'red', 'q_2_cat', 'YES'): 1, ('q_1', 'red', 'q_2_dog', 'YES'): 1}
+    assert crosstab.count_matrix(SURVEY_ID, 1, 2, {'q_1': ('green',)}) == {}
@@ -0,0 +1,20 @@
+import csv
+import io
+
+import export
+from test_model import SURVEY_ID, submit
+
+
+def test_answer_codes(db):
+    submit('a', {'q_4': 'gr', 'q_10': 'x', 'q_1': 'red', 'q_abc': 'x', 'q_3_2': '1', 'q_3_1': '2'})
+    assert export.answer_codes(SURVEY_ID) == ['q_1', 'q_3_1', 'q_3_2', 'q_4', 'q_10', 'q_abc']
+
+
+def test_as_csv_escapes_formulas():
+    rows = [dict(vote_id=1, q_1='=HYPERLINK("http://example.com")', q_2='-1+2', q_3='@SUM(A1)', q_4='+1'),
+            dict(vote_id=2, q_1='Hello', q_2='a=b', q_3=None, q_4='\tcmd')]
+    text = ''.join(export.as_csv(['vote_id', 'q_1', 'q_2', 'q_3', 'q_4'], rows))
+    assert list(csv.reader(io.StringIO(text))) == [
+        ['vote_id', 'q_1', 'q_2', 'q_3', 'q_4'],
+        ['1', '\'=HYPERLINK("http://example.com")', "'-1+2", "'@SUM(A1)", "'+1"],
+        ['2', 'Hello', 'a=b', '', "'\tcmd"]]
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+import http_client
+from http_client import CircuitBreaker, HttpClient, UpstreamUnavailable
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def perf_counter(self):
+        return time.perf_counter()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(http_client, 'time', clock)
+    return clock
+
+
+def test_circuit_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_after=30)
+    breaker.record_failure()
+    assert breaker.state == 'closed' and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    clock.now += 30
+    assert breaker.state == 'half-open'
+    # one trial call, and no other until it reports back
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.failures == 0
+    assert breaker.allow() and breaker.allow()
+
+
+def test_http_client_opens_the_circuit_on_server_errors(clock):
+    responses = [(503, {}), (502, {}), (200, {'ok': True})]
+    calls = []
+
+    def upstream(request):
+        calls.append(request.url)
+        return responses.pop(0)
+
+    http = HttpClient('test')
+    http.register('wiki', 'https://wiki.example.com/', retries=0, failure_threshold=2, reset_after=30)
+    http.stand_in('wiki', upstream)
+    assert http.get('wiki').status_code == 503
+    assert http.get('wiki').status_code == 502
+    with pytest.raises(UpstreamUnavailable, match='circuit open'):
+        http.get('wiki')
+    assert len(calls) == 2
+    stats = http.stats()['wiki']
+    assert (stats['requests'], stats['failures'], stats['rejected'], stats['circuit']) == (2, 2, 1, 'open')
+
+    clock.now += 30
+    assert http.get('wiki').json() == {'ok': True}
+    assert http.stats()['wiki']['circuit'] == 'closed'
@@ -0,0 +1,121 @@
+import sqlite3
+
+import pytest
+
+from journal import SubmissionJournal
+
+
+class Store:
+    def __init__(self):
+        self.batches = []
+        self.failing = False
+
+    def __call__(self, receipts, votes):
+        if self.failing:
+            raise RuntimeError('database unavailable')
+        self.batches.append((receipts, votes))
+
+
+@pytest.fixture
+def store():
+    return Store()
+
+
+@pytest.fixture
+def journal(tmp_path, store):
+    journal = SubmissionJournal(str(tmp_path / 'journal.sqlite'), store, batch_size=10)
+    # the tests drain the journal themselves
+    journal.start_writer = lambda: None
+    return journal
+
+
+def stored_votes(store):
+    return [(survey_id, user_hash, answers) for _, votes in store.batches for survey_id, user_hash, answers, _ in votes]
+
+
+def test_enqueue_and_drain(journal, store):
+    journal.enqueue(1, 'user1', 'hash1', {'q_1': 'red'})
+    journal.enqueue(1, None, 'hash2', {'q_1': 'blue'})
+    assert journal.has_receipt(1, 'user1')
+    assert not journal.has_receipt(2, 'user1')
+    assert journal.pending_answers(1, 'hash1') == {'q_1': 'red'}
+    assert journal.backlog()[0] == 2
+
+    assert journal.drain() == 1
+    assert store.batches[0][0] == [(1, 'user1')]
+    assert stored_votes(store) == [(1, 'hash1', {'q_1': 'red'}), (1, 'hash2', {'q_1': 'blue'})]
+    assert journal.backlog() == (0, 0.0)
+    assert not journal.has_receipt(1, 'user1')
+    assert journal.pending_answers(1, 'hash1') is None
+
+
+def test_resubmission_replaces_unclaimed_vote(journal, store):
+    journal.enqueue(1, 'user1', 'hash1', {'q_1': 'red'})
+    journal.enqueue(1, None, 'hash1', {'q_1': 'blue'})
+    assert journal.backlog()[0] == 1
+    journal.drain()
+    assert stored_votes(store) == [(1, 'hash1', {'q_1': 'blue'})]
+
+
+def test_failed_batch_is_released(journal, store):
+    journal.enqueue(1, 'user1', 'hash1', {'q_1': 'red'})
+    store.failing = True
+    with pytest.raises(RuntimeError):
+        journal.drain_once()
+    assert journal.has_receipt(1, 'user1')
+    assert journal.pending_answers(1, 'hash1') == {'q_1': 'red'}
+
+    store.failing = False
+    journal.drain()
+    assert stored_votes(store) == [(1, 'hash1', {'q_1': 'red'})]
+
+
+def test_claims_of_a_crashed_writer_are_taken_over(journal, store):
+    journal.enqueue(1, 'user1', 'hash1', {'q_1': 'red'})
+    # claimed by a writer that never completes
+    receipts, votes = journal.claim()
+    assert receipts and votes
+    assert journal.claim() == ([], [])
+
+    journal.claim_timeout = -1
+    journal.drain()
+    assert store.batches[0][0] == [(1, 'user1')]
+    assert stored_votes(store) == [(1, 'hash1', {'q_1': 'red'})]
+
+
+def test_a_claimed_voter_waits_for_the_claim(journal, store):
+    journal.enqueue(1, 'user1', 'hash1', {'q_1': 'red'})
+    receipts, votes = journal.claim()
+    journal.enqueue(1, None, 'hash1', {'q_1': 'blue'})
+    # the newer submission of the same voter is only stored after the claimed one
+    assert journal.claim() == ([], [])
+    journal.complete(receipts, votes)
+    journal.drain()
+    assert stored_votes(store) == [(1, 'hash1', {'q_1': 'blue'})]
+
+
+def test_receipts_are_not_timestamped(journal):
+    journal.enqueue(1, 'user1', 'hash1', {'q_1': 'red'})
+    columns = [row[1] for row in sqlite3.connect(journal.path).execute('PRAGMA table_info(receipts)')]
+    assert columns == ['survey_id', 'user_id', 'claimed_at']
+
+
+def test_upgrade_of_a_journal_with_timestamped_receipts(tmp_path, store):
+    path = str(tmp_path / 'journal.sqlite')
+    connection = sqlite3.connect(path)
+    connection.executescript('''
+        CREATE TABLE receipts (
+            survey_id INTEGER NOT NULL, user_id TEXT NOT NULL, queued_at REAL NOT NULL, claimed_at REAL,
+            PRIMARY KEY (survey_id, user_id));
+        CREATE TABLE votes (
+            entry_id INTEGER PRIMARY KEY AUTOINCREMENT, survey_id INTEGER NOT NULL, user_hash TEXT NOT NULL,
+            answers TEXT NOT NULL, queued_at REAL NOT NULL, claimed_at REAL);
+        INSERT INTO receipts VALUES (1, 'user1', 1000, NULL);
+        INSERT INTO votes (survey_id, user_hash, answers, queued_at) VALUES (1, 'hash1', '{"q_1": "red"}', 1000);
+    ''')
+    connection.close()
+
+    journal = SubmissionJournal(path, store)
+    assert journal.has_receipt(1, 'user1')
+    journal.drain()
+    assert store.batches == [([(1, 'user1')], [(1, 'hash1', {'q_1': 'red'}, 1000)])]
@@ -0,0 +1,44 @@
+import sqlalchemy
+
+import migrations
+import model
+from conftest import make_app
+
+# the Answers and AnswerTallies of a database from before the question_number/question_suffix columns
+LEGACY_SCHEMA = '''
+CREATE TABLE "Answers" (
+    answer_id INTEGER PRIMARY KEY, survey_id INTEGER NOT NULL DEFAULT 1, code VARCHAR NOT NULL, answer_value VARCHAR,
+    vote_id INTEGER);
+CREATE TABLE "AnswerTallies" (
+    survey_id INTEGER NOT NULL DEFAULT 1, code VARCHAR NOT NULL, answer_value VARCHAR NOT NULL,
+    vote_count INTEGER NOT NULL, PRIMARY KEY (survey_id, code, answer_value));
+CREATE TABLE "Surveys" (
+    survey_id INTEGER PRIMARY KEY, slug VARCHAR NOT NULL UNIQUE, title VARCHAR, questionnaire_url VARCHAR NOT NULL);
+INSERT INTO "Surveys" (survey_id, slug, questionnaire_url) VALUES (1, 'main', '');
+INSERT INTO "Answers" (answer_id, code, answer_value, vote_id) VALUES
+    (1, 'q_1', 'red', 1), (2, 'q_3_2', '3', 1), (3, 'q_abc', 'x', 1), (4, 'q_', 'x', 1), (5, 'q_2_text', 'hi', 1);
+INSERT INTO "AnswerTallies" (code, answer_value, vote_count) VALUES ('q_1', 'red', 1), ('q_abc', 'x', 1);
+'''
+
+
+def test_upgrade_with_legacy_codes(database_url):
+    app = make_app(database_url)
+    with app.app_context():
+        engine = model.db.engine
+        with engine.begin() as connection:
+            for statement in LEGACY_SCHEMA.split(';'):
+                if statement.strip():
+                    connection.execute(sqlalchemy.text(statement))
+        model.db.create_all()
+        migrations.upgrade(engine)
+        # every start runs the upgrade again
+        migrations.upgrade(engine)
+
+        with engine.connect() as connection:
+            answers = dict((code, (number, suffix)) for code, number, suffix in connection.execute(sqlalchemy.text(
+                'SELECT code, question_number, question_suffix FROM "Answers"')))
+            tallies = dict((code, (number, suffix)) for code, number, suffix in connection.execute(sqlalchemy.text(
+                'SELECT code, question_number, question_suffix FROM "AnswerTallies"')))
+        assert answers == {'q_1': (1, ''), 'q_3_2': (3, '2'), 'q_abc': (None, None), 'q_': (None, None),
+                           'q_2_text': (2, 'text')}
+        assert tallies == {'q_1': (1, ''), 'q_abc': (None, None)}
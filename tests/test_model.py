@@ -0,0 +1,172 @@
+import datetime
+
+import model
+
+SURVEY_ID = model.DEFAULT_SURVEY_ID
+
+
+def tallies():
+    return {(tally.code, tally.answer_value): tally.vote_count
+            for tally in model.AnswerTally.query.filter_by(survey_id=SURVEY_ID) if tally.vote_count}
+
+
+def submit(user_hash, answers, datestamp=None):
+    """What /done does with the answers of a voter (without the journal)."""
+    vote = model.Vote.query.filter_by(survey_id=SURVEY_ID, user_hash=user_hash).first()
+    if vote is None:
+        vote = model.Vote(survey_id=SURVEY_ID, user_hash=user_hash)
+        model.db.session.add(vote)
+    vote.datestamp = datestamp or datetime.datetime.utcnow()
+    deltas = model.store_answers(vote, answers)
+    model.apply_tally_deltas(SURVEY_ID, deltas)
+    vote.stored_shard, vote.stored_version = model.bump_data_version(SURVEY_ID)
+    model.db.session.commit()
+    return vote, deltas
+
+
+def test_store_answers_new_vote(db):
+    vote, deltas = submit('a', {'q_1': 'red', 'q_2_cat': 'YES'})
+    assert deltas == {('q_1', 'red'): 1, ('q_2_cat', 'YES'): 1}
+    assert tallies() == {('q_1', 'red'): 1, ('q_2_cat', 'YES'): 1}
+    answer = model.Answer.query.filter_by(vote_id=vote.vote_id, code='q_2_cat').one()
+    assert (answer.question_number, answer.question_suffix) == (2, 'cat')
+
+
+def test_store_answers_resubmission(db):
+    submit('a', {'q_1': 'red', 'q_2_cat': 'YES', 'q_5': 'Hello'})
+    submit('b', {'q_1': 'red'})
+    vote, deltas = submit('a', {'q_1': 'blue', 'q_2_dog': 'YES', 'q_5': 'Hello'})
+    # unchanged answers are not written again
+    assert deltas == {('q_1', 'red'): -1, ('q_1', 'blue'): 1, ('q_2_cat', 'YES'): -1, ('q_2_dog', 'YES'): 1}
+    assert tallies() == {('q_1', 'red'): 1, ('q_1', 'blue'): 1, ('q_2_dog', 'YES'): 1, ('q_5', 'Hello'): 1}
+    assert {answer.code: answer.answer_value for answer in vote.answers} == {
+        'q_1': 'blue', 'q_2_dog': 'YES', 'q_5': 'Hello'}
+    assert model.check_tallies() == []
+
+
+def test_store_answers_unchanged(db):
+    submit('a', {'q_1': 'red'})
+    _, deltas = submit('a', {'q_1': 'red'})
+    assert not +deltas
+    assert tallies() == {('q_1', 'red'): 1}
+
+
+def test_rebuild_tallies(db):
+    submit('a', {'q_1': 'red', 'q_2_cat': 'YES'})
+    submit('b', {'q_1': 'red'})
+    expected = tallies()
+    model.AnswerTally.query.filter_by(code='q_1').update({model.AnswerTally.vote_count: 5})
+    model.db.session.commit()
+    assert model.check_tallies() == [(SURVEY_ID, 'q_1', 'red', 5, 2)]
+    assert model.rebuild_tallies() == 2
+    model.db.session.commit()
+    assert model.check_tallies() == []
+    assert tallies() == expected
+
+
+def test_store_answers_only_writes_differences(db):
+    vote, _ = submit('a', {'q_1': 'red', 'q_2_cat': 'YES', 'q_5': 'Hello'})
+    ids = {answer.code: answer.answer_id for answer in vote.answers}
+    _, deltas = submit('a', {'q_1': 'red', 'q_2_cat': 'YES', 'q_5': 'Hello'})
+    assert not +deltas
+    assert tallies() == {('q_1', 'red'): 1, ('q_2_cat', 'YES'): 1, ('q_5', 'Hello'): 1}
+
+    model.db.session.expire_all()
+    vote, _ = submit('a', {'q_1': 'blue', 'q_5': 'Hello'})
+    # the changed answer is updated in place, the removed one deleted, the unchanged one left alone
+    assert {answer.code: answer.answer_id for answer in vote.answers} == {'q_1': ids['q_1'], 'q_5': ids['q_5']}
+    assert model.Answer.query.get(ids['q_1']).answer_value == 'blue'
+
+
+def test_store_answers_removes_duplicates(db):
+    vote, _ = submit('a', {'q_1': 'red'})
+    # left over from older versions, which could store an answer twice
+    model.db.session.add(model.Answer(vote_id=vote.vote_id, survey_id=SURVEY_ID, code='q_1', answer_value='red'))
+    model.db.session.commit()
+    model.db.session.expire_all()
+    submit('a', {'q_1': 'red'})
+    assert [answer.code for answer in model.Answer.query.filter_by(vote_id=vote.vote_id)] == ['q_1']
+
+
+def test_data_version(db, monkeypatch):
+    shards = iter([3, 3, 7])
+    monkeypatch.setattr(model.random, 'randrange', lambda stop: next(shards))
+    assert model.data_version(SURVEY_ID) == 0
+    first, _ = submit('a', {'q_1': 'red'})
+    second, _ = submit('b', {'q_1': 'red'})
+    assert [(vote.stored_shard, vote.stored_version) for vote in (first, second)] == [(3, 1), (3, 2)]
+    # a resubmission moves the version, even though it adds no vote
+    submit('a', {'q_1': 'blue'})
+    assert (first.stored_shard, first.stored_version) == (7, 1)
+    assert model.data_versions(SURVEY_ID) == {3: 2, 7: 1}
+    assert model.data_version(SURVEY_ID) == 3
+
+    stored = model.stored_between({3: 1}, model.data_versions(SURVEY_ID))
+    assert sorted(vote.user_hash for vote in model.Vote.query.filter(stored)) == ['a', 'b']
+    assert model.stored_between({3: 2, 7: 1}, model.data_versions(SURVEY_ID)) is None
+
+
+def test_voter_state(db):
+    assert not model.voter_state(SURVEY_ID, 'user1', 'a').has_receipt
+    model.db.session.add(model.Receipt(survey_id=SURVEY_ID, user_id='user1'))
+    model.db.session.commit()
+    voter = model.voter_state(SURVEY_ID, 'user1')
+    assert voter.has_receipt and not voter.has_vote
+
+    vote, _ = submit('a', {'q_1': 'red', 'q_5': 'Hello'})
+    voter = model.voter_state(SURVEY_ID, 'user1', 'a')
+    assert voter.vote is vote
+    assert voter.answers == {'q_1': 'red', 'q_5': 'Hello'}
+    assert sorted(code for _, code, _ in voter.answer_rows) == ['q_1', 'q_5']
+    # someone else's receipt cookie
+    assert model.voter_state(SURVEY_ID, 'user1', 'b').vote is None
+
+    remembered = model.voter_state(SURVEY_ID, 'user1', 'a', vote_id=vote.vote_id)
+    assert remembered.vote is vote and remembered.answers == voter.answers
+    assert model.voter_state(SURVEY_ID, 'user1', 'b', vote_id=vote.vote_id).vote is None
+    voter.pending = {'q_1': 'blue'}
+    assert voter.answers == {'q_1': 'blue'}
+
+
+def test_drafts(db):
+    monday, tuesday = datetime.datetime(2020, 1, 6), datetime.datetime(2020, 1, 7)
+    model.save_draft(SURVEY_ID, 'draft1', {'q_1': 'red', 'q_5': 'Hel'}, monday)
+    model.save_draft(SURVEY_ID, 'draft1', {'q_5': 'Hello', 'q_2_cat': None}, tuesday)
+    model.save_draft(SURVEY_ID, 'draft2', {'q_1': 'blue'}, monday)
+    model.db.session.commit()
+    assert model.draft_changes(SURVEY_ID, 'draft1') == {'q_1': 'red', 'q_5': 'Hello', 'q_2_cat': None}
+    # drafts are never counted
+    assert tallies() == {}
+
+    assert model.purge_drafts(tuesday) == 2
+    assert model.draft_changes(SURVEY_ID, 'draft1') == {'q_5': 'Hello', 'q_2_cat': None}
+    assert model.draft_changes(SURVEY_ID, 'draft2') == {}
+    model.discard_draft(SURVEY_ID, 'draft1')
+    assert model.draft_changes(SURVEY_ID, 'draft1') == {}
+
+
+def test_store_queued_submissions(db):
+    old, new = datetime.datetime(2020, 1, 1, 12, 0), datetime.datetime(2020, 1, 1, 12, 5)
+    model.store_queued_submissions([(SURVEY_ID, 'user1'), (SURVEY_ID, 'user2')], [
+        (SURVEY_ID, 'a', {'q_1': 'red'}, old), (SURVEY_ID, 'b', {'q_1': 'blue'}, old)])
+    model.db.session.commit()
+    # storing a batch again is harmless, and an older submission never replaces a newer one
+    model.store_queued_submissions([(SURVEY_ID, 'user1')], [
+        (SURVEY_ID, 'a', {'q_1': 'blue'}, new), (SURVEY_ID, 'b', {'q_1': 'red'}, old - datetime.timedelta(minutes=1))])
+    model.db.session.commit()
+    assert sorted(receipt.user_id for receipt in model.Receipt.query) == ['user1', 'user2']
+    assert tallies() == {('q_1', 'blue'): 2}
+    assert model.check_tallies() == []
+    assert model.data_version(SURVEY_ID) == 2
+
+
+def test_rollup_counts_late_votes(db):
+    submit('a', {'q_1': 'red'}, datetime.datetime(2020, 1, 1, 12, 0, 10))
+    assert model.rollup_submissions(SURVEY_ID) == 1
+    # stored from the journal long after it was queued
+    model.store_queued_submissions([], [(SURVEY_ID, 'b', {'q_1': 'red'}, datetime.datetime(2020, 1, 1, 11, 0, 30))])
+    submit('c', {'q_1': 'red'}, datetime.datetime(2020, 1, 1, 12, 0, 40))
+    assert model.rollup_submissions(SURVEY_ID) == 2
+    assert model.rollup_submissions(SURVEY_ID) == 0
+    assert model.submissions_per_minute(SURVEY_ID, datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 2)) == {
+        datetime.datetime(2020, 1, 1, 11, 0): 1, datetime.datetime(2020, 1, 1, 12, 0): 2}
@@ -0,0 +1,146 @@
+import cachelib
+import pytest
+import requests
+
+from questionnaire import (MAX_TEXT_LENGTH, Questionnaire, QuestionnaireStore, QuestionnaireUnavailable,
+                           compile_questionnaire, parse_code)
+from conftest import QUESTIONNAIRE
+
+
+class RecordingCache(cachelib.SimpleCache):
+    def __init__(self):
+        super().__init__()
+        self.read = []
+
+    def get(self, key):
+        self.read.append(key)
+        return super().get(key)
+
+
+class WikiStandIn:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    def get(self, endpoint, url, params=None, headers=None):
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = self.content
+        return response
+
+
+def test_question_ids(questionnaire):
+    # headers have no id
+    assert [question['id'] for question in questionnaire.pure_questions] == [1, 2, 3, 4, 5]
+    assert questionnaire.by_id[4]['title'] == 'Where do you live'
+    assert questionnaire.config['title'] == 'Test survey'
+
+
+def test_choice_lookups(questionnaire):
+    assert questionnaire.tree_choices[4]['gr'] == ('Greece', ('Europe', 'Greece'))
+    assert questionnaire.tree_choices[4]['us'] == ('United States', ('United States',))
+    assert questionnaire.scale_choices[3] == ('Not at all', 'A bit', 'A lot')
+
+
+def test_compiled_questionnaire_is_read_only(questionnaire):
+    assert isinstance(questionnaire, Questionnaire)
+    with pytest.raises(TypeError):
+        questionnaire.by_id[1]['title'] = 'Changed'
+    assert compile_questionnaire(QUESTIONNAIRE).content_hash == questionnaire.content_hash
+
+
+@pytest.mark.parametrize('code, parsed', [
+    ('q_12', (12, '')),
+    ('q_12_3', (12, '3')),
+    ('q_2_text', (2, 'text')),
+    ('q_4_eu_gr', (4, 'eu_gr')),
+])
+def test_parse_code(code, parsed):
+    assert parse_code(code) == parsed
+
+
+@pytest.mark.parametrize('code', ['q', 'q_', 'q_abc', 'q_abc_1', 'q__1', 'q_-1', ''])
+def test_parse_code_malformed(code):
+    assert parse_code(code) == (None, None)
+
+
+def test_answer_fields(questionnaire):
+    fields = questionnaire.answer_fields
+    assert fields['q_1'] == {'red', 'blue'}
+    assert fields['q_1_text'] is None
+    assert fields['q_2_cat'] == fields['q_2_dog'] == {'YES'}
+    assert fields['q_3_1'] == fields['q_3_2'] == {'1', '2', '3', 'maybe', 'no', 'yes'}
+    assert fields['q_4'] == {'eu', 'gr', 'other', 'us'}
+    assert fields['q_4_text'] is None
+    assert fields['q_5'] is None
+    assert 'q_3_3' not in fields
+
+
+def test_clean_answers(questionnaire):
+    answers, rejected = questionnaire.clean_answers([
+        ('q_1', 'red'), ('q_2_cat', 'YES'), ('q_3_1', 'maybe'), ('q_3_2', '3'), ('q_4', 'gr'), ('q_5', 'Hello'),
+        ('g-recaptcha-response', 'token'), ('q_2_dog', '')])
+    assert answers == {'q_1': 'red', 'q_2_cat': 'YES', 'q_3_1': 'maybe', 'q_3_2': '3', 'q_4': 'gr', 'q_5': 'Hello'}
+    assert not rejected
+
+
+def test_clean_answers_rejects_unknown_fields_and_values(questionnaire):
+    answers, rejected = questionnaire.clean_answers([
+        ('q_1', 'green'), ('q_2_cat', 'NO'), ('q_3_1', '4'), ('q_3_3', '1'), ('q_9', 'x'), ('q_abc', 'x'), ('q_', 'x'),
+        ('q_2', 'YES')])
+    assert answers == {}
+    assert rejected == {'invalid_value': 3, 'unknown_field': 5}
+
+
+def test_clean_answers_cuts_long_texts(questionnaire):
+    answers, rejected = questionnaire.clean_answers([('q_5', 'x' * 1000), ('q_1_text', 'y' * MAX_TEXT_LENGTH)])
+    assert len(answers['q_5']) == len(answers['q_1_text']) == MAX_TEXT_LENGTH
+    assert answers['q_5'].endswith('…')
+    assert rejected == {'too_long': 2}
+
+
+def test_clean_changes(questionnaire):
+    answers, rejected = questionnaire.clean_changes([('q_1', ''), ('q_2_cat', 'YES'), ('q_abc', ''), ('q_3_1', '7')])
+    assert answers == {'q_1': None, 'q_2_cat': 'YES'}
+    assert rejected == {'invalid_value': 1}
+
+
+def test_questionnaire_store_reads_the_text_only_to_compile(tmp_path):
+    path = tmp_path / 'questionnaire.yml'
+    path.write_text(QUESTIONNAIRE, encoding='utf8')
+    cache = RecordingCache()
+    store = QuestionnaireStore(cache, path.as_uri(), None)
+    first = store.get()
+    assert first.config['title'] == 'Test survey'
+    assert store.stats == {'miss': 1, 'compile': 1}
+
+    # another worker
+    other = QuestionnaireStore(cache, path.as_uri(), None)
+    cache.read.clear()
+    assert other.get().content_hash == first.content_hash
+    assert cache.read == [other.cache_key, other.text_key(first.content_hash)]
+    cache.read.clear()
+    other.get()
+    assert cache.read == [other.cache_key]
+
+
+def test_questionnaire_store_fetches_an_evicted_text_again(tmp_path):
+    path = tmp_path / 'questionnaire.yml'
+    path.write_text(QUESTIONNAIRE, encoding='utf8')
+    cache = cachelib.SimpleCache()
+    content_hash = QuestionnaireStore(cache, path.as_uri(), None).get().content_hash
+    other = QuestionnaireStore(cache, path.as_uri(), None)
+    cache.delete(other.text_key(content_hash))
+    assert other.get().content_hash == content_hash
+    assert other.stats == {'hit': 1, 'text_miss': 1, 'compile': 1}
+
+
+@pytest.mark.parametrize('status_code, content', [
+    (200, b'<html>Our CDN is having a bad day</html>'),
+    (200, b'{"kind": "Listing"}'),
+    (503, b'Service Unavailable'),
+])
+def test_questionnaire_store_unavailable(status_code, content):
+    store = QuestionnaireStore(cachelib.SimpleCache(), 'https://example.com/wiki', WikiStandIn(status_code, content))
+    with pytest.raises(QuestionnaireUnavailable):
+        store.get()
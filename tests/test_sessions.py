@@ -0,0 +1,87 @@
+import cachelib
+import flask
+import pytest
+
+import sessions
+
+
+@pytest.fixture(params=['sqlite', 'cache'])
+def store(request, tmp_path):
+    if request.param == 'sqlite':
+        return sessions.SqliteSessionStore(str(tmp_path / 'sessions.sqlite'))
+    return sessions.CacheSessionStore(cachelib.SimpleCache())
+
+
+@pytest.fixture
+def client(store):
+    app = flask.Flask(__name__)
+    app.secret_key = 'test'
+    app.session_interface = sessions.ServerSideSessionInterface(store)
+
+    @app.route('/login/<name>')
+    def login(name):
+        flask.session.regenerate()
+        flask.session['me'] = name
+        return ''
+
+    @app.route('/me')
+    def me():
+        return flask.session.get('me', '')
+
+    @app.route('/logout')
+    def logout():
+        flask.session.clear()
+        return ''
+
+    return app.test_client()
+
+
+def session_cookie(client):
+    return {cookie.name: cookie.value for cookie in client.cookie_jar}.get('session')
+
+
+def test_sessions_are_kept_in_the_store(client, store):
+    client.get('/me')
+    assert session_cookie(client) is None
+
+    client.get('/login/alice')
+    session_id = session_cookie(client)
+    # only the id goes in the cookie
+    assert 'alice' not in session_id
+    assert 'alice' in store.get(session_id)
+    assert client.get('/me').text == 'alice'
+
+    client.get('/logout')
+    assert session_cookie(client) is None
+    assert store.get(session_id) is None
+
+
+def test_login_moves_the_session_to_a_new_id(client, store):
+    client.get('/login/alice')
+    first_id = session_cookie(client)
+    client.get('/login/bob')
+    second_id = session_cookie(client)
+    assert second_id != first_id
+    assert store.get(first_id) is None
+
+    # an id handed out before the login is of no use afterwards
+    client.set_cookie('localhost', 'session', first_id)
+    assert client.get('/me').text == ''
+    client.set_cookie('localhost', 'session', second_id)
+    assert client.get('/me').text == 'bob'
+
+
+def test_unchanged_sessions_are_not_written(client, store, monkeypatch):
+    client.get('/login/alice')
+    writes = []
+    monkeypatch.setattr(store, 'set', lambda *args: writes.append(args))
+    client.get('/me')
+    assert writes == []
+
+
+def test_sqlite_store_expires_sessions(tmp_path):
+    store = sessions.SqliteSessionStore(str(tmp_path / 'sessions.sqlite'))
+    store.set('old', '{}', -1)
+    store.set('current', '{}', 60)
+    assert store.get('old') is None
+    assert store.get('current') == '{}'
@@ -0,0 +1,44 @@
+import threading
+
+from util import SingleFlight
+
+
+def test_single_flight_computes_once():
+    flight = SingleFlight()
+    cache = {}
+    computing = threading.Event()
+    release = threading.Event()
+    computed = []
+
+    def compute():
+        computed.append(1)
+        computing.set()
+        release.wait(5)
+        cache['key'] = 'value'
+        return 'value'
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(flight.get('key', lambda: cache.get('key'), compute)))
+    first.start()
+    computing.wait(5)
+    others = [threading.Thread(target=lambda: results.append(flight.get('key', lambda: cache.get('key'), compute)))
+              for _ in range(3)]
+    for thread in others:
+        thread.start()
+    release.set()
+    for thread in [first] + others:
+        thread.join(5)
+    assert results == ['value'] * 4
+    assert len(computed) == 1
+    assert flight._locks == {}
+    # once cached, there's nothing to wait for
+    assert flight.get('key', lambda: cache.get('key'), compute) == 'value'
+    assert len(computed) == 1
+
+
+def test_single_flight_keys_are_independent():
+    flight = SingleFlight()
+    assert flight.get('a', lambda: None, lambda: 1) == 1
+    assert flight.get('b', lambda: None, lambda: 2) == 2
+    # nothing cached: every caller computes
+    assert flight.get('a', lambda: None, lambda: 3) == 3
@@ -0,0 +1,43 @@
+import datetime
+
+import crosstab
+import model
+from test_model import SURVEY_ID, submit
+from vote_matrix import VoteMatrix
+
+
+def database_counts():
+    return {(code, value): count for _, code, value, count, _, _ in model.counted_answers(SURVEY_ID)}
+
+
+def test_refresh(db):
+    submit('a', {'q_1': 'red', 'q_2_cat': 'YES', 'q_5': 'Hello'})
+    submit('b', {'q_1': 'blue', 'q_2_cat': 'YES', 'q_2_dog': 'YES'})
+    matrix = VoteMatrix(SURVEY_ID)
+    assert matrix.refresh(force=True) == 2
+    assert len(matrix) == 2
+    assert matrix.counts() == database_counts()
+
+    # a resubmission, a new vote, and a vote stored late from the journal with an old datestamp
+    submit('a', {'q_1': 'blue', 'q_2_dog': 'YES'})
+    submit('c', {'q_1': 'red'})
+    model.store_queued_submissions([], [
+        (SURVEY_ID, 'd', {'q_1': 'red', 'q_2_cat': 'YES'}, datetime.datetime(2000, 1, 1))])
+    model.db.session.commit()
+    assert matrix.refresh(force=True) == 3
+    assert len(matrix) == 4
+    assert matrix.counts() == database_counts()
+    assert matrix.refresh(force=True) == 0
+
+
+def test_count_matrix(db):
+    submit('a', {'q_1': 'red', 'q_2_cat': 'YES', 'q_2_dog': 'YES'})
+    submit('b', {'q_1': 'blue', 'q_2_cat': 'YES'})
+    submit('c', {'q_1': 'red'})
+    matrix = VoteMatrix(SURVEY_ID)
+    assert matrix.count_matrix(1, 2, {}) == {
+        ('q_1', 'red', 'q_2_cat', 'YES'): 1, ('q_1', 'red', 'q_2_dog', 'YES'): 1, ('q_1', 'blue', 'q_2_cat', 'YES'): 1}
+    assert matrix.count_matrix(1, 2, {'q_2_dog': ('YES',)}) == {
+        ('q_1', 'red', 'q_2_cat', 'YES'): 1, ('q_1', 'red', 'q_2_dog', 'YES'): 1}
+    for filters in ({}, {'q_2_dog': ('YES',)}, {'q_1': ('blue', 'red'), 'q_2_cat': ('YES',)}):
+        assert matrix.count_matrix(1, 2, filters) == crosstab.count_matrix(SURVEY_ID, 1, 2, filters)
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+import ruamel.yaml
+
+import yaml_wrapper
+from conftest import QUESTIONNAIRE
+
+TEXTS = {
+    'questionnaire': QUESTIONNAIRE,
+    'anchors carried over': '''
+kind: radio
+choices: &answers
+  yes: Yes
+  no: No
+---
+kind: radio
+title: Again
+choices: *answers
+''',
+    'block scalars': '''---
+kind: html
+text: |
+  <p>First</p>
+
+  <p>Second, after an empty line</p>
+folded: >
+  one
+  two
+---
+# a comment
+kind: header   # and another
+title: 'Quoted: "with" colons'
+''',
+    'flow collections': 'lines: [a, b, "c, d"]\nchoices: {A1: One, A2: Two}\n---\n- a list\n- document\n',
+    'windows line ends': 'kind: text\r\ntitle: One\r\n---\r\nkind: text\r\ntitle: Two\r\n',
+    'empty documents': '---\n---\nkind: text\n---\n# only a comment\n---\n',
+    'document end markers': 'kind: text\n...\n---\nkind: header\n---\n',
+    'directives': '%YAML 1.2\n---\nkind: text\n',
+    'content after a document start': '--- {kind: text}\n--- {kind: header}\n',
+}
+
+
+def as_json(documents):
+    # the same values, in the same order
+    return json.dumps(documents, default=str)
+
+
+@pytest.mark.parametrize('name', TEXTS)
+def test_load_all_matches_the_round_trip_loader(name):
+    text = TEXTS[name]
+    # without the empty documents
+    expected = [document for document in yaml_wrapper.yaml.load_all(text) if document is not None]
+    assert as_json(yaml_wrapper.load_all(text)) == as_json(expected)
+
+
+def test_load_all_keeps_the_key_order():
+    documents = yaml_wrapper.load_all('b: 1\na: 2\nc: {z: 1, y: 2}\n')
+    assert list(documents[0]) == ['b', 'a', 'c']
+    assert list(documents[0]['c']) == ['z', 'y']
+
+
+def test_load_all_reports_errors():
+    with pytest.raises(ruamel.yaml.YAMLError):
+        yaml_wrapper.load_all('kind: radio\nchoices: [unclosed\n')
@@ -0,0 +1,85 @@
+"""Submissions per minute, hour or day, to watch the response rate (e.g. after an announcement).
+
+The counts come from the SubmissionRollups table (see model.rollup_submissions), which every worker brings up to date
+at most every ``rollup_interval`` seconds, recounting only the minutes that got votes since. Times are in UTC.
+"""
+import datetime
+import threading
+import time
+
+import model
+
+RESOLUTIONS = {
+    'minute': datetime.timedelta(minutes=1),
+    'hour': datetime.timedelta(hours=1),
+    'day': datetime.timedelta(days=1),
+}
+DEFAULT_BUCKETS = {'minute': 180, 'hour': 72, 'day': 60}
+MAX_BUCKETS = 1500
+
+
+class TimelineError(ValueError):
+    pass
+
+
+def bucket_start(moment, resolution):
+    moment = moment.replace(second=0, microsecond=0)
+    if resolution in ('hour', 'day'):
+        moment = moment.replace(minute=0)
+    if resolution == 'day':
+        moment = moment.replace(hour=0)
+    return moment
+
+
+def series(survey_id, resolution, buckets=None, now=None):
+    """A survey's submissions in the last ``buckets`` minutes, hours or days (the current one too), oldest first."""
+    if resolution not in RESOLUTIONS:
+        raise TimelineError(f'Resolution should be one of {", ".join(RESOLUTIONS)}')
+    if buckets is None:
+        buckets = DEFAULT_BUCKETS[resolution]
+    try:
+        buckets = int(buckets)
+    except ValueError:
+        raise TimelineError(f'Not a number of buckets: {buckets!r}')
+    if not 1 <= buckets <= MAX_BUCKETS:
+        raise TimelineError(f'The number of buckets should be between 1 and {MAX_BUCKETS}')
+
+    now = now or datetime.datetime.utcnow()
+    step = RESOLUTIONS[resolution]
+    last = bucket_start(now, resolution)
+    first = last - step * (buckets - 1)
+    counts = {first + step * number: 0 for number in range(buckets)}
+    for minute, submissions in model.submissions_per_minute(survey_id, first, last + step).items():
+        counts[bucket_start(minute, resolution)] += submissions
+    return dict(
+        resolution=resolution,
+        now=now.isoformat() + 'Z',
+        total=sum(counts.values()),
+        buckets=[dict(start=start.isoformat() + 'Z', submissions=submissions) for start, submissions in counts.items()])
+
+
+class Rollup:
+    def __init__(self, survey_id, interval=10):
+        self.survey_id = survey_id
+        self.interval = interval
+        self._rolled_up_at = None
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        """Bring the rollup up to date, unless this worker did less than ``interval`` seconds ago (or is doing it)."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            now = time.monotonic()
+            if self._rolled_up_at is not None and now - self._rolled_up_at < self.interval:
+                return False
+            try:
+                model.rollup_submissions(self.survey_id)
+                model.db.session.commit()
+            except Exception:
+                model.db.session.rollback()
+                raise
+            self._rolled_up_at = now
+            return True
+        finally:
+            self._lock.release()
@@ -1,3 +1,6 @@
+import threading
+
+
 def base36encode(number, alphabet='0123456789abcdefghijklmnopqrstuvwxyz'):
     """Converts an integer to a base36 string."""
     if not isinstance(number, int):
@@ -17,4 +20,38 @@ def base36encode(number, alphabet='0123456789abcdefghijklmnopqrstuvwxyz'):
         number, i = divmod(number, len(alphabet))
         base36 = alphabet[i] + base36
 
-    return sign + base36
\ No newline at end of file
+    return sign + base36
+
+
+class SingleFlight:
+    """Runs only one computation per key at a time in this process: concurrent callers of the same key wait for it.
+
+    ``get(key, load, compute)``: ``load()`` returns the cached value or None; on a miss, the first caller runs
+    ``compute()`` (which should also cache its result), and the others load what it cached once it is done.
+    """
+
+    def __init__(self):
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def get(self, key, load, compute):
+        value = load()
+        if value is not None:
+            return value
+        with self._guard:
+            lock, callers = self._locks.get(key, (None, 0))
+            lock = lock or threading.Lock()
+            self._locks[key] = lock, callers + 1
+        try:
+            with lock:
+                value = load()
+                if value is None:
+                    value = compute()
+                return value
+        finally:
+            with self._guard:
+                lock, callers = self._locks[key]
+                if callers == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = lock, callers - 1
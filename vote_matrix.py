@@ -0,0 +1,344 @@
+"""Columnar in-memory copy of the answers: one compact column per answer code, one row per vote.
+
+With ``VOTE_MATRIX=1`` every worker keeps one per survey, and the cross-tabulations and the votes export read it
+instead of scanning the Answers table. It is built on first use, then brought up to date (at most every
+``refresh_interval`` seconds) by reading only the votes stored since the last refresh (by their ``stored_shard`` and
+``stored_version``, see model.bump_data_version); resubmitted votes are updated in place.
+
+Columns come in three kinds:
+
+* flags, for codes only ever answered ``YES`` (checkboxes, checktree choices): one bit per vote;
+* categories, for the other codes with up to 255 different values (radio buttons, trees, scales...): one byte per
+  vote, 0 for no answer and otherwise the number of the value;
+* texts, for free text (the ``_text`` codes, and categories that outgrow 255 values): a dict of row to value, out of
+  line, since most votes leave them empty.
+
+A set of votes is a bitmask (a Python int, with bit ``i`` for row ``i``), so filtering is ``&`` and counting is
+``int.bit_count()``, both in C.
+"""
+import array
+import bisect
+import collections
+import datetime
+import itertools
+import operator
+import sys
+import threading
+import time
+
+import model
+from questionnaire import parse_code
+
+FLAG_VALUE = 'YES'
+MAX_CATEGORIES = 255
+READ_BATCH_SIZE = 5000
+EPOCH = datetime.datetime(1970, 1, 1)
+NO_DATESTAMP = -2 ** 63
+ZERO, ONE = b'01'
+
+
+def _microseconds(datestamp):
+    return NO_DATESTAMP if datestamp is None else (datestamp - EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def _digits_mask(digits):
+    """The bitmask of ``digits``, a bytearray of ``b'0'``/``b'1'`` with one digit per row, row 0 first."""
+    return int(digits[::-1], 2) if digits else 0
+
+
+class _Flags:
+    def __init__(self):
+        self.bits = bytearray()
+
+    def accepts(self, value):
+        return value == FLAG_VALUE
+
+    def get(self, row):
+        byte, bit = divmod(row, 8)
+        return FLAG_VALUE if byte < len(self.bits) and self.bits[byte] >> bit & 1 else None
+
+    def set(self, row, value):
+        byte, bit = divmod(row, 8)
+        if byte >= len(self.bits):
+            if value is None:
+                return
+            self.bits.extend(bytes(byte + 1 - len(self.bits)))
+        if value is None:
+            self.bits[byte] &= ~(1 << bit) & 0xFF
+        else:
+            self.bits[byte] |= 1 << bit
+
+    def items(self):
+        mask = self.mask((FLAG_VALUE,), 0)
+        return ((row, FLAG_VALUE) for row in range(mask.bit_length()) if mask >> row & 1)
+
+    def counts(self):
+        count = self.mask((FLAG_VALUE,), 0).bit_count()
+        return {FLAG_VALUE: count} if count else {}
+
+    def mask(self, values, rows):
+        return int.from_bytes(self.bits, 'little') if FLAG_VALUE in values else 0
+
+    def masks(self, rows):
+        mask = self.mask((FLAG_VALUE,), rows)
+        return {FLAG_VALUE: mask} if mask else {}
+
+    def nbytes(self):
+        return sys.getsizeof(self.bits)
+
+
+class _Categories:
+    def __init__(self):
+        self.values = [None]
+        self.numbers = {}
+        self.data = bytearray()
+
+    def accepts(self, value):
+        return value in self.numbers or len(self.values) <= MAX_CATEGORIES
+
+    def get(self, row):
+        return self.values[self.data[row]] if row < len(self.data) else None
+
+    def set(self, row, value):
+        number = 0
+        if value is not None:
+            number = self.numbers.get(value)
+            if number is None:
+                number = self.numbers[value] = len(self.values)
+                self.values.append(value)
+        if row >= len(self.data):
+            if not number:
+                return
+            self.data.extend(bytes(row + 1 - len(self.data)))
+        self.data[row] = number
+
+    def items(self):
+        return ((row, self.values[number]) for row, number in enumerate(self.data) if number)
+
+    def counts(self):
+        counts = {value: self.data.count(number) for number, value in enumerate(self.values) if number}
+        return {value: count for value, count in counts.items() if count}
+
+    def mask(self, values, rows):
+        numbers = {self.numbers[value] for value in values if value in self.numbers}
+        if not numbers:
+            return 0
+        return _digits_mask(self.data.translate(bytes(ONE if number in numbers else ZERO for number in range(256))))
+
+    def masks(self, rows):
+        return {value: self.mask((value,), rows) for value in self.counts()}
+
+    def nbytes(self):
+        return sys.getsizeof(self.data) + sys.getsizeof(self.values) + sys.getsizeof(self.numbers) + sum(
+            sys.getsizeof(value) for value in self.numbers)
+
+
+class _Texts:
+    def __init__(self):
+        self.values = {}
+
+    def accepts(self, value):
+        return True
+
+    def get(self, row):
+        return self.values.get(row)
+
+    def set(self, row, value):
+        if value is None:
+            self.values.pop(row, None)
+        else:
+            self.values[row] = value
+
+    def items(self):
+        return self.values.items()
+
+    def counts(self):
+        return collections.Counter(self.values.values())
+
+    def mask(self, values, rows):
+        values = set(values)
+        digits = bytearray(b'0') * rows
+        for row, value in self.values.items():
+            if value in values:
+                digits[row] = ONE
+        return _digits_mask(digits)
+
+    def nbytes(self):
+        return sys.getsizeof(self.values) + sum(sys.getsizeof(value) for value in self.values.values())
+
+
+def _new_column(code, value):
+    if parse_code(code)[1] == 'text':
+        return _Texts()
+    return _Flags() if value == FLAG_VALUE else _Categories()
+
+
+class VoteMatrix:
+    def __init__(self, survey_id, refresh_interval=5):
+        self.survey_id = survey_id
+        self.refresh_interval = refresh_interval
+        self.vote_ids = array.array('q')
+        self.datestamps = array.array('q')
+        self.columns = {}
+        # the data versions (``{shard: version}``) read up to: the versions of a shard are committed in order, so every
+        # older one has been read too
+        self.stored_versions = None
+        self.stats = collections.Counter()
+        # the vote ids in order, and their rows: votes are mostly, but not always, added in vote_id order
+        self._sorted_ids = array.array('q')
+        self._sorted_rows = array.array('q')
+        self._refreshed_at = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.vote_ids)
+
+    def _row(self, vote_id):
+        position = bisect.bisect_left(self._sorted_ids, vote_id)
+        if position < len(self._sorted_ids) and self._sorted_ids[position] == vote_id:
+            return self._sorted_rows[position]
+        return None
+
+    def _add_row(self, vote_id, datestamp):
+        row = len(self.vote_ids)
+        position = bisect.bisect_left(self._sorted_ids, vote_id)
+        self._sorted_ids.insert(position, vote_id)
+        self._sorted_rows.insert(position, row)
+        self.vote_ids.append(vote_id)
+        self.datestamps.append(datestamp)
+        return row
+
+    def _set(self, code, row, value):
+        column = self.columns.get(code)
+        if column is None:
+            column = self.columns[code] = _new_column(code, value)
+        elif not column.accepts(value):
+            # flags become categories, and categories with too many values become texts
+            converted = _Categories() if isinstance(column, _Flags) else _Texts()
+            for other_row, other_value in column.items():
+                converted.set(other_row, other_value)
+            column = self.columns[code] = converted
+        column.set(row, value)
+
+    def apply(self, vote_id, datestamp, answers):
+        """Add a vote, or replace its answers. Returns False when it is already up to date."""
+        datestamp = _microseconds(datestamp)
+        row = self._row(vote_id)
+        if row is None:
+            row = self._add_row(vote_id, datestamp)
+            self.stats['added'] += 1
+        elif self.datestamps[row] == datestamp:
+            return False
+        else:
+            self.datestamps[row] = datestamp
+            for code, column in self.columns.items():
+                if code not in answers:
+                    column.set(row, None)
+            self.stats['updated'] += 1
+        for code, value in answers.items():
+            self._set(code, row, value)
+        return True
+
+    def refresh(self, force=False):
+        """Read the votes added or changed since the last refresh. Returns how many were applied."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < self.refresh_interval:
+                return 0
+            # read first: the votes stored up to these versions are all committed already
+            versions = model.data_versions(self.survey_id)
+            query = model.db.session.query(
+                model.Vote.vote_id, model.Vote.datestamp, model.Answer.code, model.Answer.answer_value).outerjoin(
+                model.Answer, model.Answer.vote_id == model.Vote.vote_id).filter(model.Vote.survey_id == self.survey_id)
+            applied = 0
+            stored = None
+            if self.stored_versions is not None:
+                stored = model.stored_between(self.stored_versions, versions)
+            if self.stored_versions is None or stored is not None:
+                if stored is not None:
+                    query = query.filter(stored)
+                query = query.order_by(model.Vote.vote_id).execution_options(
+                    stream_results=True).yield_per(READ_BATCH_SIZE)
+                for (vote_id, datestamp), rows in itertools.groupby(query, key=operator.itemgetter(0, 1)):
+                    answers = {code: value for _, _, code, value in rows if code is not None}
+                    applied += self.apply(vote_id, datestamp, answers)
+            self.stored_versions = versions
+            self._refreshed_at = now
+            self.stats['refreshes'] += 1
+            return applied
+
+    def _selection(self, filters):
+        """The bitmask of the votes matching ``filters`` (``{code: values}``, see crosstab.parse_filters)."""
+        selected = (1 << len(self)) - 1
+        for code, values in filters.items():
+            column = self.columns.get(code)
+            selected &= column.mask(values, len(self)) if column is not None else 0
+        return selected
+
+    def _question_columns(self, question_number):
+        return [(code, column) for code, column in self.columns.items() if parse_code(code)[0] == question_number]
+
+    def counts(self):
+        """The number of votes for every answer: ``{(code, answer_value): votes}``, like the tallies."""
+        self.refresh()
+        with self._lock:
+            return {(code, value): count
+                    for code, column in self.columns.items() for value, count in column.counts().items()}
+
+    def count_matrix(self, row_question, column_question, filters):
+        """The same as crosstab.count_matrix, from memory."""
+        self.refresh()
+        with self._lock:
+            selected = self._selection(filters)
+            selected_bits = selected.to_bytes((len(self) + 7) // 8, 'little')
+            masks = {}
+            counts = collections.Counter()
+            for row_code, row_column in self._question_columns(row_question):
+                for column_code, column_column in self._question_columns(column_question):
+                    if isinstance(row_column, _Texts) or isinstance(column_column, _Texts):
+                        # texts are mostly different from each other: go through their rows, instead of making a mask
+                        # for every text
+                        texts_first = isinstance(row_column, _Texts)
+                        texts, other = (row_column, column_column) if texts_first else (column_column, row_column)
+                        for row, text in texts.items():
+                            other_value = other.get(row)
+                            if other_value is not None and selected_bits[row >> 3] >> (row & 7) & 1:
+                                counts[(row_code, text, column_code, other_value) if texts_first else
+                                       (row_code, other_value, column_code, text)] += 1
+                        continue
+                    for code, column in ((row_code, row_column), (column_code, column_column)):
+                        if code not in masks:
+                            masks[code] = column.masks(len(self))
+                    for row_value, row_mask in masks[row_code].items():
+                        row_mask &= selected
+                        if not row_mask:
+                            continue
+                        for column_value, column_mask in masks[column_code].items():
+                            count = (row_mask & column_mask).bit_count()
+                            if count:
+                                counts[row_code, row_value, column_code, column_value] = count
+            return dict(counts)
+
+    def vote_rows(self, codes, batch_size=1000):
+        """The same as export.vote_rows, from memory. The lock is only held while copying each batch of rows."""
+        self.refresh()
+        with self._lock:
+            order = array.array('q', self._sorted_rows)
+        for start in range(0, len(order), batch_size):
+            with self._lock:
+                columns = [(code, self.columns.get(code)) for code in codes]
+                batch = []
+                for row in order[start:start + batch_size]:
+                    datestamp = self.datestamps[row]
+                    batch.append(dict(
+                        vote_id=self.vote_ids[row],
+                        datestamp=None if datestamp == NO_DATESTAMP else (
+                            EPOCH + datetime.timedelta(microseconds=datestamp)).isoformat(),
+                        **{code: column.get(row) if column is not None else None for code, column in columns}))
+            yield from batch
+
+    def nbytes(self):
+        """Approximate memory use (buffers, dicts and strings; not the Python objects of the classes)."""
+        with self._lock:
+            return (sys.getsizeof(self.vote_ids) + sys.getsizeof(self.datestamps) + sys.getsizeof(self._sorted_ids) +
+                    sys.getsizeof(self._sorted_rows) + sum(column.nbytes() for column in self.columns.values()))
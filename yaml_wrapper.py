@@ -1,4 +1,5 @@
 import collections
+import re
 
 import ruamel.yaml
 
@@ -48,3 +49,42 @@ def _yaml():
 
 
 yaml = _yaml()
+
+
+DOCUMENT_START = re.compile(r'^---[ \t]*$\n?', re.MULTILINE)
+# directives, document end markers and anything after a document start marker are left to the round-trip loader
+UNSUPPORTED = re.compile(r'^(%|\.\.\.|---[ \t]*\S)', re.MULTILINE)
+
+
+def as_single_document(text):
+    """Turn a stream of documents into a single document with the list of them.
+
+    Anchors are valid until the end of their document, so in the single document they carry over from one of the
+    original documents to the next, the way CarryOverComposer makes them.
+    """
+    items = []
+    for document in DOCUMENT_START.split(text.replace('\r\n', '\n')):
+        if not document.strip():
+            continue
+        first_line, *lines = document.split('\n')
+        items.append('- ' + first_line + ''.join('\n  ' + line if line else '\n' for line in lines))
+    return '\n'.join(items) + '\n'
+
+
+def load_all(text):
+    """All the non-empty documents in ``text``, with anchors carried over between them (like ``yaml.load_all``).
+
+    This uses the safe loader, which is written in C when ruamel.yaml.clib is installed and is several times faster
+    than the round-trip one. Mappings keep their order, since dicts do. Whatever it cannot load goes through the
+    round-trip loader, which also reports the errors. Either way empty documents (e.g. after a trailing ``---``) are
+    left out.
+    """
+    documents = None
+    if not UNSUPPORTED.search(text):
+        try:
+            documents = ruamel.yaml.YAML(typ='safe', pure=False).load(as_single_document(text)) or []
+        except ruamel.yaml.YAMLError:
+            pass
+    if documents is None:
+        documents = yaml.load_all(text)
+    return [document for document in documents if document is not None]